@@ -0,0 +1,51 @@
+"""
+Evaluations-per-second benchmark for engine.evaluation.
+
+    python -m benchmarks.evaluation_benchmark --size 5 --positions 50 --time 1.0
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+
+from benchmarks.search_benchmark import sample_states
+from engine.evaluation import FEATURES, Evaluator
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5, help="board size (4, 5 or 6)")
+    parser.add_argument("--positions", type=int, default=50, help="number of seeded positions")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--time", type=float, default=1.0, help="seconds to keep evaluating")
+    parser.add_argument("--target-eps", type=float, default=0, help="fail if the rate is lower")
+    args = parser.parse_args(argv)
+
+    states = sample_states(args.positions, args.size, args.seed)
+    evaluator = Evaluator()
+
+    # Features of the first position, as a sanity check of what is being timed
+    first = states[0]
+    print("features of position 0 for", first.current_player.name)
+    for name, contribution in evaluator.explain(first.game.get_board(), first.current_player).items():
+        print(f"  {name:16s} {contribution:8.1f}")
+
+    evaluations = 0
+    started = time.perf_counter()
+    deadline = started + args.time
+    while time.perf_counter() < deadline:
+        for state in states:
+            evaluator.evaluate(state.game.get_board(), state.current_player)
+        evaluations += len(states)
+    elapsed = time.perf_counter() - started
+
+    eps = evaluations / elapsed if elapsed else 0.0
+    print(f"{evaluations} evaluations of {len(FEATURES)} features in {elapsed:.2f}s = {eps:.0f} evaluations/sec")
+    if args.target_eps and eps < args.target_eps:
+        print(f"below target of {args.target_eps:.0f} evaluations/sec")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Move-generation throughput per god card.
+
+For each god, seeded start-of-turn positions with that god on the side to
+move (against a player without one) are timed through generate_turns and
+through the engine's worker_move_cells, with the board's cached move
+cells invalidated before every call. The "none" row is the baseline the
+god's hooks are measured against:
+
+    python -m benchmarks.god_benchmark --size 5 --positions 30 --time 0.5
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List, Optional
+
+from engine import apply, create_game, create_state, is_terminal, legal_actions, worker_move_cells
+from engine.state import EngineState
+from engine.turns import SearchPosition, generate_turns
+from models.god_card import GOD_CARDS, create_god_card
+from utils.enums import TurnPhase
+
+
+def sample_god_states(god: Optional[str], count: int, board_size: int, seed: int) -> List[EngineState]:
+    """Seeded start-of-turn states reached by random play, with the god's player to move"""
+    rng = random.Random(seed)
+    states = []
+    while len(states) < count:
+        god_cards = [create_god_card(god) if god else None, None]
+        state = create_state(create_game(board_size=board_size, god_cards=god_cards, rng=rng), rng=rng)
+        for _ in range(2 * rng.randint(0, 20)):
+            if is_terminal(state):
+                break
+            apply(state, rng.choice(legal_actions(state)))
+        while not is_terminal(state) and (state.turn_phase != TurnPhase.WORKER_SELECTION
+                                          or state.game_manager.current_player_index != 0):
+            apply(state, rng.choice(legal_actions(state)))
+        if not is_terminal(state):
+            states.append(state)
+    return states
+
+
+def rate(run: Callable[[], int], seconds: float) -> float:
+    """Calls per second of run, which returns how many calls it made"""
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        calls += run()
+    elapsed = time.perf_counter() - started
+    return calls / elapsed if elapsed else 0.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5, help="board size (4, 5 or 6)")
+    parser.add_argument("--positions", type=int, default=30, help="number of seeded positions per god")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--time", type=float, default=0.5, help="seconds per measurement")
+    args = parser.parse_args(argv)
+
+    print(f"{'god':12s} {'turns':>7s} {'generate_turns/sec':>19s} {'worker_move_cells/sec':>22s}")
+    baseline = None
+    for god in (None, *GOD_CARDS):
+        states = sample_god_states(god, args.positions, args.size, args.seed)
+        positions = [SearchPosition.from_state(state) for state in states]
+        workers = [(state, worker) for state in states for worker in state.current_player.get_workers()]
+        turns = sum(len(generate_turns(position)) for position in positions) / len(positions)
+
+        def generate() -> int:
+            for position in positions:
+                generate_turns(position)
+            return len(positions)
+
+        def move_cells() -> int:
+            for state, worker in workers:
+                # A new board generation drops the cached cells, so every call generates them afresh
+                state.game.get_board().generation += 1
+                worker_move_cells(state, worker)
+            return len(workers)
+
+        rates = (rate(generate, args.time), rate(move_cells, args.time))
+        if baseline is None:
+            baseline = rates
+        print(f"{god or 'none':12s} {turns:7.1f} {rates[0]:12.0f} ({rates[0] / baseline[0]:4.2f}x) "
+              f"{rates[1]:14.0f} ({rates[1] / baseline[1]:4.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Memory held per game object and per position kept alive by search.
+
+Bytes are measured with tracemalloc as what stays allocated after building
+many objects and keeping them referenced: whole Games, engine states, the
+undo history an engine state keeps for every action played, and MCTS tree
+nodes after a search:
+
+    python -m benchmarks.memory_benchmark --size 5 --games 200 --iterations 2000
+"""
+from __future__ import annotations
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from typing import Callable, Tuple
+
+from engine import apply, create_game, create_state, is_terminal, legal_actions
+from engine.mcts import MCTSPlayer, Node
+from engine.turns import SearchPosition
+
+
+def retained_bytes(build: Callable[[], object]) -> Tuple[int, object]:
+    """Bytes still allocated by build once it returns, with its result kept alive"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, kept
+    finally:
+        tracemalloc.stop()
+
+
+def count_nodes(root: Node) -> int:
+    """Nodes in the tree below (and including) root"""
+    count, stack = 0, [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5, help="board size (4, 5 or 6)")
+    parser.add_argument("--games", type=int, default=200, help="number of games to keep alive")
+    parser.add_argument("--iterations", type=int, default=2000, help="MCTS iterations for the tree measurement")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    # Warm up per-size caches (Zobrist tables, adjacency) so they are not charged to the first object
+    create_state(create_game(board_size=args.size, rng=random.Random(args.seed)))
+
+    rng = random.Random(args.seed)
+    size, games = retained_bytes(lambda: [create_game(board_size=args.size, rng=rng) for _ in range(args.games)])
+    print(f"{'Game':24s} {size / args.games:10.0f} bytes each")
+
+    rng = random.Random(args.seed)
+    size, states = retained_bytes(lambda: [create_state(create_game(board_size=args.size, rng=rng), rng=rng)
+                                           for _ in range(args.games)])
+    print(f"{'EngineState':24s} {size / args.games:10.0f} bytes each")
+
+    def play() -> int:
+        actions = 0
+        for state in states:
+            while not is_terminal(state):
+                apply(state, rng.choice(legal_actions(state)))
+                actions += 1
+        return actions
+
+    size, actions = retained_bytes(play)
+    print(f"{'undo history':24s} {size / max(actions, 1):10.0f} bytes per action ({actions} actions)")
+    del games, states
+
+    rng = random.Random(args.seed)
+    position = SearchPosition.from_state(create_state(create_game(board_size=args.size, rng=rng), rng=rng))
+    player = MCTSPlayer(rng=random.Random(args.seed))
+    size, _ = retained_bytes(lambda: player.search(position, iterations=args.iterations))
+    nodes = count_nodes(player.root)
+    print(f"{'MCTS tree':24s} {size / nodes:10.0f} bytes per node ({nodes} nodes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
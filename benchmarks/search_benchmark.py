@@ -0,0 +1,66 @@
+"""
+Nodes-per-second benchmark for the alpha-beta computer player.
+
+    python -m benchmarks.search_benchmark --size 5 --positions 10 --time 1.0 --target-nps 15000
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+
+from engine import apply, create_game, create_state, is_terminal, legal_actions
+from engine.ai import AlphaBetaPlayer
+from engine.turns import SearchPosition
+from utils.enums import TurnPhase
+
+
+def sample_states(count: int, board_size: int, seed: int):
+    """Seeded start-of-turn engine states reached by random play"""
+    rng = random.Random(seed)
+    states = []
+    while len(states) < count:
+        state = create_state(create_game(board_size=board_size, rng=rng))
+        for _ in range(rng.randint(0, 40)):
+            if is_terminal(state):
+                break
+            apply(state, rng.choice(legal_actions(state)))
+        while not is_terminal(state) and state.turn_phase != TurnPhase.WORKER_SELECTION:
+            apply(state, rng.choice(legal_actions(state)))
+        if not is_terminal(state):
+            states.append(state)
+    return states
+
+
+def sample_positions(count: int, board_size: int, seed: int):
+    """Seeded start-of-turn positions reached by random play"""
+    return [SearchPosition.from_state(state) for state in sample_states(count, board_size, seed)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5, help="board size (4, 5 or 6)")
+    parser.add_argument("--positions", type=int, default=10, help="number of seeded positions")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--time", type=float, default=1.0, help="seconds per search")
+    parser.add_argument("--target-nps", type=float, default=0, help="fail if the overall rate is lower")
+    args = parser.parse_args(argv)
+
+    player = AlphaBetaPlayer(max_depth=64)
+    total_nodes, total_time = 0, 0.0
+    for index, position in enumerate(sample_positions(args.positions, args.size, args.seed)):
+        result = player.search(position, time_limit=args.time)
+        total_nodes += result.nodes
+        total_time += result.elapsed
+        print(f"position {index:3d}: depth {result.depth:2d}  nodes {result.nodes:8d}  "
+              f"{result.nodes_per_second:10.0f} nps  score {result.score}")
+
+    nps = total_nodes / total_time if total_time else 0.0
+    print(f"total: {total_nodes} nodes in {total_time:.2f}s = {nps:.0f} nodes/sec")
+    if args.target_nps and nps < args.target_nps:
+        print(f"below target of {args.target_nps:.0f} nodes/sec")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Load test for the match server with scripted clients on localhost.
+
+Starts a GameServer on a free port and connects the given number of
+headless clients, which join in pairs per board size and play random legal
+actions from the turn fields they are sent until their match ends. Then a
+short-clock match checks flag fall and a few malformed joins check that the
+server answers with errors and keeps running:
+
+    python -m benchmarks.server_benchmark --clients 2000 --seed 1
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+
+from network import protocol
+from network.server import BOARD_SIZES, GameServer
+from utils.enums import TurnPhase
+
+REPLY_TIMEOUT = 10.0
+
+
+async def random_client(port: int, name: str, board_size: int, rng: random.Random, stats: Counter) -> None:
+    """Join, then answer every turn on our seat with a random legal action until the game ends"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=protocol.MAX_LINE_BYTES)
+    writer.write(protocol.encode({"type": protocol.JOIN, "name": name, "board_size": board_size}))
+    seat = None
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                stats["disconnected"] += 1
+                return
+            message = protocol.decode(line)
+            kind = message["type"]
+            if kind == protocol.ERROR:
+                stats["errors"] += 1
+            elif kind == protocol.GAME_OVER:
+                stats[message["reason"]] += 1
+                return
+            if kind == protocol.MATCH_START:
+                seat = message["seat"]
+            if kind in (protocol.MATCH_START, protocol.UPDATE) and message["current"] == seat:
+                writer.write(protocol.encode(_random_action(message, rng)))
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def _random_action(fields: dict, rng: random.Random) -> dict:
+    """A random action out of the turn fields the server sent"""
+    phase = fields["phase"]
+    if phase == TurnPhase.WORKER_SELECTION.value and fields["workers"]:
+        return {"type": protocol.ACTION, "action": "select_worker", "worker_id": rng.choice(fields["workers"])}
+    if phase == TurnPhase.MOVE_SELECTION.value and fields["targets"]:
+        row, col = rng.choice(fields["targets"])
+        return {"type": protocol.ACTION, "action": "move", "row": row, "col": col}
+    if phase == TurnPhase.BUILD_SELECTION.value and fields["targets"]:
+        row, col = rng.choice(fields["targets"])
+        return {"type": protocol.ACTION, "action": "build", "row": row, "col": col}
+    return {"type": protocol.ACTION, "action": "end_turn"}
+
+
+async def check_timeout(server: GameServer) -> bool:
+    """A match where nobody moves ends by timeout once the clock runs out"""
+    server.time_secs = 0.2
+    connections = [await asyncio.open_connection("127.0.0.1", server.port) for _ in range(2)]
+    for _, writer in connections:
+        writer.write(protocol.encode({"type": protocol.JOIN, "board_size": 5}))
+    reader = connections[0][0]
+    reason = None
+    while reason is None:
+        message = protocol.decode(await asyncio.wait_for(reader.readline(), REPLY_TIMEOUT))
+        if message["type"] == protocol.GAME_OVER:
+            reason = message["reason"]
+    for _, writer in connections:
+        writer.close()
+        await writer.wait_closed()
+    return reason == "timeout"
+
+
+async def check_bad_joins(server: GameServer) -> bool:
+    """Joins with unusable board sizes are refused with an error, not a crash"""
+    ok = True
+    for board_size in (5.0, True, "5", 7, None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(protocol.encode({"type": protocol.JOIN, "board_size": board_size}))
+        message = protocol.decode(await asyncio.wait_for(reader.readline(), REPLY_TIMEOUT))
+        ok = ok and message["type"] == protocol.ERROR
+        writer.close()
+        await writer.wait_closed()
+    return ok and all(waiting is None for waiting in server.waiting.values())
+
+
+async def run(clients: int, seed: int) -> int:
+    server = GameServer(port=0, rng=random.Random(seed))
+    await server.start()
+    stats: Counter = Counter()
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        random_client(server.port, f"client {index}", BOARD_SIZES[index // 2 % len(BOARD_SIZES)],
+                      random.Random(seed * 100003 + index), stats)
+        for index in range(clients)
+    ))
+    elapsed = time.perf_counter() - started
+    finished = stats["win"] + stats["timeout"] + stats["resign"]
+    print(f"{clients} clients in {elapsed:.2f}s: {dict(stats)}, {len(server.matches)} matches still open")
+
+    timeout_ok = await check_timeout(server)
+    print(f"timeout match: {'ok' if timeout_ok else 'FAILED'}")
+    joins_ok = await check_bad_joins(server)
+    print(f"malformed joins: {'ok' if joins_ok else 'FAILED'}")
+    await asyncio.sleep(0.1)  # Let the server see the last clients hang up before it closes
+    await server.close()
+
+    passed = finished == clients and not stats["errors"] and not server.matches and timeout_ok and joins_ok
+    return 0 if passed else 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200, help="number of scripted clients (even)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    if args.clients % 2:
+        parser.error("--clients must be even so every client gets an opponent")
+    return asyncio.run(run(args.clients, args.seed))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
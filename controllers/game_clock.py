@@ -0,0 +1,88 @@
+from __future__ import annotations
+import math
+import time
+from typing import Callable, List, Optional, TYPE_CHECKING
+
+from utils.enums import ClockMode
+
+if TYPE_CHECKING:
+    from models.player import Player
+
+class GameClock:
+    """
+    Chess-style clock for the players' remaining_time_secs.
+
+    Time is measured with a monotonic clock from the moment a turn starts, so a
+    stalled UI never hands out free seconds. Player.remaining_time_secs holds the
+    time banked before the current turn; anything that adds to it mid-turn (like
+    the hidden-cell bonus from GameManager) simply shows up in remaining().
+
+    Fischer mode adds the increment after every completed turn. Bronstein mode
+    gives back the time used in the turn, up to the increment.
+    """
+
+    def __init__(self, players: List[Player], mode: ClockMode = ClockMode.SUDDEN_DEATH,
+                 increment_secs: float = 0, clock: Callable[[], float] = time.monotonic):
+        self.players = players
+        self.mode = mode
+        self.increment_secs = increment_secs
+        self.clock = clock
+
+        self.running_player: Optional[Player] = None
+        self.turn_started_at: float = 0.0
+
+    def start_turn(self, player: Player) -> None:
+        """Start the given player's clock, stopping whoever was running"""
+        self.stop()
+        self.running_player = player
+        self.turn_started_at = self.clock()
+
+    def end_turn(self) -> float:
+        """Stop the running clock after a completed turn, apply any increment and return the seconds used"""
+        player = self.running_player
+        elapsed = self.stop()
+        if player is not None and self.mode != ClockMode.SUDDEN_DEATH:
+            if self.mode == ClockMode.FISCHER:
+                player.remaining_time_secs += self.increment_secs
+            elif self.mode == ClockMode.BRONSTEIN:
+                player.remaining_time_secs += min(elapsed, self.increment_secs)
+        return elapsed
+
+    def stop(self) -> float:
+        """Stop the running clock without any increment, banking the time used; returns it"""
+        if self.running_player is None:
+            return 0.0
+        elapsed = self.elapsed()
+        self.running_player.remaining_time_secs -= elapsed
+        self.running_player = None
+        return elapsed
+
+    def elapsed(self) -> float:
+        """Seconds used so far in the current turn"""
+        if self.running_player is None:
+            return 0.0
+        return self.clock() - self.turn_started_at
+
+    def remaining(self, player: Player) -> float:
+        """Seconds the player has left right now"""
+        remaining = player.remaining_time_secs
+        if player is self.running_player:
+            remaining -= self.elapsed()
+        return remaining
+
+    def is_expired(self, player: Player) -> bool:
+        return self.remaining(player) <= 0
+
+    def display_secs(self, player: Player) -> int:
+        """Whole seconds to show; a clock reads 00:01 until it has fully run out"""
+        return max(0, math.ceil(self.remaining(player)))
+
+    def secs_until_display_change(self) -> Optional[float]:
+        """Seconds until the running player's displayed time next changes, or None if no clock runs"""
+        if self.running_player is None:
+            return None
+        remaining = self.remaining(self.running_player)
+        if remaining <= 0:
+            return 0.0
+        fraction = remaining - math.floor(remaining)
+        return fraction if fraction > 0 else 1.0
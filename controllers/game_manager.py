@@ -1,15 +1,18 @@
 from __future__ import annotations
-from typing import Optional, List, TYPE_CHECKING
+from typing import Callable, Dict, Optional, List, TYPE_CHECKING
 
-from models.god_card import Artemis
-from utils.enums import GameStatus
+from models.god_card import NO_HOOKS
+from utils.constants import HIDDEN_CELL_TIME_BONUS
+from utils.enums import ActionType, EventType, GameStatus
 
 if TYPE_CHECKING:
+    from engine.records import GameRecorder
     from logic.actions.action import Action
     from models.game import Game
     from models.player import Player
     from models.worker import Worker
     from models.cell import Cell
+    from models.god_card import GodHooks
 
 class GameManager:
     """Manages the game flow and turn sequence"""
@@ -20,10 +23,37 @@ class GameManager:
         self.game_status = GameStatus.ONGOING
         self.hidden_cells_revealed: int = 0  # Track how many hidden cells have been revealed
         self.max_hidden_reveals: int = 2  # Maximum reveals per game
+        self.recorder: Optional[GameRecorder] = None  # Receives every executed move and build
+        self.god_hooks: Dict[Player, GodHooks] = {}
+        self.resolve_god_hooks()
+    
+    def resolve_god_hooks(self):
+        """
+        Look up each player's god-card hooks once, for every action of the game
+        to use. Opponents' move restrictions (Athena) are folded into each
+        player's move_filter, so the rules only ever call one filter.
+        """
+        players = self.game.get_players()
+        own_hooks = {player: player.get_god_card().hooks() if player.get_god_card() else NO_HOOKS
+                     for player in players}
+        self.god_hooks = {}
+        for player in players:
+            hooks = own_hooks[player]
+            filters = [hooks.move_filter] if hooks.move_filter else []
+            filters.extend(own_hooks[opponent].opponent_move_filter for opponent in players
+                           if opponent is not player and own_hooks[opponent].opponent_move_filter)
+            if len(filters) > 1:
+                hooks = hooks._replace(move_filter=_all_of(filters))
+            elif filters:
+                hooks = hooks._replace(move_filter=filters[0])
+            if hooks != NO_HOOKS:
+                self.god_hooks[player] = hooks
     
     def start_game(self):
         """Start the game"""
+        self.resolve_god_hooks()
         self.current_player_index = 0
+        self.game.get_board().set_side_to_move(0)
         self.game_status = GameStatus.ONGOING
         self.game.set_status(GameStatus.ONGOING)
     
@@ -35,6 +65,8 @@ class GameManager:
         else:
             self.game_status = GameStatus.PLAYER_LOST
         self.game.set_status(self.game_status)
+        if self.recorder is not None:
+            self.recorder.finish(winner)
     
     def get_current_player(self) -> Player:
         """Get the current player"""
@@ -43,6 +75,7 @@ class GameManager:
     def switch_turn(self):
         """Switch to the next player"""
         self.current_player_index = (self.current_player_index + 1) % len(self.game.get_players())
+        self.game.get_board().set_side_to_move(self.current_player_index)
     
     def start_turn(self):
         """Start a player's turn"""
@@ -57,81 +90,132 @@ class GameManager:
         
         return True
     
-    def execute_turn(self, action: Action) -> bool | str:
+    def execute_turn(self, action: Action) -> bool | EventType:
         """
         Executes a player action (move/build). Returns:
         - True if successful
         - False if invalid
-        - A string (e.g., 'SECOND_MOVE', 'SECOND_BUILD') if god power activates
+        - EventType.HIDDEN_CELL_REVEALED if a move revealed a hidden cell
+          (its message is action.revealed_cell.hidden_message)
+        - The god card's continuation event (e.g. SECOND_MOVE, SECOND_BUILD) if its power activates
         """
         if not self.validate_turn(action):
             return False
         
+        action.status_snapshot = self.snapshot()
         success = action.execute()
         if not success:
             return False
+        if self.recorder is not None:
+            self.recorder.record(action)
+        
+        is_move = action.kind == ActionType.MOVE
         
         # Check for hidden cell reveal on move actions
-        from logic.actions.move_action import MoveAction
-        if isinstance(action, MoveAction):
+        if is_move:
             hidden_message = self._check_hidden_cell_reveal(action.target_cell, action.player)
             if hidden_message:
-                return f"HIDDEN_CELL_REVEALED:{hidden_message}"
+                action.revealed_cell = action.target_cell
+                action.time_bonus = HIDDEN_CELL_TIME_BONUS
         
         # Check win condition after move
         if self.check_win_condition(action):
             self.end_game(winner=action.player)
             return True
         
-        # Check for god power activation
-        god_card = action.player.get_god_card()
-        if god_card:
-            power_result = god_card.apply_god_power(action.player, self.game, action)
-            if power_result:
-                return power_result
+        # Check for god power activation; the card sees every move, even one that reveals
+        power_result = None
+        hooks = self.god_hooks.get(action.player)
+        if hooks:
+            hook = hooks.after_move if is_move else hooks.after_build
+            if hook:
+                power_result = hook(action, self.game.get_board())
+                self.update_pending_key()
+        
+        # A reveal ends the move phase, whatever the god card offers
+        if action.revealed_cell is not None:
+            return EventType.HIDDEN_CELL_REVEALED
+        if power_result:
+            return power_result
+        
+        return True
+    
+    def undo_turn(self, action: Action) -> bool:
+        """
+        Reverses an action executed through execute_turn: the board, the
+        player's clock bonus, god-card flags, reveal count and game status.
+        """
+        if not action.executed:
+            return False
         
+        action.undo()
+        self.update_pending_key()
+        if self.recorder is not None:
+            self.recorder.retract(action)
+        if action.status_snapshot is not None:
+            self.restore(action.status_snapshot)
         return True
     
+    def snapshot(self) -> tuple:
+        """Capture turn order, game status and reveal count"""
+        return (self.current_player_index, self.game_status, self.game.get_status(),
+                self.game.get_winner(), self.hidden_cells_revealed)
+    
+    def restore(self, snapshot: tuple) -> None:
+        """Restore state captured with snapshot"""
+        (self.current_player_index, self.game_status, status,
+         self.game.winning_player, self.hidden_cells_revealed) = snapshot
+        self.game.set_status(status)
+        self.game.get_board().set_side_to_move(self.current_player_index)
+    
+    def save_status(self, record) -> None:
+        """Like snapshot, but into the fields of a reusable undo record (engine.state.UndoRecord)"""
+        record.player_index = self.current_player_index
+        record.game_status = self.game_status
+        record.status = self.game.get_status()
+        record.game_winner = self.game.get_winner()
+        record.hidden_cells_revealed = self.hidden_cells_revealed
+    
+    def restore_status(self, record) -> None:
+        """Restore state captured with save_status"""
+        self.current_player_index = record.player_index
+        self.game_status = record.game_status
+        self.game.winning_player = record.game_winner
+        self.hidden_cells_revealed = record.hidden_cells_revealed
+        self.game.set_status(record.status)
+        self.game.get_board().set_side_to_move(self.current_player_index)
+    
     def validate_turn(self, action: Action) -> bool:
         """Validate if the action is legal"""
-        god_card = action.player.get_god_card()
-        
-        if god_card:
-            # Artemis move restriction
-            if god_card.__class__.__name__ == "Artemis":
-                from logic.actions.move_action import MoveAction
-                if isinstance(action, MoveAction):
-                    if not god_card.can_move_to_cell(action.target_cell):
-                        return False
-            
-            # Demeter build restriction  
-            elif god_card.__class__.__name__ == "Demeter":
-                from logic.actions.build_action import BuildAction
-                if isinstance(action, BuildAction):
-                    if not god_card.can_build_on_cell(action.target_cell):
-                        return False
+        hooks = self.god_hooks.get(action.player)
+        
+        if hooks:
+            # God-card restrictions on top of the normal rules
+            if action.kind == ActionType.MOVE:
+                if hooks.move_filter and not hooks.move_filter(action.worker, action.worker.get_position(), action.target_cell):
+                    return False
+            elif hooks.build_filter and not hooks.build_filter(action.worker, action.target_cell):
+                return False
         
         return action.is_valid()
     
     def check_win_condition(self, action: Action) -> bool:
         """
-        Win condition: a worker moved from level 2 to level 3.
+        Win condition: a worker moved from level 2 to level 3,
+        or whatever else the player's god card wins by (Pan).
         """
-        from logic.actions.move_action import MoveAction
-        
         # Only check win condition for move actions
-        if not isinstance(action, MoveAction):
+        if action.kind != ActionType.MOVE:
             return False
         
         worker: Worker = action.worker
         position = worker.get_position()
         
-        if position:
-            tower = position.get_tower()
-            if tower and tower.get_tower_level() == 3:
-                return True
+        if position and position.level == 3:
+            return True
         
-        return False
+        hooks = self.god_hooks.get(action.player)
+        return bool(hooks and hooks.wins_by_move and hooks.wins_by_move(action))
     
     def end_turn(self):
         """End the current player's turn"""
@@ -140,9 +224,20 @@ class GameManager:
         # Reset god power flags
         if current_player.get_god_card():
             current_player.get_god_card().reset()
+            self.update_pending_key()
         
         self.switch_turn()
 
+    def update_pending_key(self) -> None:
+        """Fold the god cards' pending state (within the turn, or Athena's into the next) into the position key"""
+        board = self.game.get_board()
+        pending_key = 0
+        for player in self.game.get_players():
+            god_card = player.get_god_card()
+            if god_card:
+                pending_key ^= god_card.pending_key(board.zobrist)
+        board.set_pending_key(pending_key)
+
     def _check_hidden_cell_reveal(self, cell: Cell, player: Player) -> Optional[str]:
         """
         Check if a cell is hidden and reveal it if so.
@@ -155,7 +250,17 @@ class GameManager:
         if hidden_message:
             self.hidden_cells_revealed += 1
             # Add 10 seconds to the player's timer
-            player.remaining_time_secs += 10
+            player.remaining_time_secs += HIDDEN_CELL_TIME_BONUS
             return hidden_message
         
         return None
+
+
+def _all_of(filters: List[Callable[..., bool]]) -> Callable[..., bool]:
+    """A move filter that allows only what every one of the filters allows"""
+    def move_filter(worker, from_cell, to_cell) -> bool:
+        for allows in filters:
+            if not allows(worker, from_cell, to_cell):
+                return False
+        return True
+    return move_filter
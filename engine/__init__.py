@@ -0,0 +1,28 @@
+"""
+Headless Santorini engine.
+
+The rules here reproduce GameBoardScreen's turn phases on top of GameManager,
+so games can be driven without a Tk root:
+
+    state = create_state(create_game())
+    while not is_terminal(state):
+        apply(state, random.choice(legal_actions(state)))
+"""
+from engine.rules import (
+    any_legal_move,
+    apply,
+    create_state,
+    declare_draw,
+    forfeit,
+    is_terminal,
+    iter_move_cells,
+    legal_actions,
+    legal_build_cells,
+    legal_dome_cells,
+    legal_move_cells,
+    undo,
+    validate,
+    worker_move_cells,
+)
+from engine.setup import create_game
+from engine.state import EngineAction, EngineEvent, EngineState, IllegalActionError
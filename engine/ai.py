@@ -0,0 +1,240 @@
+from __future__ import annotations
+import time
+from contextlib import closing
+from typing import List, NamedTuple, Optional, TYPE_CHECKING
+
+from engine.transposition import EXACT, LOWER_BOUND, NO_MOVE, UPPER_BOUND, TranspositionTable
+from engine.turns import SearchPosition, Turn, generate_turns, iter_turns, turn_to_actions
+from utils.constants import MAXIMUM_TOWER_LEVEL
+
+if TYPE_CHECKING:
+    from engine.state import EngineAction, EngineState
+
+WIN_SCORE = 1_000_000
+WIN_THRESHOLD = WIN_SCORE - 1000  # Scores beyond this are forced wins or losses
+INFINITY = 10 * WIN_SCORE
+
+
+class SearchResult(NamedTuple):
+    """Outcome of one search"""
+    turn: Optional[Turn]
+    score: int
+    depth: int  # Deepest fully searched iteration
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the deadline passes"""
+
+
+class AlphaBetaPlayer:
+    """
+    Computer opponent: negamax alpha-beta over complete turns with iterative deepening.
+    Each search gets the smaller of move_time and a fraction of the player's
+    remaining clock, and returns the best turn of the deepest finished iteration.
+    Results are cached in a transposition table that is kept between moves of one
+    game; call new_game before reusing the player for another game.
+    """
+
+    def __init__(self, max_depth: int = 6, move_time: float = 2.0, clock_fraction: float = 1 / 30,
+                 min_move_time: float = 0.05, table_size_mb: float = 16):
+        self.max_depth = max_depth
+        self.move_time = move_time
+        self.clock_fraction = clock_fraction
+        self.min_move_time = min_move_time
+        self.table: Optional[TranspositionTable] = TranspositionTable(table_size_mb) if table_size_mb else None
+
+        self.nodes = 0
+        self._deadline = 0.0
+        self._position: Optional[SearchPosition] = None
+
+    def new_game(self) -> None:
+        """Forget cached results from a previous game"""
+        if self.table:
+            self.table.clear()
+
+    def time_budget(self, remaining_time_secs: Optional[float]) -> float:
+        """Seconds to spend on one move given the player's remaining clock"""
+        budget = self.move_time
+        if remaining_time_secs is not None:
+            budget = min(budget, remaining_time_secs * self.clock_fraction)
+        return max(budget, self.min_move_time)
+
+    def choose_actions(self, state: EngineState) -> List[EngineAction]:
+        """Search the current turn and return the engine actions that play the best one"""
+        result = self.search(SearchPosition.from_state(state),
+                             self.time_budget(state.current_player.remaining_time_secs))
+        if result.turn is None:
+            return []
+        return turn_to_actions(state, result.turn)
+
+    def search(self, position: SearchPosition, time_limit: Optional[float] = None,
+               max_depth: Optional[int] = None) -> SearchResult:
+        """Iteratively deepen until max_depth or the time limit is reached"""
+        start = time.perf_counter()
+        self._deadline = start + time_limit if time_limit is not None else float("inf")
+        self._position = position.copy()
+        self.nodes = 0
+        if self.table:
+            self.table.new_search()
+
+        turns = generate_turns(self._position)
+        if not turns:
+            return SearchResult(None, -WIN_SCORE, 0, 0, time.perf_counter() - start)
+
+        best_turn, best_score, completed_depth = turns[0], -INFINITY, 0
+        for depth in range(1, (max_depth or self.max_depth) + 1):
+            try:
+                score, turn = self._search_root(turns, depth, best_turn)
+            except _SearchTimeout:
+                break
+            best_turn, best_score, completed_depth = turn, score, depth
+            if abs(score) >= WIN_THRESHOLD:
+                break  # Forced result found; deeper search cannot change it
+
+        return SearchResult(best_turn, best_score, completed_depth, self.nodes, time.perf_counter() - start)
+
+    def _search_root(self, turns: List[Turn], depth: int, previous_best: Turn):
+        """Search every root turn, trying last iteration's best first"""
+        ordered = self._order(turns)
+        ordered.remove(previous_best)
+        ordered.insert(0, previous_best)
+
+        position = self._position
+        alpha, best_turn = -INFINITY, ordered[0]
+        for turn in ordered:
+            if turn.wins:
+                return WIN_SCORE - 1, turn
+            origin = position.make(turn)
+            try:
+                score = -self._negamax(depth - 1, -INFINITY, -alpha, 1)
+            finally:
+                position.unmake(turn, origin)
+            if score > alpha:
+                alpha, best_turn = score, turn
+        return alpha, best_turn
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Score of the position for the side to move"""
+        self.nodes += 1
+        if self.nodes & 255 == 0 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+        position = self._position
+        if depth <= 0:
+            if self._can_win_now(position):
+                return WIN_SCORE - ply - 1
+            return evaluate(position)
+
+        table = self.table
+        table_move = NO_MOVE
+        if table:
+            entry = table.probe(position.key)
+            if entry:
+                table_move = entry.move
+                if entry.depth >= depth:
+                    score = _score_from_table(entry.score, ply)
+                    if (entry.flag == EXACT
+                            or (entry.flag == LOWER_BOUND and score >= beta)
+                            or (entry.flag == UPPER_BOUND and score <= alpha)):
+                        return score
+
+        # Generate lazily so a winning turn ends the node before the rest are built
+        turns = []
+        with closing(iter_turns(position)) as generated:
+            for turn in generated:
+                if turn.wins:
+                    return WIN_SCORE - ply - 1
+                turns.append(turn)
+        if not turns:
+            return -WIN_SCORE + ply  # No worker can move: the side to move loses
+
+        original_alpha = alpha
+        best_score, best_index = -INFINITY, NO_MOVE
+        for index in self._order_indices(turns, table_move):
+            turn = turns[index]
+            origin = position.make(turn)
+            try:
+                score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                position.unmake(turn, origin)
+            if score > best_score:
+                best_score, best_index = score, index
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if table:
+            if best_score >= beta:
+                flag = LOWER_BOUND
+            elif best_score <= original_alpha:
+                flag = UPPER_BOUND
+            else:
+                flag = EXACT
+            table.store(position.key, depth, _score_to_table(best_score, ply), flag, best_index)
+        return best_score
+
+    def _order(self, turns: List[Turn]) -> List[Turn]:
+        """Try turns that climb first"""
+        board = self._position.board
+        return sorted(turns, key=lambda turn: -board.height(turn.path[-1]))
+
+    def _order_indices(self, turns: List[Turn], table_move: int) -> List[int]:
+        """Indices of turns in search order: the table's best turn, then climbing turns"""
+        board = self._position.board
+        order = sorted(range(len(turns)), key=lambda index: -board.height(turns[index].path[-1]))
+        if table_move < len(turns):
+            order.remove(table_move)
+            order.insert(0, table_move)
+        return order
+
+    @staticmethod
+    def _can_win_now(position: SearchPosition) -> bool:
+        """Cheap check for a worker on level 2 next to a free level 3"""
+        if position.climb_blocked():
+            return False
+        board = position.board
+        top = board.levels[MAXIMUM_TOWER_LEVEL - 1]
+        for square in board.worker_squares[position.side]:
+            if board.height(square) == MAXIMUM_TOWER_LEVEL - 1 and board.move_targets(square) & top:
+                return True
+        return False
+
+
+def _score_to_table(score: int, ply: int) -> int:
+    """Store win/loss scores relative to the node rather than the root"""
+    if score > WIN_THRESHOLD:
+        return score + ply
+    if score < -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score: int, ply: int) -> int:
+    if score > WIN_THRESHOLD:
+        return score - ply
+    if score < -WIN_THRESHOLD:
+        return score + ply
+    return score
+
+
+def evaluate(position: SearchPosition) -> int:
+    """Static score for the side to move: worker heights plus room to climb"""
+    board = position.board
+    score = 0
+    for player, squares in enumerate(board.worker_squares):
+        player_score = 0
+        for square in squares:
+            height = board.height(square)
+            targets = board.move_targets(square)
+            player_score += 100 * height + 5 * targets.bit_count()
+            if height < MAXIMUM_TOWER_LEVEL:
+                player_score += 20 * (targets & board.height_mask(height + 1)).bit_count()
+        score += player_score if player == position.side else -player_score
+    return score
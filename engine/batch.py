@@ -0,0 +1,152 @@
+"""
+Vectorised evaluation of many positions at once with NumPy.
+
+Positions are packed into flat arrays (one row per board, one column per
+cell, index = row * cols + col) and every query runs over the whole batch:
+
+    batch = BoardBatch.from_boards(boards)
+    moves = batch.move_masks()      # (boards, players, workers, cells)
+    wins = batch.win_in_one()       # (boards, players)
+
+NumPy is only needed for this module; the rest of the engine does not use it.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Sequence, TYPE_CHECKING
+
+from engine.bitboard import BitBoard
+from utils.constants import MAXIMUM_TOWER_LEVEL
+from utils.grid import neighbour_indices
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, checked when a batch is built
+    np = None
+
+if TYPE_CHECKING:
+    from models.board import Board
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Batch evaluation needs NumPy; install it with 'pip install numpy'")
+
+
+@lru_cache(maxsize=None)
+def adjacency_matrix(rows: int, cols: int):
+    """Boolean (cells, cells) matrix, True where two cells are neighbours"""
+    _require_numpy()
+    size = rows * cols
+    matrix = np.zeros((size, size), dtype=bool)
+    for square, neighbours in enumerate(neighbour_indices(rows, cols)):
+        matrix[square, list(neighbours)] = True
+    matrix.setflags(write=False)
+    return matrix
+
+
+class BoardBatch:
+    """
+    Many same-sized positions packed into NumPy arrays.
+
+    heights:        (N, S) int8, tower level of every cell (domes not counted)
+    domes:          (N, S) bool
+    workers:        (N, P, S) bool, one occupancy plane per player
+    worker_squares: (N, P, W) int64, cell of each worker in Player.workers order
+    side_to_move:   (N,) int64, player slot on turn
+    """
+
+    def __init__(self, rows: int, cols: int, heights, domes, workers, worker_squares, side_to_move):
+        _require_numpy()
+        self.rows = rows
+        self.cols = cols
+        self.heights = heights
+        self.domes = domes
+        self.workers = workers
+        self.worker_squares = worker_squares
+        self.side_to_move = side_to_move
+        self.adjacency = adjacency_matrix(rows, cols)
+
+    @classmethod
+    def from_boards(cls, boards: Sequence[Board]) -> BoardBatch:
+        """Pack Boards whose players have been registered (as Game does)"""
+        bitboards = []
+        sides = []
+        for board in boards:
+            players = sorted(board.player_slots, key=board.player_slot)
+            bitboards.append(BitBoard.from_board(board, players))
+            sides.append(board.side_to_move)
+        return cls.from_bitboards(bitboards, sides)
+
+    @classmethod
+    def from_bitboards(cls, bitboards: Sequence[BitBoard], side_to_move: Sequence[int] = ()) -> BoardBatch:
+        """Pack bitboards; side_to_move defaults to the first player for every board"""
+        _require_numpy()
+        if not bitboards:
+            raise ValueError("Cannot build an empty batch")
+        rows, cols = bitboards[0].rows, bitboards[0].cols
+        if any(bitboard.rows != rows or bitboard.cols != cols for bitboard in bitboards):
+            raise ValueError("All boards in a batch must have the same size")
+
+        bits = np.arange(rows * cols, dtype=np.int64)
+
+        def unpack(masks):
+            # Python int masks -> (..., S) bool planes
+            masks = np.asarray(masks, dtype=np.int64)
+            return (masks[..., None] >> bits) & 1 == 1
+
+        levels = unpack([bitboard.levels for bitboard in bitboards])  # (N, 3, S)
+        heights = levels.sum(axis=1, dtype=np.int8)
+        domes = unpack([bitboard.domes for bitboard in bitboards])
+        workers = unpack([bitboard.workers for bitboard in bitboards])
+        worker_squares = np.asarray([bitboard.worker_squares for bitboard in bitboards], dtype=np.int64)
+        if len(side_to_move):
+            sides = np.asarray(side_to_move, dtype=np.int64)
+        else:
+            sides = np.zeros(len(bitboards), dtype=np.int64)
+        return cls(rows, cols, heights, domes, workers, worker_squares, sides)
+
+    def __len__(self) -> int:
+        return self.heights.shape[0]
+
+    @property
+    def occupied(self):
+        """(N, S) cells holding any worker"""
+        return self.workers.any(axis=1)
+
+    def worker_heights(self):
+        """(N, P, W) tower level under each worker"""
+        squares = self.worker_squares.reshape(len(self), -1)
+        return np.take_along_axis(self.heights, squares, axis=1).reshape(self.worker_squares.shape)
+
+    def _adjacent_free(self):
+        """(N, P, W, S) free, dome-less neighbours of each worker"""
+        adjacent = self.adjacency[self.worker_squares]
+        free = ~(self.occupied | self.domes)
+        return adjacent & free[:, None, None, :]
+
+    def move_masks(self):
+        """(N, P, W, S) cells each worker may move to, as Board.get_available_move_cells"""
+        reachable = self.heights[:, None, None, :] <= self.worker_heights()[..., None] + 1
+        return self._adjacent_free() & reachable
+
+    def build_masks(self):
+        """(N, P, W, S) cells each worker may build on from where it stands, as Board.get_available_build_cells"""
+        return self._adjacent_free()
+
+    def has_valid_moves(self):
+        """(N, P) whether each player has any legal move"""
+        return self.move_masks().any(axis=(2, 3))
+
+    def win_in_one(self):
+        """
+        (N, P) whether each player has a worker on level 2 next to a free level 3,
+        i.e. a move that GameManager.check_win_condition would accept
+        """
+        top = MAXIMUM_TOWER_LEVEL
+        climbers = self.worker_heights() == top - 1
+        targets = self._adjacent_free() & (self.heights == top)[:, None, None, :]
+        return (targets.any(axis=3) & climbers).any(axis=2)
+
+    def side_to_move_wins(self):
+        """(N,) win_in_one for the player on turn"""
+        return self.win_in_one()[np.arange(len(self)), self.side_to_move]
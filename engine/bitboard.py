@@ -0,0 +1,229 @@
+from __future__ import annotations
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+from models.board import Board
+from models.coordinate import Coordinate
+from models.tower import Tower
+from utils.constants import MAXIMUM_TOWER_LEVEL
+from utils.grid import full_mask, iter_bits, neighbour_masks, perimeter_mask, push_squares, to_index, to_row_col
+
+if TYPE_CHECKING:
+    from models.player import Player
+
+
+class BitBoard:
+    """
+    Compact bit-parallel representation of a Board.
+
+    Bit i of every mask stands for the cell at flat index i = row * cols + col.
+    levels[k] holds the cells whose tower is at least k + 1 levels high, so the
+    height of a cell is the number of level masks it appears in.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        self.rows: int = rows
+        self.cols: int = cols
+        self.levels: List[int] = [0] * MAXIMUM_TOWER_LEVEL
+        self.domes: int = 0
+        self.workers: List[int] = []  # One occupancy mask per player
+        self.worker_squares: List[List[int]] = []  # Per player, in Player.workers order
+        self.hidden: int = 0  # Hidden cells, revealed or not
+        self.revealed: int = 0  # Hidden cells that have already been revealed
+
+        self.neighbours = neighbour_masks(rows, cols)
+        self.pushes = push_squares(rows, cols)  # Per square: adjacent square -> the one beyond it
+        self.perimeter: int = perimeter_mask(rows, cols)
+        self.all_cells: int = full_mask(rows, cols)
+
+    @classmethod
+    def from_board(cls, board: Board, players: Sequence[Player]) -> BitBoard:
+        """Build a bitboard from the Cell/Tower/Worker graph of a board"""
+        bitboard = cls(board.rows, board.cols)
+
+        for coordinate, cell in board.grid.items():
+            bit = 1 << to_index(coordinate.row, coordinate.col, board.cols)
+            for level in range(cell.level):
+                bitboard.levels[level] |= bit
+            if cell.dome:
+                bitboard.domes |= bit
+            if cell.is_hidden:
+                bitboard.hidden |= bit
+                if cell.has_been_revealed:
+                    bitboard.revealed |= bit
+
+        for player in players:
+            squares = []
+            mask = 0
+            for worker in player.get_workers():
+                position = worker.get_position().coordinate
+                square = to_index(position.row, position.col, board.cols)
+                squares.append(square)
+                mask |= 1 << square
+            bitboard.worker_squares.append(squares)
+            bitboard.workers.append(mask)
+
+        return bitboard
+
+    def to_board(self, players: Sequence[Player], hidden_messages: Optional[Sequence[str]] = None) -> Board:
+        """
+        Build a new Board from this bitboard and move the players' workers onto it,
+        taking them off the cells they stood on. Hidden messages, when given, go to
+        the hidden cells in cell order, as Board.get_hidden_cells lists them.
+        """
+        board = Board(self.rows, self.cols)
+        hidden_count = 0
+
+        for coordinate, cell in board.grid.items():
+            square = to_index(coordinate.row, coordinate.col, self.cols)
+            height = self.height(square)
+            has_dome = bool(self.domes >> square & 1)
+            if height or has_dome:
+                cell.set_tower(Tower(height, has_dome))
+            if self.hidden >> square & 1:
+                cell.is_hidden = True
+                cell.has_been_revealed = bool(self.revealed >> square & 1)
+                if hidden_messages:
+                    cell.hidden_message = hidden_messages[hidden_count % len(hidden_messages)]
+                hidden_count += 1
+
+        if self.hidden:
+            board.hidden_cells_created = True
+
+        for player, squares in zip(players, self.worker_squares):
+            for worker, square in zip(player.get_workers(), squares):
+                cell = board.get_cell(Coordinate(*to_row_col(square, self.cols)))
+                if worker.get_position() is not None and worker.get_position().worker is worker:
+                    worker.get_position().remove_worker()
+                worker.set_position(cell)
+                cell.assign_worker(worker)
+
+        return board
+
+    def copy(self) -> BitBoard:
+        """Return an independent copy of this bitboard"""
+        clone = BitBoard.__new__(BitBoard)
+        clone.rows = self.rows
+        clone.cols = self.cols
+        clone.levels = self.levels.copy()
+        clone.domes = self.domes
+        clone.workers = self.workers.copy()
+        clone.worker_squares = [squares.copy() for squares in self.worker_squares]
+        clone.hidden = self.hidden
+        clone.revealed = self.revealed
+        clone.neighbours = self.neighbours
+        clone.pushes = self.pushes
+        clone.perimeter = self.perimeter
+        clone.all_cells = self.all_cells
+        return clone
+
+    @property
+    def occupied(self) -> int:
+        """Mask of all cells holding a worker"""
+        mask = 0
+        for workers in self.workers:
+            mask |= workers
+        return mask
+
+    def height(self, square: int) -> int:
+        """Tower level of a cell (domes are not counted)"""
+        levels = self.levels
+        return (levels[0] >> square & 1) + (levels[1] >> square & 1) + (levels[2] >> square & 1)
+
+    def height_mask(self, height: int) -> int:
+        """Mask of the cells whose tower is exactly this high"""
+        at_least = self.levels[height - 1] if height > 0 else self.all_cells
+        above = self.levels[height] if height < MAXIMUM_TOWER_LEVEL else 0
+        return at_least & ~above
+
+    def move_targets(self, square: int) -> int:
+        """
+        Mask of the cells a worker standing on this square may move to:
+        adjacent, unoccupied, no dome, and at most one level up.
+        """
+        blocked = self.occupied | self.domes
+        height = self.height(square)
+        if height < MAXIMUM_TOWER_LEVEL - 1:
+            blocked |= self.levels[height + 1]
+        return self.neighbours[square] & ~blocked
+
+    def build_targets(self, square: int) -> int:
+        """Mask of the cells a worker standing on this square may build on"""
+        return self.neighbours[square] & ~(self.occupied | self.domes)
+
+    def move_masks(self, player_index: int) -> List[int]:
+        """Move target masks for each of a player's workers, in worker order"""
+        return [self.move_targets(square) for square in self.worker_squares[player_index]]
+
+    def has_valid_moves(self, player_index: int) -> bool:
+        """Bit-parallel equivalent of Player.has_valid_moves"""
+        for square in self.worker_squares[player_index]:
+            if self.move_targets(square):
+                return True
+        return False
+
+    def is_winning_square(self, square: int) -> bool:
+        """A worker standing on level 3 has won"""
+        return bool(self.levels[MAXIMUM_TOWER_LEVEL - 1] >> square & 1)
+
+    def move_worker(self, player_index: int, worker_index: int, to_square: int) -> int:
+        """Move a worker and return the square it came from"""
+        squares = self.worker_squares[player_index]
+        from_square = squares[worker_index]
+        squares[worker_index] = to_square
+        self.workers[player_index] ^= (1 << from_square) | (1 << to_square)
+        return from_square
+
+    def build(self, square: int) -> bool:
+        """Add a level, or a dome on top of level 3, mirroring Worker.apply_build"""
+        bit = 1 << square
+        if self.domes & bit:
+            return False
+        height = self.height(square)
+        if height < MAXIMUM_TOWER_LEVEL:
+            self.levels[height] |= bit
+        else:
+            self.domes |= bit
+        return True
+
+    def build_dome(self, square: int) -> bool:
+        """Put a dome on a cell whatever its level (Atlas)"""
+        bit = 1 << square
+        if self.domes & bit:
+            return False
+        self.domes |= bit
+        return True
+
+    def unbuild(self, square: int) -> None:
+        """Remove the topmost block or dome from a cell, undoing build"""
+        bit = 1 << square
+        if self.domes & bit:
+            self.domes ^= bit
+            return
+        height = self.height(square)
+        if height:
+            self.levels[height - 1] ^= bit
+
+    def iter_squares(self, mask: int):
+        """Yield the squares set in a mask, lowest index first"""
+        return iter_bits(mask)
+
+    def __eq__(self, other):
+        return (isinstance(other, BitBoard)
+                and self.rows == other.rows and self.cols == other.cols
+                and self.levels == other.levels and self.domes == other.domes
+                and self.worker_squares == other.worker_squares
+                and self.hidden == other.hidden and self.revealed == other.revealed)
+
+    def __str__(self) -> str:
+        rows = []
+        for row in range(self.rows):
+            cells = []
+            for col in range(self.cols):
+                square = to_index(row, col, self.cols)
+                symbol = "D" if self.domes >> square & 1 else str(self.height(square))
+                for player_index, workers in enumerate(self.workers):
+                    if workers >> square & 1:
+                        symbol += "AB"[player_index] if player_index < 2 else "*"
+                cells.append(symbol.ljust(2))
+            rows.append(" ".join(cells))
+        return "\n".join(rows)
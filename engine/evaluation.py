@@ -0,0 +1,157 @@
+"""
+Static position evaluation over the Board object model.
+
+Each feature is computed for both players, higher meaning better for that
+player, and the score is a weighted sum of the differences from one player's
+point of view:
+
+    evaluator = Evaluator()                        # DEFAULT_WEIGHTS
+    score = evaluator.evaluate(board, player)
+    evaluator = Evaluator({**DEFAULT_WEIGHTS, "mobility": 2.0})
+
+Evaluators keep their scratch buffers between calls, so scoring a position
+allocates nothing once the evaluator has seen a board of that size. An
+Evaluator is therefore not safe to share between threads.
+"""
+from __future__ import annotations
+from typing import Dict, List, Mapping, Optional, TYPE_CHECKING
+
+from utils.constants import MAXIMUM_TOWER_LEVEL
+
+if TYPE_CHECKING:
+    from models.board import Board
+    from models.player import Player
+
+# Feature order; index = position in the per-player feature vector
+FEATURES = (
+    "height",           # Sum of the player's worker heights
+    "mobility",         # Cells the workers can move to, as get_available_move_cells counts them
+    "climb",            # Reachable level 2 and 3 towers next to the workers
+    "dome_control",     # Free level 3 towers next to the workers, which the player may cap or climb
+    "distance_to_win",  # Minus the fewest moves any worker needs to stand on level 3
+    "artemis",          # Artemis: upward steps reachable with her second move
+    "demeter",          # Demeter: cells at a worker's height, one build from becoming a step up
+    "triton",           # Triton: perimeter cells the workers can move to, each a free extra move
+)
+HEIGHT, MOBILITY, CLIMB, DOME_CONTROL, DISTANCE_TO_WIN, ARTEMIS, DEMETER, TRITON = range(len(FEATURES))
+
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "height": 100.0,
+    "mobility": 5.0,
+    "climb": 20.0,
+    "dome_control": 10.0,
+    "distance_to_win": 40.0,
+    "artemis": 4.0,
+    "demeter": 6.0,
+    "triton": 3.0,
+}
+
+_BLOCKED = -1  # Height entry for cells with a worker or a dome
+_NO_PATH = MAXIMUM_TOWER_LEVEL + 1  # Distance of a worker with no step up in sight
+
+
+class Evaluator:
+    """A weighted combination of FEATURES with reusable scratch buffers"""
+
+    def __init__(self, weights: Optional[Mapping[str, float]] = None):
+        weights = DEFAULT_WEIGHTS if weights is None else weights
+        unknown = set(weights) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown evaluation features: {', '.join(sorted(unknown))}")
+        self.weights: List[float] = [float(weights.get(name, 0.0)) for name in FEATURES]
+
+        # Scratch space: two feature vectors, and the height of every cell
+        # (_BLOCKED where no worker may step) for the board last evaluated
+        self.values: List[float] = [0.0] * (2 * len(FEATURES))
+        self.heights: List[int] = []
+
+    def features(self, board: Board) -> List[float]:
+        """
+        Fill and return the feature vectors of both players, player slot 0
+        first. The list is reused by the next call; copy it to keep it.
+        """
+        values = self.values
+        count = len(FEATURES)
+        for index in range(len(values)):
+            values[index] = 0.0
+        values[DISTANCE_TO_WIN] = values[count + DISTANCE_TO_WIN] = -_NO_PATH
+
+        cells = board.cells
+        heights = self.heights
+        if len(heights) != len(cells):
+            heights[:] = [0] * len(cells)
+        for index, cell in enumerate(cells):
+            heights[index] = _BLOCKED if cell.worker is not None or cell.dome else cell.level
+
+        neighbour_cells = board.neighbour_cells
+        perimeter = board.perimeter_mask
+        slots = board.player_slots
+        top = MAXIMUM_TOWER_LEVEL
+        for cell in cells:
+            worker = cell.worker
+            if worker is None:
+                continue
+            player = worker.player
+            base = slots.get(player, 0) * count
+            height = cell.level
+            god_card = player.god_card
+            god = god_card.name if god_card is not None else None
+
+            moves = climbs = caps = step_up = demeter = triton = artemis = 0
+            for neighbour in neighbour_cells[cell.index]:
+                level = heights[neighbour.index]
+                if level == _BLOCKED:
+                    continue
+                if level == top:
+                    caps += 1
+                if level == height and god == "Demeter":
+                    demeter += 1
+                if level > height + 1:
+                    continue
+                moves += 1
+                if level == height + 1:
+                    step_up = 1
+                    if level >= top - 1:
+                        climbs += 1
+                if god == "Triton" and perimeter >> neighbour.index & 1:
+                    triton += 1
+                elif god == "Artemis":
+                    for second in neighbour_cells[neighbour.index]:
+                        second_level = heights[second.index]
+                        # The start cell still counts as blocked, and she may not return there anyway
+                        if height < second_level <= level + 1:
+                            artemis += 1
+
+            values[base + HEIGHT] += height
+            values[base + MOBILITY] += moves
+            values[base + CLIMB] += climbs
+            values[base + DOME_CONTROL] += caps
+            values[base + ARTEMIS] += artemis
+            values[base + DEMETER] += demeter
+            values[base + TRITON] += triton
+            # Each level still to climb is a move, plus a build first if there is no step up yet
+            distance = top - height + (0 if step_up or height == top else 1)
+            if -distance > values[base + DISTANCE_TO_WIN]:
+                values[base + DISTANCE_TO_WIN] = -distance
+        return values
+
+    def evaluate(self, board: Board, player: Player) -> float:
+        """Weighted feature difference from the given player's point of view"""
+        values = self.features(board)
+        count = len(FEATURES)
+        mine = board.player_slots.get(player, 0) * count
+        theirs = count - mine
+        weights = self.weights
+        score = 0.0
+        for index in range(count):
+            score += weights[index] * (values[mine + index] - values[theirs + index])
+        return score
+
+    def explain(self, board: Board, player: Player) -> Dict[str, float]:
+        """Per-feature weighted contributions to evaluate(), for tuning and debugging"""
+        values = self.features(board)
+        count = len(FEATURES)
+        mine = board.player_slots.get(player, 0) * count
+        theirs = count - mine
+        return {name: self.weights[index] * (values[mine + index] - values[theirs + index])
+                for index, name in enumerate(FEATURES)}
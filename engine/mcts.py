@@ -0,0 +1,269 @@
+from __future__ import annotations
+import math
+import random
+import time
+from contextlib import closing
+from typing import List, NamedTuple, Optional, TYPE_CHECKING
+
+from engine.bitboard import BitBoard
+from engine.turns import SearchPosition, Turn, iter_turns, turn_to_actions
+from utils.constants import MAXIMUM_TOWER_LEVEL
+from utils.grid import iter_bits
+
+if TYPE_CHECKING:
+    from engine.state import EngineAction, EngineState
+
+DEFAULT_EXPLORATION = math.sqrt(2)
+
+
+class MCTSResult(NamedTuple):
+    """Outcome of one Monte Carlo search"""
+    turn: Optional[Turn]
+    win_rate: float  # Of the chosen turn, for the side to move
+    visits: int  # Playouts through the root, including any reused from earlier searches
+    playouts: int  # Playouts run by this search
+    reused: int  # Root visits inherited from the previous search's tree
+    elapsed: float
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Node:
+    """
+    A search-tree node for the position reached by playing turn from the parent.
+    wins counts playout results from the point of view of the side that played turn.
+    """
+
+    __slots__ = ("turn", "parent", "children", "untried", "visits", "wins", "key", "terminal")
+
+    def __init__(self, turn: Optional[Turn], parent: Optional[Node], key: int):
+        self.turn = turn
+        self.parent = parent
+        self.children: List[Node] = []
+        self.untried: Optional[List[Turn]] = None  # Generated on first visit
+        self.visits = 0
+        self.wins = 0.0
+        self.key = key
+        self.terminal: Optional[float] = None  # Result for the side that played turn, once known
+
+    def best_child(self, exploration: float) -> Node:
+        """UCT: exploit the win rate, explore rarely visited children"""
+        log_visits = math.log(self.visits)
+        best, best_value = None, -1.0
+        for child in self.children:
+            value = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+    def find(self, key: int, depth: int) -> Optional[Node]:
+        """Descendant at most depth turns below this node whose position has the given key"""
+        if self.key == key:
+            return self
+        if depth > 0:
+            for child in self.children:
+                found = child.find(key, depth - 1)
+                if found:
+                    return found
+        return None
+
+
+class MCTSPlayer:
+    """
+    Computer opponent using Monte Carlo tree search with UCT selection.
+
+    Tree turns come from iter_turns, which follows Board.get_available_move_cells,
+    get_available_build_cells and GameManager.check_win_condition on a bitboard,
+    god powers and hidden cells included. Each leaf is scored by a batch of random
+    playouts run side by side on BitBoard copies, so playouts never touch Cell or
+    Tower objects. Playouts use the plain rules only: they ignore god powers and
+    hidden cells to stay cheap, so only the tree sees the full game. The tree is
+    kept between moves: the next search re-roots at the node for the position the
+    opponent left us in.
+    """
+
+    def __init__(self, exploration: float = DEFAULT_EXPLORATION, move_time: float = 2.0,
+                 clock_fraction: float = 1 / 30, min_move_time: float = 0.05, batch_size: int = 8,
+                 max_playout_turns: int = 200, reuse_tree: bool = True, rng: Optional[random.Random] = None):
+        self.exploration = exploration
+        self.move_time = move_time
+        self.clock_fraction = clock_fraction
+        self.min_move_time = min_move_time
+        self.batch_size = batch_size
+        self.max_playout_turns = max_playout_turns
+        self.reuse_tree = reuse_tree
+        self.rng = rng or random.Random()
+
+        self.root: Optional[Node] = None
+
+    def new_game(self) -> None:
+        """Forget the tree from a previous game"""
+        self.root = None
+
+    def time_budget(self, remaining_time_secs: Optional[float]) -> float:
+        """Seconds to spend on one move given the player's remaining clock"""
+        budget = self.move_time
+        if remaining_time_secs is not None:
+            budget = min(budget, remaining_time_secs * self.clock_fraction)
+        return max(budget, self.min_move_time)
+
+    def choose_actions(self, state: EngineState) -> List[EngineAction]:
+        """Search the current turn and return the engine actions that play the best one"""
+        result = self.search(SearchPosition.from_state(state),
+                             self.time_budget(state.current_player.remaining_time_secs))
+        if result.turn is None:
+            return []
+        return turn_to_actions(state, result.turn)
+
+    def search(self, position: SearchPosition, time_limit: Optional[float] = None,
+               iterations: Optional[int] = None) -> MCTSResult:
+        """
+        Grow the tree until the time limit or the iteration count runs out
+        (one iteration is one leaf and a batch of playouts) and return the most visited turn.
+        """
+        start = time.perf_counter()
+        deadline = start + time_limit if time_limit is not None else float("inf")
+        if time_limit is None and iterations is None:
+            iterations = 1000
+
+        root = self._reroot(position)
+        reused = root.visits
+        position = position.copy()
+        playouts = 0
+        iteration = 0
+        while iterations is None or iteration < iterations:
+            if iteration & 15 == 0 and time.perf_counter() > deadline:
+                break
+            iteration += 1
+            playouts += self._iterate(root, position)
+            if root.terminal is not None:
+                break
+
+        best = max(root.children, key=lambda child: child.visits, default=None)
+        self.root = root if self.reuse_tree else None
+        if best is None:
+            return MCTSResult(None, 0.0, root.visits, playouts, reused, time.perf_counter() - start)
+        return MCTSResult(best.turn, best.wins / best.visits, root.visits, playouts, reused,
+                          time.perf_counter() - start)
+
+    def _reroot(self, position: SearchPosition) -> Node:
+        """
+        Reuse the subtree for this position if the last search saw it: the same
+        position again, or our chosen turn followed by the opponent's reply.
+        """
+        if self.root is not None:
+            node = self.root.find(position.key, 2)
+            if node is not None:
+                node.parent = None
+                node.turn = None
+                return node
+        return Node(None, None, position.key)
+
+    def _iterate(self, root: Node, position: SearchPosition) -> int:
+        """Select, expand, simulate and backpropagate once; returns the playouts run"""
+        node = root
+        made = []
+
+        # Selection: follow UCT through fully expanded nodes
+        while node.terminal is None:
+            if node.untried is None:
+                node.untried = self._expand_turns(node, position)
+                if node.terminal is not None:
+                    break
+            if node.untried:
+                break
+            node = node.best_child(self.exploration)
+            made.append((node.turn, position.make(node.turn)))
+
+        # Expansion: add one untried turn
+        if node.terminal is None:
+            turn = node.untried.pop(self.rng.randrange(len(node.untried)))
+            made.append((turn, position.make(turn)))
+            child = Node(turn, node, position.key)
+            node.children.append(child)
+            node = child
+            if turn.wins:
+                child.terminal = 1.0
+
+        # Simulation
+        count = self.batch_size
+        if node.terminal is not None:
+            wins = node.terminal * count
+        else:
+            wins = self._playouts(position, count)
+
+        for turn, origin in reversed(made):
+            position.unmake(turn, origin)
+
+        # Backpropagation: wins flip perspective at every level
+        while node is not None:
+            node.visits += count
+            node.wins += wins
+            wins = count - wins
+            node = node.parent
+        return count
+
+    def _expand_turns(self, node: Node, position: SearchPosition) -> List[Turn]:
+        """Turns to try from a node, marking nodes whose outcome is already decided"""
+        turns = []
+        with closing(iter_turns(position)) as generated:
+            for turn in generated:
+                if turn.wins:
+                    # A winning reply is all that matters from here
+                    return [turn]
+                turns.append(turn)
+        if not turns:
+            node.terminal = 1.0  # The side to move cannot move: whoever moved here wins
+        return turns
+
+    def _playouts(self, position: SearchPosition, count: int) -> float:
+        """
+        Play a batch of count random games from position, one turn at a time across
+        the whole batch, and return how many the side that just moved won (draws count half).
+        """
+        rng = self.rng
+        mover = position.side ^ 1
+        side = position.side
+        boards = [position.board.copy() for _ in range(count)]
+        wins = 0.0
+        for _ in range(self.max_playout_turns):
+            still_playing = []
+            for board in boards:
+                outcome = _random_turn(board, side, rng)
+                if outcome is None:
+                    still_playing.append(board)
+                elif (side if outcome else side ^ 1) == mover:
+                    wins += 1
+            boards = still_playing
+            if not boards:
+                break
+            side ^= 1
+        return wins + 0.5 * len(boards)
+
+
+def _random_turn(board: BitBoard, side: int, rng: random.Random) -> Optional[bool]:
+    """
+    Play one random plain-rules turn for side directly on the bitboard. Returns
+    True if side wins by climbing to level 3 (taken whenever available), False if
+    no worker can move, and None if the game goes on. God powers and hidden cells
+    are left out of playouts to keep them cheap; the tree itself uses full turns.
+    """
+    top = board.levels[MAXIMUM_TOWER_LEVEL - 1]
+    second = board.levels[MAXIMUM_TOWER_LEVEL - 2]
+    options = []
+    for worker, square in enumerate(board.worker_squares[side]):
+        targets = board.move_targets(square)
+        if targets:
+            if targets & top and second >> square & 1:
+                return True
+            options.append((worker, targets))
+    if not options:
+        return False
+
+    worker, targets = rng.choice(options)
+    target = rng.choice(list(iter_bits(targets)))
+    board.move_worker(side, worker, target)
+    board.build(rng.choice(list(iter_bits(board.build_targets(target)))))
+    return None
@@ -0,0 +1,241 @@
+"""
+Perft: count the complete turns reachable to a fixed depth.
+
+A node is one complete turn as generate_turns produces it (moves and
+builds, with every god power and hidden-cell reveal as the engine plays
+them). Games that end, by a win or by the side to move having no turn, are
+not searched further. Counts for seeded start positions are stored below,
+and between them the seeds deal out every god card, so any change to move
+generation that alters them shows up:
+
+    python -m engine.perft --size 5 --seed 1 --depth 3
+    python -m engine.perft --check            # stored counts, engine and symmetry cross-checks
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+from typing import Dict, Iterator, List, NamedTuple, Set, Tuple
+
+from engine.rules import apply, create_state, is_terminal, legal_actions, undo
+from engine.setup import create_game
+from engine.state import EngineState
+from engine.symmetry import inverse, map_turn, transform_board, transforms
+from engine.turns import SearchPosition, Turn, generate_turns
+from utils.enums import TurnPhase
+
+# (board size, seed) -> perft counts for depths 1, 2, 3, ...
+REFERENCE_COUNTS: Dict[Tuple[int, int], Tuple[int, ...]] = {
+    (4, 1): (43, 3812, 143405),  # Hephaestus v Prometheus
+    (4, 3): (103, 7508, 665183),  # Demeter v Atlas
+    (4, 5): (111, 3969, 336066),  # Hermes v Triton
+    (4, 7): (110, 9596, 878924),  # Demeter v Hermes
+    (4, 11): (72, 3446, 251598),  # Artemis v Apollo
+    (4, 12): (26, 1835, 70210),  # Athena v Hermes
+    (4, 24): (63, 1690, 87414),  # Minotaur v Pan
+    (5, 1): (65, 9146, 505804),  # Hephaestus v Prometheus
+    (5, 3): (120, 20032, 2593917),  # Demeter v Atlas
+    (5, 5): (197, 16214, 3001369),  # Hermes v Triton
+    (5, 7): (179, 29180, 5181088),  # Demeter v Hermes
+    (5, 11): (110, 6143, 745901),  # Artemis v Apollo
+    (5, 12): (42, 8860, 489460),  # Athena v Hermes
+    (5, 24): (59, 2493, 161599),  # Minotaur v Pan
+    (6, 1): (58, 11200, 614029),  # Hephaestus v Prometheus
+    (6, 3): (197, 34108, 6428251),  # Demeter v Atlas
+    (6, 5): (367, 50998, 17257540),  # Hermes v Triton
+    (6, 7): (260, 87600, 21157630),  # Demeter v Hermes
+    (6, 11): (126, 12369, 1982970),  # Artemis v Apollo
+    (6, 12): (82, 28162, 2324933),  # Athena v Hermes
+    (6, 24): (52, 2860, 183506),  # Minotaur v Pan
+}
+
+
+class PerftResult(NamedTuple):
+    depth: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+def start_position(board_size: int, seed: int) -> SearchPosition:
+    """The seeded start position the reference counts are for"""
+    rng = random.Random(seed)
+    state = create_state(create_game(board_size=board_size, rng=rng), rng=rng)
+    return SearchPosition.from_state(state)
+
+
+def perft(position: SearchPosition, depth: int) -> int:
+    """Number of turn sequences of the given length (or ending the game sooner) from the position"""
+    turns = generate_turns(position)
+    if depth == 1:
+        return len(turns)
+    nodes = 0
+    for turn in turns:
+        if turn.wins:
+            nodes += 1
+            continue
+        origin = position.make(turn)
+        nodes += perft(position, depth - 1)
+        position.unmake(turn, origin)
+    return nodes
+
+
+def divide(position: SearchPosition, depth: int) -> List[Tuple[Turn, int]]:
+    """Perft count below each root turn, for narrowing down a wrong total"""
+    counts = []
+    for turn in generate_turns(position):
+        if turn.wins or depth == 1:
+            counts.append((turn, 1))
+            continue
+        origin = position.make(turn)
+        counts.append((turn, perft(position, depth - 1)))
+        position.unmake(turn, origin)
+    return counts
+
+
+def run_perft(position: SearchPosition, depth: int) -> PerftResult:
+    started = time.perf_counter()
+    nodes = perft(position, depth)
+    return PerftResult(depth, nodes, time.perf_counter() - started)
+
+
+def engine_turn_outcomes(state: EngineState) -> Set[Tuple[int, bool]]:
+    """
+    Every distinct position the engine's own rules can reach by the end of
+    the current turn, found by trying every legal action with apply/undo.
+    Its size must equal len(generate_turns) for the same position.
+    """
+    outcomes: Set[Tuple[int, bool]] = set()
+    board = state.game.get_board()
+
+    def walk():
+        if is_terminal(state) or state.turn_phase == TurnPhase.TURN_END:
+            # God-card flags differ between paths to the same position, so leave them out
+            outcomes.add((board.position_key ^ board.pending_key, is_terminal(state)))
+            return
+        for action in legal_actions(state):
+            apply(state, action)
+            walk()
+            undo(state)
+
+    walk()
+    return outcomes
+
+
+def sample_states(board_size: int, seed: int, positions: int, plies: int = 30) -> Iterator[EngineState]:
+    """Start-of-turn engine states reached by seeded random play, without undo history"""
+    rng = random.Random(seed)
+    sampled = 0
+    while sampled < positions:
+        state = create_state(create_game(board_size=board_size, rng=rng), rng=rng)
+        for _ in range(rng.randint(0, plies)):
+            if is_terminal(state):
+                break
+            apply(state, rng.choice(legal_actions(state)))
+        while not is_terminal(state) and state.turn_phase != TurnPhase.WORKER_SELECTION:
+            apply(state, rng.choice(legal_actions(state)))
+        if is_terminal(state):
+            continue
+        sampled += 1
+        state.history.clear()
+        yield state
+
+
+def cross_check(board_size: int, seed: int, positions: int = 20, plies: int = 30) -> int:
+    """
+    Compare generate_turns with the engine on start-of-turn positions reached
+    by seeded random play; returns the number of positions that disagree.
+    """
+    failures = 0
+    for checked, state in enumerate(sample_states(board_size, seed, positions, plies), start=1):
+        expected = len(engine_turn_outcomes(state))
+        generated = len(generate_turns(SearchPosition.from_state(state)))
+        if expected != generated:
+            failures += 1
+            print(f"  size {board_size} seed {seed} position {checked}: "
+                  f"engine {expected} turns, generate_turns {generated}")
+    return failures
+
+
+def turn_outcomes(turns: List[Turn]) -> Set[tuple]:
+    """
+    What each turn leads to, leaving out the path: generate_turns keeps one
+    path per final square, and which one depends on the order squares are visited in
+    """
+    return {(turn.worker, turn.path[-1], tuple(sorted(turn.builds)), turn.reveal, turn.wins, turn.push,
+             turn.builds_first) for turn in turns}
+
+
+def symmetry_check(board_size: int, seed: int, positions: int = 20, plies: int = 30) -> int:
+    """
+    Generate turns on every symmetric image of seeded positions and map them
+    back with the inverse transform; they must lead to the same outcomes as
+    the turns of the position itself. Returns the number of images that disagree.
+    """
+    failures = 0
+    for checked, state in enumerate(sample_states(board_size, seed, positions, plies), start=1):
+        position = SearchPosition.from_state(state)
+        board = position.board
+        expected = turn_outcomes(generate_turns(position))
+        for transform in transforms(board.rows, board.cols):
+            image = SearchPosition(transform_board(board, transform), position.side, position.gods,
+                                   position.reveals_left, position.athena_climbed)
+            mapped = [map_turn(turn, inverse(transform), board.rows, board.cols) for turn in generate_turns(image)]
+            if turn_outcomes(mapped) != expected:
+                failures += 1
+                print(f"  size {board_size} seed {seed} position {checked}: transform {transform} disagrees")
+    return failures
+
+
+def check_references(max_nodes: int = 2_000_000) -> int:
+    """Recount every stored reference up to max_nodes; returns the number of mismatches"""
+    failures = 0
+    for (board_size, seed), counts in sorted(REFERENCE_COUNTS.items()):
+        for depth, expected in enumerate(counts, start=1):
+            if expected > max_nodes:
+                break
+            result = run_perft(start_position(board_size, seed), depth)
+            status = "ok" if result.nodes == expected else f"MISMATCH (expected {expected})"
+            print(f"size {board_size} seed {seed} depth {depth}: {result.nodes:9d} nodes "
+                  f"{result.nodes_per_second:10.0f} nodes/sec  {status}")
+            failures += result.nodes != expected
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5, help="board size (4, 5 or 6)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--divide", action="store_true", help="show the count below each root turn")
+    parser.add_argument("--check", action="store_true",
+                        help="verify the stored reference counts and cross-check turn generation with "
+                             "the engine and under board symmetries")
+    parser.add_argument("--max-nodes", type=int, default=2_000_000, help="skip larger reference counts in --check")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        failures = check_references(args.max_nodes)
+        for board_size in (4, 5, 6):
+            failures += cross_check(board_size, seed=board_size)
+            failures += symmetry_check(board_size, seed=board_size)
+        print("all counts match" if not failures else f"{failures} mismatches")
+        return 1 if failures else 0
+
+    position = start_position(args.size, args.seed)
+    if args.divide:
+        for turn, count in divide(position, args.depth):
+            print(f"{turn.worker} {turn.path} {turn.builds}: {count}")
+    for depth in range(1, args.depth + 1):
+        result = run_perft(position, depth)
+        print(f"depth {depth}: {result.nodes:10d} nodes in {result.elapsed:7.2f}s = "
+              f"{result.nodes_per_second:.0f} nodes/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
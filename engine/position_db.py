@@ -0,0 +1,208 @@
+"""
+Memory-mapped position statistics.
+
+The database maps a canonical position key to how often the position was seen
+at the start of a turn in recorded games and how those games ended for the
+side to move. It is a sorted array of fixed-width records, so lookups are a
+binary search over a memory map and the file is never read into RAM:
+
+    python -m engine.position_db build games.sntr --out positions.db
+
+    with PositionDB("positions.db") as db:
+        stats = db.lookup(state_key(state))
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import mmap
+import struct
+import sys
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, TYPE_CHECKING
+
+from engine.bitboard import BitBoard
+from engine.records import GOD_CARD_NAMES, GameRecord, read_games
+from engine.symmetry import canonicalise
+
+if TYPE_CHECKING:
+    from engine.state import EngineState
+    from engine.turns import SearchPosition
+
+MAGIC = b"SNPD"
+VERSION = 2  # 2: keys of symmetric positions are shared
+
+_HEADER = struct.Struct("<4sBxxxQ")  # magic, version, record count
+_RECORD = struct.Struct("<QIII")  # key, visits, wins, draws
+
+
+class PositionStats(NamedTuple):
+    """Outcomes of recorded games from a position, for the side to move"""
+    visits: int
+    wins: int
+    draws: int
+
+    @property
+    def losses(self) -> int:
+        return self.visits - self.wins - self.draws
+
+    @property
+    def win_rate(self) -> float:
+        """Score with draws counted as half a win"""
+        return (self.wins + 0.5 * self.draws) / self.visits if self.visits else 0.0
+
+
+def position_key(board: BitBoard, side: int, god_cards: Sequence[Optional[str]]) -> int:
+    """
+    64-bit key of a position: tower levels, domes, which cells each player's
+    workers stand on, the side to move and the god cards in play. Workers of
+    one player are interchangeable, so only their occupancy mask counts, and
+    the board is canonicalised first so all symmetric positions share a key.
+    """
+    board, _ = canonicalise(board)
+    data = bytearray([board.rows, board.cols, side])
+    data.extend(GOD_CARD_NAMES.index(name) if name in GOD_CARD_NAMES else 0 for name in god_cards)
+    for mask in (*board.levels, board.domes, *board.workers):
+        data.extend(mask.to_bytes(8, "little"))
+    return int.from_bytes(hashlib.blake2b(bytes(data), digest_size=8).digest(), "little")
+
+
+def state_key(state: EngineState) -> int:
+    """Database key of an engine state at the start of a turn"""
+    players = state.game.get_players()
+    return position_key(BitBoard.from_board(state.game.get_board(), players),
+                        state.game_manager.current_player_index,
+                        [player.get_god_card().name if player.get_god_card() else None for player in players])
+
+
+def search_position_key(position: SearchPosition) -> int:
+    """Database key of a search position"""
+    return position_key(position.board, position.side, position.gods)
+
+
+def record_positions(record: GameRecord) -> Iterable[tuple]:
+    """
+    Yield (key, side to move) for every turn start of a recorded game, by
+    replaying its entries on a bitboard. A turn starts whenever the player changes.
+    A move onto an opponent's worker displaces it the way the mover's god card
+    does: Apollo swaps places, Minotaur pushes it one cell further.
+    """
+    board = BitBoard(record.rows, record.cols)
+    for squares in record.worker_squares:
+        board.worker_squares.append(list(squares))
+        mask = 0
+        for square in squares:
+            mask |= 1 << square
+        board.workers.append(mask)
+
+    side = None
+    for entry in record.iter_entries():
+        if entry.player != side:
+            side = entry.player
+            yield position_key(board, side, record.god_cards), side
+        if entry.is_build:
+            if entry.dome:
+                board.build_dome(entry.square)
+            else:
+                board.build(entry.square)
+            continue
+        origin = board.worker_squares[entry.player][entry.worker]
+        opponent = entry.player ^ 1
+        if board.workers[opponent] >> entry.square & 1:
+            push = origin if record.god_cards[entry.player] == "Apollo" else board.pushes[origin][entry.square]
+            board.move_worker(opponent, board.worker_squares[opponent].index(entry.square), push)
+        board.move_worker(entry.player, entry.worker, entry.square)
+
+
+class PositionDBBuilder:
+    """Accumulates statistics in memory and writes them out as a sorted database"""
+
+    def __init__(self):
+        self.counts: Dict[int, List[int]] = defaultdict(lambda: [0, 0, 0])
+        self.games = 0
+
+    def add_game(self, record: GameRecord) -> None:
+        self.games += 1
+        for key, side in record_positions(record):
+            counts = self.counts[key]
+            counts[0] += 1
+            if record.winner is None:
+                counts[2] += 1
+            elif record.winner == side:
+                counts[1] += 1
+
+    def add_archive(self, path: str) -> None:
+        for record in read_games(path):
+            self.add_game(record)
+
+    def write(self, path: str) -> int:
+        """Write the database and return the number of positions in it"""
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, len(self.counts)))
+            for key in sorted(self.counts):
+                visits, wins, draws = self.counts[key]
+                file.write(_RECORD.pack(key, visits, wins, draws))
+        return len(self.counts)
+
+
+class PositionDB:
+    """Read-only view of a position database through a memory map"""
+
+    def __init__(self, path: str):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count = _HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} position database")
+        if len(self.map) < _HEADER.size + self.count * _RECORD.size:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def lookup(self, key: int) -> Optional[PositionStats]:
+        """Binary search for a position; None if it was never seen"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = _HEADER.size + middle * _RECORD.size
+            (found,) = struct.unpack_from("<Q", self.map, offset)
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                _, visits, wins, draws = _RECORD.unpack_from(self.map, offset)
+                return PositionStats(visits, wins, draws)
+        return None
+
+    def close(self) -> None:
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self) -> PositionDB:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="build a database from game archives")
+    build.add_argument("archives", nargs="+")
+    build.add_argument("--out", required=True)
+    args = parser.parse_args(argv)
+
+    builder = PositionDBBuilder()
+    for path in args.archives:
+        builder.add_archive(path)
+    positions = builder.write(args.out)
+    print(f"{positions} positions from {builder.games} games written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
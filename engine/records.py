@@ -0,0 +1,253 @@
+"""
+Compact binary game records.
+
+An archive is the magic bytes b"SNTR", a version byte, and then one record per
+game, each prefixed with its length so readers can stream or skip games:
+
+    u32  length of the rest of the record
+    u8   rows, u8 cols
+    u8   winner (player index, 255 for none)
+    u8   god card id per player (index into GOD_CARD_NAMES, 0 for none)
+    u8   starting square of each worker, player by player
+    u8   number of hidden cells, then u8 square of each
+    u16  one entry per executed move or build (little endian):
+         bit 15 build, bit 14 player, bit 13 worker, bit 12 dome below
+         level 3 (Atlas), bits 0-5 square
+
+Squares are flat indices (row * cols + col). Turns are not stored: a turn
+ends when the next entry belongs to the other player.
+
+    with RecordWriter("games.sntr") as writer:
+        state.game_manager.recorder = GameRecorder(writer, state.game)
+        ...
+    for record in read_games("games.sntr"):
+        for state in replay(record):
+            ...
+"""
+from __future__ import annotations
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, TYPE_CHECKING, Union
+
+from engine.rules import apply, create_state
+from engine.state import EngineAction
+from logic.actions.build_action import BuildAction
+from models.game import Game
+from models.god_card import GOD_CARDS, create_god_card
+from models.player import Player
+from models.worker import Worker
+from utils.enums import TurnPhase
+from utils.grid import to_row_col
+
+if TYPE_CHECKING:
+    from engine.state import EngineState
+    from logic.actions.action import Action
+
+MAGIC = b"SNTR"
+VERSION = 1
+
+# Ids are positions in this tuple and are stored in archives; GOD_CARDS keeps
+# registration order, so registering new cards only ever appends
+GOD_CARD_NAMES = (None, *GOD_CARDS)
+
+NO_WINNER = 255
+BUILD_FLAG = 1 << 15
+PLAYER_SHIFT = 14
+WORKER_SHIFT = 13
+DOME_FLAG = 1 << 12
+SQUARE_MASK = 0x3F
+
+_LENGTH = struct.Struct("<I")
+_ENTRY = struct.Struct("<H")
+
+
+class RecordEntry(NamedTuple):
+    """One executed move or build"""
+    is_build: bool
+    player: int
+    worker: int  # Index into the player's workers
+    square: int
+    dome: bool = False  # A build of a dome below level 3
+
+
+class GameRecord(NamedTuple):
+    """A decoded game header; entries stay packed until iterated"""
+    rows: int
+    cols: int
+    winner: Optional[int]
+    god_cards: Tuple[Optional[str], ...]
+    worker_squares: Tuple[Tuple[int, ...], ...]
+    hidden_squares: Tuple[int, ...]
+    entries: bytes
+
+    def __len__(self) -> int:
+        return len(self.entries) // _ENTRY.size
+
+    def iter_entries(self) -> Iterator[RecordEntry]:
+        for (value,) in _ENTRY.iter_unpack(self.entries):
+            yield RecordEntry(bool(value & BUILD_FLAG), value >> PLAYER_SHIFT & 1,
+                              value >> WORKER_SHIFT & 1, value & SQUARE_MASK, bool(value & DOME_FLAG))
+
+
+def encode_entry(is_build: bool, player: int, worker: int, square: int, dome: bool = False) -> bytes:
+    if square > SQUARE_MASK:
+        raise ValueError("Boards larger than 64 cells cannot be recorded")
+    return _ENTRY.pack((BUILD_FLAG if is_build else 0) | player << PLAYER_SHIFT
+                       | worker << WORKER_SHIFT | (DOME_FLAG if dome else 0) | square)
+
+
+def god_card_id(god_card) -> int:
+    return GOD_CARD_NAMES.index(god_card.name) if god_card and god_card.name in GOD_CARD_NAMES else 0
+
+
+class RecordWriter:
+    """Appends game records to a binary archive, writing the file header when it is new"""
+
+    def __init__(self, target: Union[str, BinaryIO]):
+        self.owns_file = isinstance(target, str)
+        self.file: BinaryIO = open(target, "ab") if self.owns_file else target
+        if self.file.tell() == 0:
+            self.file.write(MAGIC + bytes([VERSION]))
+        self.games_written = 0
+
+    def write_game(self, body: bytes) -> None:
+        """Write one encoded game (everything after the length prefix)"""
+        self.file.write(_LENGTH.pack(len(body)))
+        self.file.write(body)
+        self.games_written += 1
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self) -> RecordWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class GameRecorder:
+    """
+    Records one game as it is played. GameManager.execute_turn calls record for
+    every executed move and build (and undo_turn calls retract), and end_game
+    calls finish, which hands the encoded game to the writer.
+    Attach it once workers are placed and hidden cells created.
+    """
+
+    def __init__(self, writer: RecordWriter, game: Game):
+        self.writer = writer
+        self.players: List[Player] = game.get_players()
+        self.entries: List[bytes] = []
+        self.finished = False
+
+        board = game.get_board()
+        self.header = bytearray([board.rows, board.cols])
+        self.header.extend(god_card_id(player.get_god_card()) for player in self.players)
+        for player in self.players:
+            self.header.extend(board.index_of(worker.get_position().coordinate) for worker in player.get_workers())
+        hidden = board.get_hidden_cells()
+        self.header.append(len(hidden))
+        self.header.extend(board.index_of(cell.coordinate) for cell in hidden)
+
+    def record(self, action: Action) -> None:
+        """Append an executed MoveAction or BuildAction"""
+        player = self.players.index(action.player)
+        worker = action.player.get_workers().index(action.worker)
+        square = action.target_cell.board.index_of(action.target_cell.coordinate)
+        is_build = isinstance(action, BuildAction)
+        self.entries.append(encode_entry(is_build, player, worker, square, is_build and action.dome))
+
+    def retract(self, action: Action) -> None:
+        """Drop the last entry again when its action is undone"""
+        if self.entries and not self.finished:
+            self.entries.pop()
+
+    def finish(self, winner: Optional[Player]) -> None:
+        """Encode the game and pass it to the writer; later calls do nothing"""
+        if self.finished:
+            return
+        self.finished = True
+        winner_index = self.players.index(winner) if winner in self.players else NO_WINNER
+        body = bytes(self.header[:2]) + bytes([winner_index]) + bytes(self.header[2:]) + b"".join(self.entries)
+        self.writer.write_game(body)
+
+
+def read_games(source: Union[str, BinaryIO]) -> Iterator[GameRecord]:
+    """Yield the games of an archive one at a time"""
+    file = open(source, "rb") if isinstance(source, str) else source
+    try:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a Santorini game archive")
+        version = file.read(1)
+        if not version or version[0] != VERSION:
+            raise ValueError(f"Unsupported archive version {version[0] if version else None}")
+
+        while True:
+            prefix = file.read(_LENGTH.size)
+            if not prefix:
+                return
+            if len(prefix) < _LENGTH.size:
+                raise ValueError("Truncated game archive")
+            (length,) = _LENGTH.unpack(prefix)
+            body = file.read(length)
+            if len(body) < length:
+                raise ValueError("Truncated game archive")
+            yield decode_game(body)
+    finally:
+        if isinstance(source, str):
+            file.close()
+
+
+def decode_game(body: bytes) -> GameRecord:
+    """Decode one game record (everything after the length prefix)"""
+    rows, cols, winner = body[0], body[1], body[2]
+    players = 2
+    offset = 3
+    god_cards = tuple(GOD_CARD_NAMES[god_id] for god_id in body[offset:offset + players])
+    offset += players
+    worker_squares = tuple(tuple(body[offset + 2 * player:offset + 2 * player + 2]) for player in range(players))
+    offset += 2 * players
+    hidden_count = body[offset]
+    hidden_squares = tuple(body[offset + 1:offset + 1 + hidden_count])
+    offset += 1 + hidden_count
+    return GameRecord(rows, cols, None if winner == NO_WINNER else winner, god_cards,
+                      worker_squares, hidden_squares, body[offset:])
+
+
+def replay(record: GameRecord) -> Iterator[EngineState]:
+    """
+    Rebuild the recorded game and play it through the engine,
+    yielding the state after every recorded move and build.
+    """
+    game = Game(players=[Player(f"Player {index + 1}") for index in range(len(record.god_cards))],
+                board_size=record.rows)
+    game.initialize_game([create_god_card(name) if name else None for name in record.god_cards])
+
+    board = game.get_board()
+    worker_id = 1
+    for player, squares in zip(game.get_players(), record.worker_squares):
+        for square in squares:
+            player.add_worker(Worker(id=worker_id, position=board.cells[square], player=player))
+            worker_id += 1
+    board.mark_hidden_cells([board.cells[square] for square in record.hidden_squares])
+
+    state = create_state(game)
+    for entry in record.iter_entries():
+        if state.turn_phase == TurnPhase.TURN_END and entry.player != state.game_manager.current_player_index:
+            apply(state, EngineAction.end_turn())
+        if state.turn_phase == TurnPhase.WORKER_SELECTION:
+            worker = state.current_player.get_workers()[entry.worker]
+            apply(state, EngineAction.select_worker(worker.id))
+        row, col = to_row_col(entry.square, record.cols)
+        apply(state, EngineAction.build_on(row, col, entry.dome) if entry.is_build else EngineAction.move_to(row, col))
+        yield state
+
+    # A player who cannot move loses when their turn starts, after the last entry
+    if record.winner is not None and state.turn_phase == TurnPhase.TURN_END:
+        apply(state, EngineAction.end_turn())
+        yield state
@@ -0,0 +1,396 @@
+from __future__ import annotations
+import random
+from typing import Iterator, List, Optional, TYPE_CHECKING
+
+from engine.state import EngineAction, EngineEvent, EngineState, IllegalActionError, UndoRecord
+from logic.actions.build_action import BuildAction
+from logic.actions.move_action import MoveAction
+from models.coordinate import Coordinate
+from models.god_card import NO_HOOKS
+from utils.constants import MAXIMUM_TOWER_LEVEL
+from utils.enums import ActionType, EventType, GameStatus, TurnPhase
+
+if TYPE_CHECKING:
+    from models.cell import Cell
+    from models.god_card import GodHooks
+    from models.game import Game
+    from models.player import Player
+    from models.worker import Worker
+
+def create_state(game: Game, num_hidden_cells: int = 2, rng: Optional[random.Random] = None) -> EngineState:
+    """
+    Wrap a set-up Game in an engine state, create its hidden cells
+    (seeded when rng is given) and start the first turn.
+    """
+    game.get_board().create_hidden_cells(num_hidden_cells, rng)
+    state = EngineState(game)
+    state.game_manager.start_game()
+    _begin_turn(state)
+    return state
+
+
+def is_terminal(state: EngineState) -> bool:
+    """Check if the game is over"""
+    return state.turn_phase == TurnPhase.GAME_OVER
+
+
+def legal_actions(state: EngineState) -> List[EngineAction]:
+    """Return every action the current player may take right now"""
+    phase = state.turn_phase
+
+    if phase == TurnPhase.WORKER_SELECTION:
+        return [
+            EngineAction.select_worker(worker.id)
+            for worker in state.current_player.get_workers()
+            if any_legal_move(state, worker)
+        ]
+
+    if phase == TurnPhase.MOVE_SELECTION or phase == TurnPhase.BUILD_SELECTION:
+        actions = [EngineAction.move_to(cell.coordinate.row, cell.coordinate.col)
+                   for cell in legal_move_cells(state)]
+        actions.extend(EngineAction.build_on(cell.coordinate.row, cell.coordinate.col)
+                       for cell in legal_build_cells(state))
+        actions.extend(EngineAction.build_on(cell.coordinate.row, cell.coordinate.col, dome=True)
+                       for cell in legal_dome_cells(state))
+        return actions
+
+    if phase == TurnPhase.TURN_END:
+        return [EngineAction.end_turn()]
+
+    return []
+
+
+def worker_move_cells(state: EngineState, worker: Worker) -> List[Cell]:
+    """
+    Cells the worker may move to from where it stands: the normal moves plus
+    any its god card adds, less any the god cards in play forbid
+    """
+    board = state.game.get_board()
+    hooks = state.game_manager.god_hooks.get(worker.player, NO_HOOKS)
+    cells = board.get_available_move_cells(worker)
+    if hooks.extra_move_cells:
+        cells.extend(hooks.extra_move_cells(worker, board))
+    move_filter = hooks.move_filter
+    if move_filter is None:
+        return cells
+    origin = worker.get_position()
+    return [cell for cell in cells if move_filter(worker, origin, cell)]
+
+
+def iter_move_cells(state: EngineState, worker: Worker) -> Iterator[Cell]:
+    """Yield worker_move_cells one at a time; god-card extras are only looked up once the normal moves run out"""
+    board = state.game.get_board()
+    hooks = state.game_manager.god_hooks.get(worker.player, NO_HOOKS)
+    move_filter = hooks.move_filter
+    origin = worker.get_position()
+    for cell in board.iter_moves(worker):
+        if move_filter is None or move_filter(worker, origin, cell):
+            yield cell
+    if hooks.extra_move_cells:
+        for cell in hooks.extra_move_cells(worker, board):
+            if move_filter is None or move_filter(worker, origin, cell):
+                yield cell
+
+
+def any_legal_move(state: EngineState, worker: Worker) -> bool:
+    """Whether the worker can move at all, stopping at the first cell it can move to"""
+    return next(iter_move_cells(state, worker), None) is not None
+
+
+def legal_move_cells(state: EngineState) -> List[Cell]:
+    """Cells the selected worker may move to in the current move phase"""
+    worker = state.selected_worker
+    if state.turn_phase != TurnPhase.MOVE_SELECTION or not worker:
+        return []
+    cells = worker_move_cells(state, worker)
+    if state.move_count == 0:
+        return cells
+    return [cell for cell in cells if not _is_revisit(state, cell)]
+
+
+def legal_build_cells(state: EngineState) -> List[Cell]:
+    """
+    Cells the selected worker may build on in the current build phase, or
+    before moving if its god card allows that (Prometheus)
+    """
+    worker = state.selected_worker
+    if not worker:
+        return []
+    hooks = _hooks(state)
+    if state.turn_phase == TurnPhase.BUILD_SELECTION:
+        build_filter = hooks.build_filter
+    elif _can_build_first(state, hooks):
+        build_filter = hooks.pre_build_filter
+    else:
+        return []
+    cells = state.game.get_board().get_available_build_cells(worker)
+    if build_filter is None:
+        return cells
+    return [cell for cell in cells if build_filter(worker, cell)]
+
+
+def legal_dome_cells(state: EngineState) -> List[Cell]:
+    """Cells below level 3 the selected worker may build a dome on right now (Atlas)"""
+    dome_filter = _hooks(state).dome_filter
+    if dome_filter is None:
+        return []
+    worker = state.selected_worker
+    return [cell for cell in legal_build_cells(state)
+            if cell.level < MAXIMUM_TOWER_LEVEL
+            and dome_filter(worker, cell)]
+
+
+def validate(state: EngineState, action: EngineAction) -> None:
+    """Raise IllegalActionError, with the message the UI shows, if the action is not legal"""
+    if is_terminal(state):
+        raise IllegalActionError("Game Over", "The game has already ended.")
+
+    if action.action_type == ActionType.SELECT_WORKER:
+        worker = _find_worker(state, action.worker_id)
+        if worker is None or worker.player is not state.current_player:
+            raise IllegalActionError("Invalid Selection", "You can only select your own workers.")
+        if state.turn_phase != TurnPhase.WORKER_SELECTION:
+            raise IllegalActionError("Invalid Action", "You can only select workers at the start of your turn.")
+        if not any_legal_move(state, worker):
+            raise IllegalActionError("No Moves", "This worker has no valid moves.")
+
+    elif action.action_type == ActionType.MOVE:
+        worker = state.selected_worker
+        if state.turn_phase != TurnPhase.MOVE_SELECTION or not worker:
+            raise IllegalActionError("Invalid Move", "You cannot move right now.")
+        cell = _target_cell(state, action)
+        board = state.game.get_board()
+        hooks = _hooks(state)
+        if not board.is_legal_move(worker, cell) and not (
+                hooks.extra_move_cells and cell in hooks.extra_move_cells(worker, board)):
+            raise IllegalActionError("Invalid Move", "That cell is not a valid move target.")
+        if _is_revisit(state, cell):
+            god_name = _god_name(state.current_player)
+            if cell is state.previous_move_cell:
+                raise IllegalActionError("Invalid Move", f"{god_name} cannot move back to the previous cell.")
+            raise IllegalActionError("Invalid Move", f"{god_name} cannot return to a cell already visited this turn.")
+        if hooks.move_filter and not hooks.move_filter(worker, worker.get_position(), cell):
+            raise IllegalActionError("Invalid Move", _move_rule(state, worker, cell))
+
+    elif action.action_type == ActionType.BUILD:
+        worker = state.selected_worker
+        hooks = _hooks(state)
+        if not worker or not (state.turn_phase == TurnPhase.BUILD_SELECTION or _can_build_first(state, hooks)):
+            raise IllegalActionError("Invalid Build", "You cannot build right now.")
+        cell = _target_cell(state, action)
+        if not state.game.get_board().is_legal_build(worker, cell):
+            raise IllegalActionError("Invalid Build", "That cell is not a valid build target.")
+        god_card = state.current_player.get_god_card()
+        if state.turn_phase == TurnPhase.MOVE_SELECTION:
+            if not hooks.pre_build_filter(worker, cell):
+                raise IllegalActionError("Invalid Build", f"{god_card.name} must still be able to move after building there.")
+        elif hooks.build_filter and not hooks.build_filter(worker, cell):
+            raise IllegalActionError("Invalid Build", f"{god_card.name} {god_card.build_rule}")
+        if action.dome and cell not in legal_dome_cells(state):
+            raise IllegalActionError("Invalid Build", "Domes can only be built on level 3.")
+
+    elif action.action_type == ActionType.END_TURN:
+        if state.turn_phase != TurnPhase.TURN_END or not (state.has_moved and state.has_built):
+            raise IllegalActionError("Invalid Action", "You must move and build before ending your turn.")
+
+
+def apply(state: EngineState, action: EngineAction) -> List[EngineEvent]:
+    """
+    Apply a legal action to the state in place and return the events it caused.
+    Raises IllegalActionError if the action is not legal.
+    """
+    validate(state, action)
+
+    record = state.push_record()
+    try:
+        return _apply(state, action, record)
+    except IllegalActionError:
+        undo(state)
+        raise
+
+
+def undo(state: EngineState) -> bool:
+    """
+    Take back the most recently applied action in place, so searches can
+    walk a game tree without copying the Game. Returns False if there is nothing to undo.
+    """
+    if not state.history:
+        return False
+
+    record = state.history.pop()
+    manager = state.game_manager
+    if record.model_action is not None:
+        manager.undo_turn(record.model_action)
+    if record.god_player is not None:
+        record.god_player.get_god_card().restore(record.god_flags)
+        manager.update_pending_key()
+    manager.restore_status(record)
+    state.restore_turn(record)
+    state.release_record(record)
+    return True
+
+
+def _apply(state: EngineState, action: EngineAction, record: UndoRecord) -> List[EngineEvent]:
+    if action.action_type == ActionType.SELECT_WORKER:
+        state.selected_worker = _find_worker(state, action.worker_id)
+        state.visited_cells = [state.selected_worker.get_position()]
+        state.turn_phase = TurnPhase.MOVE_SELECTION
+        return []
+
+    if action.action_type == ActionType.MOVE:
+        return _apply_move(state, _target_cell(state, action), record)
+
+    if action.action_type == ActionType.BUILD:
+        return _apply_build(state, _target_cell(state, action), action.dome, record)
+
+    god_card = state.current_player.get_god_card()
+    if god_card:
+        record.god_player = state.current_player
+        record.god_flags = god_card.snapshot()
+    state.game_manager.end_turn()
+    return _begin_turn(state)
+
+
+def forfeit(state: EngineState, player: Player) -> List[EngineEvent]:
+    """End the game with the other player as winner (e.g. when a clock runs out)"""
+    return _finish(state, state.get_opponent(player))
+
+
+def declare_draw(state: EngineState) -> None:
+    """End the game without a winner"""
+    state.game_manager.end_game()
+    state.winner = None
+    state.turn_phase = TurnPhase.GAME_OVER
+
+
+def _apply_move(state: EngineState, cell: Cell, record: UndoRecord) -> List[EngineEvent]:
+    """Execute a move through the GameManager and work out the next phase"""
+    worker = state.selected_worker
+    state.previous_move_cell = worker.get_position()
+
+    action = MoveAction(state.current_player, worker, cell)
+    result = state.game_manager.execute_turn(action)
+    if action.executed:
+        record.model_action = action
+    if not result:
+        raise IllegalActionError("Invalid Move", "The move could not be executed.")
+
+    state.has_moved = True
+    state.move_count += 1
+    state.visited_cells.append(cell)
+
+    if state.game_manager.check_win_condition(action):
+        return _finish(state, state.current_player)
+
+    events = []
+    if result is EventType.HIDDEN_CELL_REVEALED:
+        # A reveal ends the move phase before any god power fires
+        events.append(EngineEvent(EventType.HIDDEN_CELL_REVEALED, action.revealed_cell.hidden_message))
+        result = True
+
+    # Any event from the god card's after_move hook offers another move
+    state.turn_phase = TurnPhase.MOVE_SELECTION
+    if isinstance(result, EventType) and legal_move_cells(state):
+        events.append(EngineEvent(result))
+    else:
+        # No further moves → proceed to build phase
+        state.turn_phase = TurnPhase.BUILD_SELECTION
+
+    return events
+
+
+def _apply_build(state: EngineState, cell: Cell, dome: bool, record: UndoRecord) -> List[EngineEvent]:
+    """Execute a build through the GameManager and work out the next phase"""
+    action = BuildAction(state.current_player, state.selected_worker, cell, dome)
+    result = state.game_manager.execute_turn(action)
+    if action.executed:
+        record.model_action = action
+    if not result:
+        raise IllegalActionError("Invalid Build", "The build could not be executed.")
+
+    state.has_built = True
+    state.build_count += 1
+    if state.build_count == 1:
+        state.first_build_cell = cell
+
+    # A build before moving (Prometheus) leaves the move still to make
+    if not state.has_moved:
+        return []
+
+    # Any event from the god card's after_build hook offers another build
+    if isinstance(result, EventType) and legal_build_cells(state):
+        return [EngineEvent(result)]
+
+    state.turn_phase = TurnPhase.TURN_END
+    return []
+
+
+def _begin_turn(state: EngineState) -> List[EngineEvent]:
+    """Reset turn bookkeeping; the player on turn loses if no worker can move"""
+    state.reset_turn()
+    if not any(any_legal_move(state, worker) for worker in state.current_player.get_workers()):
+        return _finish(state, state.get_opponent(state.current_player))
+    return []
+
+
+def _finish(state: EngineState, winner: Player) -> List[EngineEvent]:
+    """Record the winner and stop accepting actions"""
+    if state.game.get_status() == GameStatus.ONGOING or state.game.get_winner() is not winner:
+        state.game_manager.end_game(winner=winner)
+    state.winner = winner
+    state.turn_phase = TurnPhase.GAME_OVER
+    return [EngineEvent(EventType.GAME_WON, winner.name)]
+
+
+def _is_revisit(state: EngineState, cell: Cell) -> bool:
+    """
+    A continuation move (Artemis' second move, Triton's extra moves) may not
+    return to a cell the worker already stood on this turn. For Artemis this is
+    the 'not back to the previous cell' rule; for Triton it stops endless chains.
+    """
+    return state.move_count > 0 and cell in state.visited_cells
+
+
+def _hooks(state: EngineState) -> GodHooks:
+    """The current player's god-card hooks, resolved at game start"""
+    return state.game_manager.god_hooks.get(state.current_player, NO_HOOKS)
+
+
+def _can_build_first(state: EngineState, hooks: GodHooks) -> bool:
+    """Whether the selected worker may still build before moving (Prometheus)"""
+    return (hooks.pre_build_filter is not None and state.turn_phase == TurnPhase.MOVE_SELECTION
+            and not state.has_moved and not state.has_built)
+
+
+def _move_rule(state: EngineState, worker: Worker, cell: Cell) -> str:
+    """Message for a move a god card forbids: the player's own card, or else an opponent's"""
+    origin = worker.get_position()
+    god_card = state.current_player.get_god_card()
+    if god_card and not god_card.move_filter(worker, origin, cell):
+        return f"{god_card.name} {god_card.move_rule}"
+    for player in state.game.get_players():
+        opponent_card = player.get_god_card()
+        if player is not state.current_player and opponent_card \
+                and not opponent_card.opponent_move_filter(worker, origin, cell):
+            return f"{opponent_card.name} {opponent_card.opponent_move_rule}"
+    return "That cell is not a valid move target."
+
+
+def _find_worker(state: EngineState, worker_id: Optional[int]) -> Optional[Worker]:
+    for player in state.game.get_players():
+        worker = player.get_worker_by_id(worker_id)
+        if worker:
+            return worker
+    return None
+
+
+def _target_cell(state: EngineState, action: EngineAction) -> Cell:
+    cell = state.game.get_board().get_cell(Coordinate(action.row, action.col))
+    if cell is None:
+        raise IllegalActionError("Invalid Target", "That cell is not on the board.")
+    return cell
+
+
+def _god_name(player: Player) -> str:
+    god_card = player.get_god_card()
+    return god_card.name if god_card else player.name
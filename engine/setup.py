@@ -0,0 +1,61 @@
+from __future__ import annotations
+import random
+from typing import List, Optional, Sequence
+
+from models.game import Game
+from models.god_card import GOD_CARDS, GodCard, create_god_card
+from models.player import Player
+from models.worker import Worker
+from utils.constants import DEFAULT_BOARD_SIZE
+
+
+def create_game(
+    player_names: Sequence[str] = ("Player 1", "Player 2"),
+    board_size: int = DEFAULT_BOARD_SIZE,
+    god_cards: Optional[List[GodCard]] = None,
+    rng: Optional[random.Random] = None,
+) -> Game:
+    """
+    Create a ready-to-play game the same way the setup screen does:
+    two players, two random registered god cards and randomly placed workers.
+    """
+    rng = rng or random.Random()
+    players = [Player(name) for name in player_names]
+    game = Game(players=players, board_size=board_size)
+
+    if god_cards is None:
+        god_cards = [create_god_card(name) for name in GOD_CARDS]
+        rng.shuffle(god_cards)
+        god_cards = god_cards[:2]
+    game.initialize_game(god_cards)
+
+    place_workers_randomly(game, rng)
+    return game
+
+
+def place_workers_randomly(game: Game, rng: Optional[random.Random] = None) -> None:
+    """Randomly place two new workers per player on ground-level cells"""
+    rng = rng or random.Random()
+    board = game.get_board()
+    available_coords = []
+
+    # Get all ground-level coordinates
+    for coord, cell in board.grid.items():
+        if cell.level == 0:
+            available_coords.append(coord)
+
+    # Shuffle coordinates
+    rng.shuffle(available_coords)
+
+    # Place workers
+    worker_id = 1
+    for player in game.get_players():
+        for _ in range(1, 3):  # Each player gets 2 workers
+            if not available_coords:
+                raise ValueError("Not enough space to place all workers")
+
+            coord = available_coords.pop()
+            cell = board.get_cell(coord)
+            worker = Worker(id=worker_id, position=cell, player=player)
+            player.add_worker(worker)
+            worker_id += 1
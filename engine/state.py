@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import List, NamedTuple, Optional, TYPE_CHECKING
+
+from controllers.game_manager import GameManager
+from utils.enums import ActionType, EventType, TurnPhase
+
+if TYPE_CHECKING:
+    from models.cell import Cell
+    from models.game import Game
+    from models.player import Player
+    from models.worker import Worker
+
+
+class EngineAction(NamedTuple):
+    """A single input to the engine: select a worker, move, build or end the turn"""
+    action_type: ActionType
+    worker_id: Optional[int] = None
+    row: Optional[int] = None
+    col: Optional[int] = None
+    dome: bool = False  # A build that caps the tower with a dome at any height (Atlas)
+
+    @classmethod
+    def select_worker(cls, worker_id: int) -> EngineAction:
+        return cls(ActionType.SELECT_WORKER, worker_id=worker_id)
+
+    @classmethod
+    def move_to(cls, row: int, col: int) -> EngineAction:
+        return cls(ActionType.MOVE, row=row, col=col)
+
+    @classmethod
+    def build_on(cls, row: int, col: int, dome: bool = False) -> EngineAction:
+        return cls(ActionType.BUILD, row=row, col=col, dome=dome)
+
+    @classmethod
+    def end_turn(cls) -> EngineAction:
+        return cls(ActionType.END_TURN)
+
+    def __str__(self):
+        if self.action_type == ActionType.SELECT_WORKER:
+            return f"SelectWorker({self.worker_id})"
+        if self.action_type == ActionType.END_TURN:
+            return "EndTurn"
+        if self.dome:
+            return f"BuildDome({self.row}, {self.col})"
+        return f"{self.action_type.name.capitalize()}({self.row}, {self.col})"
+
+
+class EngineEvent(NamedTuple):
+    """Something the engine reports back after applying an action"""
+    event_type: EventType
+    message: str = ""
+
+
+class IllegalActionError(ValueError):
+    """Raised when an action is not legal in the current state"""
+
+    def __init__(self, title: str, message: str):
+        super().__init__(message)
+        self.title = title
+
+
+class UndoRecord:
+    """
+    What undo needs to take back one applied action, kept as plain fields.
+    EngineState reuses records once they are undone, so a search that
+    applies and undoes actions needs one record per depth, not one per node.
+    """
+
+    __slots__ = (
+        # Turn bookkeeping, filled by EngineState.save_turn
+        "current_player", "turn_phase", "selected_worker", "has_moved", "has_built",
+        "move_count", "build_count", "previous_move_cell", "first_build_cell",
+        "visited_cells", "visited_count", "winner",
+        # GameManager state, filled by GameManager.save_status
+        "player_index", "game_status", "status", "game_winner", "hidden_cells_revealed",
+        # The executed MoveAction/BuildAction, and god-card flags from before the turn ended
+        "model_action", "god_player", "god_flags",
+    )
+
+    def __init__(self):
+        self.model_action = None
+        self.god_player: Optional[Player] = None
+        self.god_flags: tuple = ()
+
+
+class EngineState:
+    """
+    Everything needed to run a game without a UI: the Game object graph,
+    its GameManager, and the turn bookkeeping GameBoardScreen used to hold.
+    """
+
+    def __init__(self, game: Game, game_manager: Optional[GameManager] = None):
+        self.game: Game = game
+        self.game_manager: GameManager = game_manager or GameManager(game)
+        self.winner: Optional[Player] = None
+
+        # Turn state management
+        self.current_player: Player = self.game_manager.get_current_player()
+        self.turn_phase: TurnPhase = TurnPhase.WORKER_SELECTION
+        self.selected_worker: Optional[Worker] = None
+
+        # Action tracking for god powers
+        self.has_moved = False
+        self.has_built = False
+        self.move_count = 0
+        self.build_count = 0
+        self.previous_move_cell: Optional[Cell] = None
+        self.first_build_cell: Optional[Cell] = None
+        self.visited_cells: List[Cell] = []  # Cells the selected worker stood on this turn
+
+        # One undo record per applied action, newest last, and undone records kept for reuse
+        self.history: List[UndoRecord] = []
+        self.spare_records: List[UndoRecord] = []
+
+    def reset_turn(self) -> None:
+        """Clear the per-turn bookkeeping for the player now on turn"""
+        self.current_player = self.game_manager.get_current_player()
+        self.turn_phase = TurnPhase.WORKER_SELECTION
+        self.selected_worker = None
+        self.has_moved = False
+        self.has_built = False
+        self.move_count = 0
+        self.build_count = 0
+        self.previous_move_cell = None
+        self.first_build_cell = None
+        self.visited_cells = []
+
+    def push_record(self) -> UndoRecord:
+        """Start the undo record of an action about to be applied, reusing an undone one if there is any"""
+        record = self.spare_records.pop() if self.spare_records else UndoRecord()
+        self.save_turn(record)
+        self.game_manager.save_status(record)
+        self.history.append(record)
+        return record
+
+    def release_record(self, record: UndoRecord) -> None:
+        """Keep an undone record for the next action, without holding on to what it pointed at"""
+        record.model_action = None
+        record.god_player = None
+        record.god_flags = ()
+        self.spare_records.append(record)
+
+    def save_turn(self, record: UndoRecord) -> None:
+        """Capture the turn bookkeeping for undo"""
+        record.current_player = self.current_player
+        record.turn_phase = self.turn_phase
+        record.selected_worker = self.selected_worker
+        record.has_moved = self.has_moved
+        record.has_built = self.has_built
+        record.move_count = self.move_count
+        record.build_count = self.build_count
+        record.previous_move_cell = self.previous_move_cell
+        record.first_build_cell = self.first_build_cell
+        record.visited_cells = self.visited_cells
+        record.visited_count = len(self.visited_cells)
+        record.winner = self.winner
+
+    def restore_turn(self, record: UndoRecord) -> None:
+        """Restore turn bookkeeping captured with save_turn"""
+        self.current_player = record.current_player
+        self.turn_phase = record.turn_phase
+        self.selected_worker = record.selected_worker
+        self.has_moved = record.has_moved
+        self.has_built = record.has_built
+        self.move_count = record.move_count
+        self.build_count = record.build_count
+        self.previous_move_cell = record.previous_move_cell
+        self.first_build_cell = record.first_build_cell
+        del record.visited_cells[record.visited_count:]
+        self.visited_cells = record.visited_cells
+        self.winner = record.winner
+
+    def get_opponent(self, player: Player) -> Player:
+        """Return the other player"""
+        return [p for p in self.game.get_players() if p is not player][0]
@@ -0,0 +1,188 @@
+"""
+Board symmetries and canonical positions.
+
+A square board has 8 symmetries (the dihedral group: 4 rotations, each with
+or without a mirror). Santorini's rules, including Triton's perimeter rule,
+look the same under all of them, so positions that map onto each other can
+share one cache, opening-book or dataset entry:
+
+    canonical, transform = canonicalise(bitboard)
+    turn = map_turn(canonical_turn, inverse(transform), rows, cols)  # back to the real board
+
+Non-square boards keep the 4 symmetries that preserve their shape.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import List, Tuple
+
+from engine.bitboard import BitBoard
+from engine.turns import DOME, Turn
+from utils.grid import iter_bits, to_index, to_row_col
+
+IDENTITY = 0
+
+# Transforms of (row, col) on an n x n board, in a fixed order; index = transform id
+_TRANSFORMS = (
+    lambda r, c, n: (r, c),                  # identity
+    lambda r, c, n: (c, n - 1 - r),          # rotate 90 degrees clockwise
+    lambda r, c, n: (n - 1 - r, n - 1 - c),  # rotate 180 degrees
+    lambda r, c, n: (n - 1 - c, r),          # rotate 270 degrees clockwise
+    lambda r, c, n: (r, n - 1 - c),          # mirror left-right
+    lambda r, c, n: (n - 1 - r, c),          # mirror top-bottom
+    lambda r, c, n: (c, r),                  # mirror on the main diagonal
+    lambda r, c, n: (n - 1 - c, n - 1 - r),  # mirror on the anti-diagonal
+)
+_RECTANGLE_TRANSFORMS = (0, 2, 4, 5)  # The ones that keep rows and cols apart
+
+
+@lru_cache(maxsize=None)
+def transforms(rows: int, cols: int) -> Tuple[int, ...]:
+    """Ids of the symmetries of a rows x cols board"""
+    return tuple(range(len(_TRANSFORMS))) if rows == cols else _RECTANGLE_TRANSFORMS
+
+
+@lru_cache(maxsize=None)
+def square_maps(rows: int, cols: int) -> Tuple[Tuple[int, ...], ...]:
+    """square_maps(rows, cols)[t][square] is where transform t sends square"""
+    maps = []
+    for transform in range(len(_TRANSFORMS)):
+        if transform not in transforms(rows, cols):
+            maps.append(())
+            continue
+        mapping = []
+        for square in range(rows * cols):
+            row, col = to_row_col(square, cols)
+            if rows == cols:
+                new_row, new_col = _TRANSFORMS[transform](row, col, rows)
+            else:
+                # Mirrors of a rectangle flip rows and columns by their own lengths
+                new_row = rows - 1 - row if transform in (2, 5) else row
+                new_col = cols - 1 - col if transform in (2, 4) else col
+            mapping.append(to_index(new_row, new_col, cols))
+        maps.append(tuple(mapping))
+    return tuple(maps)
+
+
+@lru_cache(maxsize=None)
+def _inverses() -> Tuple[int, ...]:
+    inverses = []
+    for transform in range(len(_TRANSFORMS)):
+        for candidate in range(len(_TRANSFORMS)):
+            if all(_TRANSFORMS[candidate](*_TRANSFORMS[transform](r, c, 5), 5) == (r, c)
+                   for r in range(5) for c in range(5)):
+                inverses.append(candidate)
+                break
+    return tuple(inverses)
+
+
+def inverse(transform: int) -> int:
+    """The transform that undoes the given one"""
+    return _inverses()[transform]
+
+
+@lru_cache(maxsize=None)
+def _byte_tables(rows: int, cols: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """Per transform and byte of a mask, the transformed bits of every byte value"""
+    maps = square_maps(rows, cols)
+    byte_count = (rows * cols + 7) // 8
+    tables = []
+    for mapping in maps:
+        if not mapping:
+            tables.append(())
+            continue
+        per_byte = []
+        for byte in range(byte_count):
+            values = []
+            for value in range(256):
+                mask = 0
+                for bit in iter_bits(value):
+                    square = byte * 8 + bit
+                    if square < len(mapping):
+                        mask |= 1 << mapping[square]
+                values.append(mask)
+            per_byte.append(tuple(values))
+        tables.append(tuple(per_byte))
+    return tuple(tables)
+
+
+def transform_mask(mask: int, transform: int, rows: int, cols: int) -> int:
+    """Move every set bit of a mask to its transformed square"""
+    result = 0
+    for values in _byte_tables(rows, cols)[transform]:
+        if not mask:
+            break
+        result |= values[mask & 0xFF]
+        mask >>= 8
+    return result
+
+
+def transform_square(square: int, transform: int, rows: int, cols: int) -> int:
+    return square_maps(rows, cols)[transform][square]
+
+
+def transform_board(board: BitBoard, transform: int) -> BitBoard:
+    """A copy of the bitboard with every cell moved by the transform; worker order is kept"""
+    rows, cols = board.rows, board.cols
+    mapping = square_maps(rows, cols)[transform]
+    result = board.copy()
+    result.levels = [transform_mask(mask, transform, rows, cols) for mask in board.levels]
+    result.domes = transform_mask(board.domes, transform, rows, cols)
+    result.workers = [transform_mask(mask, transform, rows, cols) for mask in board.workers]
+    result.worker_squares = [[mapping[square] for square in squares] for squares in board.worker_squares]
+    result.hidden = transform_mask(board.hidden, transform, rows, cols)
+    result.revealed = transform_mask(board.revealed, transform, rows, cols)
+    return result
+
+
+def _signature(board: BitBoard, transform: int) -> Tuple[int, ...]:
+    rows, cols = board.rows, board.cols
+    return (*(transform_mask(mask, transform, rows, cols) for mask in board.levels),
+            transform_mask(board.domes, transform, rows, cols),
+            *(transform_mask(mask, transform, rows, cols) for mask in board.workers),
+            transform_mask(board.hidden, transform, rows, cols),
+            transform_mask(board.revealed, transform, rows, cols))
+
+
+def canonical_transform(board: BitBoard) -> int:
+    """
+    The transform giving the smallest image of the position (compared on tower
+    levels, domes, worker occupancy and hidden cells); the lowest id wins ties.
+    """
+    best, best_signature = IDENTITY, None
+    for transform in transforms(board.rows, board.cols):
+        signature = _signature(board, transform)
+        if best_signature is None or signature < best_signature:
+            best, best_signature = transform, signature
+    return best
+
+
+def canonicalise(board: BitBoard) -> Tuple[BitBoard, int]:
+    """
+    The canonical representative of a position and the transform that produced
+    it. Apply inverse(transform) to squares or turns of the canonical board to
+    get them on the original board.
+    """
+    transform = canonical_transform(board)
+    if transform == IDENTITY:
+        return board.copy(), IDENTITY
+    return transform_board(board, transform), transform
+
+
+def map_turn(turn: Turn, transform: int, rows: int, cols: int) -> Turn:
+    """A turn with its squares moved by the transform"""
+    mapping = square_maps(rows, cols)[transform]
+    return turn._replace(path=tuple(mapping[square] for square in turn.path),
+                         builds=tuple(mapping[build & ~DOME] | build & DOME for build in turn.builds),
+                         push=mapping[turn.push] if turn.push >= 0 else -1)
+
+
+def symmetric_images(board: BitBoard) -> List[BitBoard]:
+    """Every distinct image of a position under the board's symmetries"""
+    images = []
+    seen = set()
+    for transform in transforms(board.rows, board.cols):
+        signature = _signature(board, transform)
+        if signature not in seen:
+            seen.add(signature)
+            images.append(transform_board(board, transform))
+    return images
@@ -0,0 +1,218 @@
+"""
+Self-play tournament runner for god-card balance studies.
+
+Plays many headless games across all CPU cores. Every game has its own seed,
+which fixes the god cards, worker placement, hidden cells and any random agent,
+so a single game can be replayed with --first-game N --games 1. Results are
+streamed to a JSON-lines file as games finish and summarised per board size
+and god pairing at the end. With --record the moves of every game are also
+appended to a binary archive (see engine.records).
+
+    python -m engine.tournament --games 10000 --sizes 4 5 6 --out results.jsonl
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from engine.ai import AlphaBetaPlayer
+from engine.mcts import MCTSPlayer
+from engine.records import GameRecorder, RecordWriter
+from engine.rules import apply, create_state, declare_draw, is_terminal, legal_actions
+from engine.setup import create_game
+from engine.turns import SearchPosition, turn_to_actions
+from utils.enums import TurnPhase
+
+AGENTS = ("random", "alphabeta", "mcts")
+
+
+class GameSpec(NamedTuple):
+    """Everything a worker process needs to play one game"""
+    index: int
+    seed: int
+    board_size: int
+    agents: tuple
+    depth: int
+    iterations: int
+    max_turns: int
+    record: bool = False
+
+
+def play_game(spec: GameSpec) -> dict:
+    """Play one seeded game to the end and describe the result"""
+    rng = random.Random(spec.seed)
+    game = create_game(board_size=spec.board_size, rng=rng)
+    state = create_state(game, rng=rng)
+    players = game.get_players()
+    buffer = _RecordBuffer()
+    if spec.record:
+        state.game_manager.recorder = GameRecorder(buffer, game)
+    searchers = [_make_searcher(agent, spec, side) for side, agent in enumerate(spec.agents)]
+
+    turns = 0
+    start = time.perf_counter()
+    while not is_terminal(state):
+        if state.turn_phase == TurnPhase.WORKER_SELECTION:
+            turns += 1
+            if turns > spec.max_turns:
+                declare_draw(state)
+                break
+            searcher = searchers[state.game_manager.current_player_index]
+            if isinstance(searcher, MCTSPlayer):
+                search_result = searcher.search(SearchPosition.from_state(state), iterations=spec.iterations)
+            elif searcher:
+                search_result = searcher.search(SearchPosition.from_state(state), max_depth=spec.depth)
+            if searcher:
+                for action in turn_to_actions(state, search_result.turn):
+                    apply(state, action)
+                continue
+        apply(state, rng.choice(legal_actions(state)))
+
+    winner = players.index(state.winner) if state.winner else None
+    result = {
+        "game": spec.index,
+        "seed": spec.seed,
+        "board_size": spec.board_size,
+        "gods": [player.get_god_card().name for player in players],
+        "agents": list(spec.agents),
+        "winner": winner,
+        "winner_god": players[winner].get_god_card().name if winner is not None else None,
+        "turns": turns,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+    if spec.record:
+        result["record"] = buffer.body
+    return result
+
+
+class _RecordBuffer:
+    """Stands in for a RecordWriter in worker processes; the main process writes the archive"""
+
+    def __init__(self):
+        self.body = b""
+
+    def write_game(self, body: bytes) -> None:
+        self.body = body
+
+
+def _make_searcher(agent: str, spec: GameSpec, side: int):
+    """Search player for an agent name; fixed depths and iteration counts keep games reproducible"""
+    if agent == "alphabeta":
+        return AlphaBetaPlayer(max_depth=spec.depth, table_size_mb=4)
+    if agent == "mcts":
+        return MCTSPlayer(rng=random.Random(spec.seed * 2 + side))
+    return None
+
+
+def game_specs(args) -> Iterator[GameSpec]:
+    """Specs for the requested games; board sizes rotate with the game index"""
+    for index in range(args.first_game, args.first_game + args.games):
+        yield GameSpec(
+            index=index,
+            seed=args.seed * 1_000_003 + index,
+            board_size=args.sizes[index % len(args.sizes)],
+            agents=(args.agent1, args.agent2),
+            depth=args.depth,
+            iterations=args.iterations,
+            max_turns=args.max_turns,
+            record=args.record is not None,
+        )
+
+
+def run_tournament(specs: Iterable[GameSpec], workers: Optional[int] = None) -> Iterator[dict]:
+    """Play games on a process pool, yielding results in completion order"""
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4  # Keep the queue short so huge runs don't pile up futures
+    specs = iter(specs)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for spec in specs:
+            pending.add(pool.submit(play_game, spec))
+            if len(pending) >= max_in_flight:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                spec = next(specs, None)
+                if spec is not None:
+                    pending.add(pool.submit(play_game, spec))
+
+
+class Standings:
+    """Win counts per board size and god pairing"""
+
+    def __init__(self):
+        # (board size, god A, god B) with A <= B -> [games, wins for A, wins for B, draws]
+        self.pairings: Dict[tuple, List[int]] = defaultdict(lambda: [0, 0, 0, 0])
+        self.games = 0
+
+    def add(self, result: dict) -> None:
+        self.games += 1
+        first, second = result["gods"]
+        key = (result["board_size"], *sorted((first, second)))
+        counts = self.pairings[key]
+        counts[0] += 1
+        if result["winner_god"] is None:
+            counts[3] += 1
+        elif result["winner_god"] == key[1]:
+            counts[1] += 1
+        else:
+            counts[2] += 1
+
+    def report(self) -> str:
+        lines = [f"{'size':>4}  {'pairing':<22} {'games':>7} {'win A':>7} {'win B':>7} {'draw':>6}"]
+        for (size, god_a, god_b), (games, wins_a, wins_b, draws) in sorted(self.pairings.items()):
+            lines.append(f"{size:>4}  {god_a + ' v ' + god_b:<22} {games:>7} "
+                         f"{100 * wins_a / games:>6.1f}% {100 * wins_b / games:>6.1f}% {draws:>6}")
+        return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--first-game", type=int, default=0, help="index of the first game, for replays or resuming")
+    parser.add_argument("--seed", type=int, default=0, help="tournament seed; game seeds derive from it")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5], choices=[4, 5, 6])
+    parser.add_argument("--agent1", choices=AGENTS, default="random")
+    parser.add_argument("--agent2", choices=AGENTS, default="random")
+    parser.add_argument("--depth", type=int, default=2, help="search depth for alphabeta agents")
+    parser.add_argument("--iterations", type=int, default=200, help="search iterations for mcts agents")
+    parser.add_argument("--max-turns", type=int, default=300, help="declare a draw after this many turns")
+    parser.add_argument("--record", default=None, help="binary archive the moves of every game are appended to")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--out", default="tournament_results.jsonl", help="JSON-lines file results are appended to")
+    args = parser.parse_args(argv)
+
+    standings = Standings()
+    start = time.perf_counter()
+    # The archive is closed (header and game count written) even if the run is interrupted
+    with open(args.out, "a", encoding="utf-8") as out, \
+            (RecordWriter(args.record) if args.record else nullcontext()) as writer:
+        for result in run_tournament(game_specs(args), args.workers):
+            record = result.pop("record", None)
+            if writer is not None:
+                writer.write_game(record)
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            standings.add(result)
+            if standings.games % 100 == 0:
+                elapsed = time.perf_counter() - start
+                print(f"{standings.games}/{args.games} games, {standings.games / elapsed:.1f} games/sec",
+                      file=sys.stderr)
+
+    print(standings.report())
+    elapsed = time.perf_counter() - start
+    print(f"{standings.games} games in {elapsed:.1f}s ({standings.games * 3600 / elapsed:.0f} games/hour)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
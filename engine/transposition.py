@@ -0,0 +1,112 @@
+from __future__ import annotations
+from array import array
+from typing import NamedTuple, Optional
+
+ENTRY_BYTES = 16  # One 64-bit key and one 64-bit packed data word
+SLOTS_PER_BUCKET = 2  # Slot 0 is depth-preferred, slot 1 is always-replace
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+NO_MOVE = 0xFFFF
+
+# Layout of the packed data word
+_SCORE_OFFSET = 1 << 31
+_DEPTH_SHIFT = 32
+_FLAG_SHIFT = 40
+_MOVE_SHIFT = 42
+_AGE_SHIFT = 58
+_AGE_MASK = 0x3F
+
+
+class TableEntry(NamedTuple):
+    """What a probe found for a position"""
+    depth: int
+    score: int
+    flag: int
+    move: int  # Index into the position's generated turns, or NO_MOVE
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results keyed by 64-bit Zobrist position keys.
+    Storage is two flat arrays allocated up front from a megabyte budget, so memory
+    stays flat however long the analysis runs. Each bucket has a depth-preferred
+    slot and an always-replace slot; entries from older searches are replaced first.
+    """
+
+    def __init__(self, size_mb: float = 16):
+        num_entries = max(SLOTS_PER_BUCKET, int(size_mb * (1 << 20)) // ENTRY_BYTES)
+        self.num_buckets: int = num_entries // SLOTS_PER_BUCKET
+        self.keys = array("Q", bytes(8 * self.num_buckets * SLOTS_PER_BUCKET))
+        self.data = array("Q", bytes(8 * self.num_buckets * SLOTS_PER_BUCKET))
+        self.age: int = 0
+
+        self.probes = 0
+        self.hits = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self.keys.itemsize * len(self.keys) + self.data.itemsize * len(self.data)
+
+    def new_search(self) -> None:
+        """Mark existing entries as older than anything stored from now on"""
+        self.age = (self.age + 1) & _AGE_MASK
+
+    def clear(self) -> None:
+        """Empty the table, keeping its size"""
+        empty = array("Q", bytes(8 * len(self.keys)))
+        self.keys[:] = empty
+        self.data[:] = empty
+        self.age = 0
+
+    def probe(self, key: int) -> Optional[TableEntry]:
+        """Return the stored entry for a position key, if any"""
+        self.probes += 1
+        slot = (key % self.num_buckets) * SLOTS_PER_BUCKET
+        keys = self.keys
+        if keys[slot] != key:
+            slot += 1
+            if keys[slot] != key:
+                return None
+        packed = self.data[slot]
+        if not packed:
+            return None
+        self.hits += 1
+        return TableEntry(
+            packed >> _DEPTH_SHIFT & 0xFF,
+            (packed & 0xFFFFFFFF) - _SCORE_OFFSET,
+            packed >> _FLAG_SHIFT & 0x3,
+            packed >> _MOVE_SHIFT & 0xFFFF,
+        )
+
+    def store(self, key: int, depth: int, score: int, flag: int, move: int = NO_MOVE) -> None:
+        """Record a search result, keeping deep current entries in the depth-preferred slot"""
+        packed = ((score + _SCORE_OFFSET)
+                  | min(depth, 0xFF) << _DEPTH_SHIFT
+                  | flag << _FLAG_SHIFT
+                  | (move & 0xFFFF) << _MOVE_SHIFT
+                  | self.age << _AGE_SHIFT)
+
+        slot = (key % self.num_buckets) * SLOTS_PER_BUCKET
+        resident = self.data[slot]
+        if (self.keys[slot] == key
+                or not resident
+                or (resident >> _AGE_SHIFT & _AGE_MASK) != self.age
+                or depth >= (resident >> _DEPTH_SHIFT & 0xFF)):
+            self.keys[slot] = key
+            self.data[slot] = packed
+        else:
+            self.keys[slot + 1] = key
+            self.data[slot + 1] = packed
+
+    def hashfull(self) -> int:
+        """Permille of depth-preferred slots used by the current search, sampled from the first 1000 buckets"""
+        sample = min(1000, self.num_buckets)
+        used = 0
+        for bucket in range(sample):
+            packed = self.data[bucket * SLOTS_PER_BUCKET]
+            if packed and (packed >> _AGE_SHIFT & _AGE_MASK) == self.age:
+                used += 1
+        return used * 1000 // sample
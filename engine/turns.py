@@ -0,0 +1,384 @@
+from __future__ import annotations
+from contextlib import closing
+from typing import Iterator, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from engine.bitboard import BitBoard
+from engine.state import EngineAction
+from models.zobrist import get_zobrist_table
+from utils.constants import MAXIMUM_TOWER_LEVEL
+from utils.enums import TurnPhase
+from utils.grid import iter_bits, to_row_col
+
+if TYPE_CHECKING:
+    from engine.state import EngineState
+
+
+# Or'd into a square in Turn.builds: a dome built below level 3 (Atlas).
+# Boards have at most 36 cells, so squares never reach this bit.
+DOME = 1 << 6
+_SQUARE = DOME - 1
+
+
+class Turn(NamedTuple):
+    """A complete turn: one worker's moves followed by its builds"""
+    worker: int  # Index into the player's workers
+    path: Tuple[int, ...]  # Squares moved to, in order
+    builds: Tuple[int, ...]  # Squares built on, in order, with DOME set for a dome below level 3
+    reveal: bool = False  # The last move revealed a hidden cell
+    wins: bool = False  # The last move climbed to level 3, or won by the mover's god card
+    push: int = -1  # Where the opponent's worker on the final square goes (Apollo, Minotaur)
+    builds_first: int = 0  # How many of the builds come before the moves (Prometheus)
+
+
+class SearchPosition:
+    """
+    A position at the start of a turn, on a bitboard, with just enough god-card
+    and hidden-cell information to generate complete turns the way the engine plays them.
+    key is the same Zobrist key Board.position_key holds for this position.
+    """
+
+    def __init__(self, board: BitBoard, side: int, gods: Tuple[Optional[str], ...], reveals_left: int,
+                 athena_climbed: bool = False):
+        self.board: BitBoard = board
+        self.side: int = side
+        self.gods: Tuple[Optional[str], ...] = gods
+        self.reveals_left: int = reveals_left
+        self.athena_climbed: bool = athena_climbed  # Athena moved up on her last turn
+        self.zobrist = get_zobrist_table(board.rows, board.cols)
+        self.key: int = position_key(self)
+        self._key_history: List[Tuple[int, bool]] = []
+
+    @classmethod
+    def from_state(cls, state: EngineState) -> SearchPosition:
+        """Capture an engine state; only valid at the start of a turn"""
+        if state.turn_phase != TurnPhase.WORKER_SELECTION:
+            raise ValueError("Search positions can only be taken at the start of a turn")
+        players = state.game.get_players()
+        manager = state.game_manager
+        gods = tuple(god_key(player.get_god_card()) for player in players)
+        return cls(
+            BitBoard.from_board(state.game.get_board(), players),
+            manager.current_player_index,
+            gods,
+            manager.max_hidden_reveals - manager.hidden_cells_revealed,
+            any(god == "Athena" and player.get_god_card().climbed for god, player in zip(gods, players)),
+        )
+
+    def copy(self) -> SearchPosition:
+        return SearchPosition(self.board.copy(), self.side, self.gods, self.reveals_left, self.athena_climbed)
+
+    def climb_blocked(self) -> bool:
+        """Whether the side to move may not move up, because an opposing Athena did last turn"""
+        return self.athena_climbed and self.gods[self.side ^ 1] == "Athena"
+
+    def make(self, turn: Turn) -> int:
+        """Play a turn in place and return the square the worker started from"""
+        board = self.board
+        zobrist = self.zobrist
+        final = turn.path[-1]
+        key = self.key
+        self._key_history.append((key, self.athena_climbed))
+
+        if turn.push >= 0:
+            other = self.side ^ 1
+            board.move_worker(other, board.worker_squares[other].index(final), turn.push)
+            other_keys = zobrist.workers[other]
+            key ^= other_keys[final] ^ other_keys[turn.push]
+        origin = board.move_worker(self.side, turn.worker, final)
+        worker_keys = zobrist.workers[self.side]
+        key ^= worker_keys[origin] ^ worker_keys[final]
+        if self.gods[self.side] == "Athena":
+            climbed = board.height(final) > board.height(origin)
+            if climbed != self.athena_climbed:
+                self.athena_climbed = climbed
+                key ^= zobrist.athena_climbed
+        if turn.reveal:
+            board.revealed |= 1 << final
+            self.reveals_left -= 1
+            key ^= zobrist.revealed[final]
+        for build in turn.builds:
+            square = build & _SQUARE
+            key ^= self._tower_key(square)
+            if build & DOME:
+                board.build_dome(square)
+            else:
+                board.build(square)
+            key ^= self._tower_key(square)
+        side_keys = zobrist.side_to_move
+        key ^= side_keys[self.side] ^ side_keys[self.side ^ 1]
+        self.side ^= 1
+
+        self.key = key
+        return origin
+
+    def unmake(self, turn: Turn, origin: int) -> None:
+        """Take back a turn played with make"""
+        self.key, self.athena_climbed = self._key_history.pop()
+        self.side ^= 1
+        board = self.board
+        for build in reversed(turn.builds):
+            board.unbuild(build & _SQUARE)
+        final = turn.path[-1]
+        if turn.reveal:
+            board.revealed ^= 1 << final
+            self.reveals_left += 1
+        board.move_worker(self.side, turn.worker, origin)
+        if turn.push >= 0:
+            other = self.side ^ 1
+            board.move_worker(other, board.worker_squares[other].index(turn.push), final)
+
+
+    def _tower_key(self, square: int) -> int:
+        board = self.board
+        return self.zobrist.tower_key(square, board.height(square), bool(board.domes >> square & 1))
+
+
+def position_key(position: SearchPosition) -> int:
+    """Hash a search position from scratch, matching Board.compute_position_key at the start of a turn"""
+    board = position.board
+    zobrist = position.zobrist
+    key = zobrist.side_to_move[position.side]
+    for square in range(board.rows * board.cols):
+        height = board.height(square)
+        has_dome = bool(board.domes >> square & 1)
+        if height or has_dome:
+            key ^= zobrist.tower_key(square, height, has_dome)
+    for player, squares in enumerate(board.worker_squares):
+        for square in squares:
+            key ^= zobrist.workers[player][square]
+    for square in iter_bits(board.revealed):
+        key ^= zobrist.revealed[square]
+    if position.athena_climbed:
+        key ^= zobrist.athena_climbed
+    return key
+
+
+# God powers turn generation knows about, by card name
+TURN_GODS = frozenset(("Artemis", "Demeter", "Triton", "Apollo", "Minotaur", "Atlas",
+                       "Hephaestus", "Pan", "Prometheus", "Athena", "Hermes"))
+
+
+def god_key(god_card) -> Optional[str]:
+    """Name of the god powers turn generation knows about"""
+    if god_card is not None and god_card.name in TURN_GODS:
+        return god_card.name
+    return None
+
+
+def generate_turns(position: SearchPosition) -> List[Turn]:
+    """All distinct complete turns for the side to move, as iter_turns yields them"""
+    return list(iter_turns(position))
+
+
+def has_turn(position: SearchPosition) -> bool:
+    """Whether the side to move has any turn at all; stops at the first one"""
+    with closing(iter_turns(position)) as turns:
+        return next(turns, None) is not None
+
+
+def iter_turns(position: SearchPosition) -> Iterator[Turn]:
+    """
+    Yield every distinct complete turn for the side to move. Turns that leave the
+    same worker on the same square with the same builds are generated once.
+    Continuations are forced exactly as in the engine: Artemis moves twice and
+    Triton keeps moving while it lands on the perimeter, in both cases never
+    returning to a cell already visited this turn, Demeter builds twice and
+    Hephaestus builds a second block on his first whenever it is below level 2.
+    Each other god only adds targets to, or takes them from, these masks.
+
+    The position is mid-turn while the generator is suspended, so a caller
+    that stops early must close it (contextlib.closing) before using the
+    position again; closing puts every worker and block back.
+    """
+    board = position.board
+    side = position.side
+    god = position.gods[side]
+    no_climb = position.climb_blocked()
+
+    for worker, origin in enumerate(board.worker_squares[side]):
+        targets = _move_targets(position, god, origin, no_climb)
+        if targets:
+            finals = set()
+            yield from _extend_moves(position, god, worker, origin, targets, (), 1 << origin, finals)
+            if god == "Prometheus":
+                yield from _extend_builds_first(position, worker, origin)
+
+
+def _move_targets(position: SearchPosition, god: Optional[str], square: int, no_climb: bool) -> int:
+    """Mask of the cells a worker on the square may move to, with its god's extra targets and Athena's block"""
+    board = position.board
+    targets = board.move_targets(square)
+    height = board.height(square)
+    if god == "Apollo" or god == "Minotaur":
+        targets |= _displace_targets(board, god, position.side, square, height)
+    elif god == "Hermes":
+        targets |= _hermes_targets(board, square, height)
+    if no_climb:
+        targets &= ~_above(board, height)
+    return targets
+
+
+def _above(board: BitBoard, height: int) -> int:
+    """Mask of the cells whose tower is higher than this"""
+    return board.levels[height] if height < MAXIMUM_TOWER_LEVEL else 0
+
+
+def _displace_targets(board: BitBoard, god: str, side: int, square: int, height: int) -> int:
+    """
+    Adjacent opponents' cells within climbing reach that Apollo may swap with
+    (leaving him a cell to build on) or Minotaur may push into a free cell
+    """
+    candidates = board.neighbours[square] & board.workers[side ^ 1] & ~_above(board, height + 1)
+    if not candidates:
+        return 0
+    targets = 0
+    if god == "Apollo":
+        for target in iter_bits(candidates):
+            if board.build_targets(target):
+                targets |= 1 << target
+    else:
+        blocked = board.occupied | board.domes
+        beyond = board.pushes[square]
+        for target in iter_bits(candidates):
+            push = beyond.get(target)
+            if push is not None and not blocked >> push & 1:
+                targets |= 1 << target
+    return targets
+
+
+def _hermes_targets(board: BitBoard, square: int, height: int) -> int:
+    """
+    Free cells of the worker's height connected to it through other such
+    cells, beyond the adjacent ones; unrevealed hidden cells end the way
+    """
+    level = board.height_mask(height) & ~(board.occupied | board.domes)
+    stop = board.hidden & ~board.revealed
+    ring = board.neighbours[square]
+    reached = frontier = ring & level
+    while frontier:
+        spread = 0
+        for cell in iter_bits(frontier & ~stop):
+            spread |= board.neighbours[cell]
+        frontier = spread & level & ~reached
+        reached |= frontier
+    return reached & ~ring
+
+
+def _extend_moves(position: SearchPosition, god: Optional[str], worker: int, square: int,
+                  targets: int, path: Tuple[int, ...], visited: int, finals: set) -> Iterator[Turn]:
+    """Depth-first walk over move sequences, yielding turns at each final square"""
+    board = position.board
+    side = position.side
+    other = side ^ 1
+    hidden = board.hidden & ~board.revealed if position.reveals_left > 0 else 0
+    opponents = board.workers[other]
+
+    for target in iter_bits(targets):
+        bit = 1 << target
+        push = -1
+        if opponents & bit:
+            # Apollo swaps places, Minotaur pushes straight on
+            push = square if god == "Apollo" else board.pushes[square][target]
+            pushed = board.worker_squares[other].index(target)
+            board.move_worker(other, pushed, push)
+        board.move_worker(side, worker, target)
+        moved = path + (target,)
+
+        try:
+            if board.is_winning_square(target) or (
+                    god == "Pan" and board.height(square) - board.height(target) >= 2):
+                if (target, False) not in finals:
+                    finals.add((target, False))
+                    yield Turn(worker, moved, (), False, True, push)
+            elif hidden & bit:
+                # Hidden cell reveals end the move phase before any god power fires
+                if (target, True) not in finals:
+                    finals.add((target, True))
+                    yield from _emit_builds(position, god, worker, target, moved, True, push)
+            else:
+                next_targets = 0
+                if (god == "Artemis" and not path) or (god == "Triton" and board.perimeter & bit):
+                    next_targets = _move_targets(position, god, target, position.climb_blocked()) & ~(visited | bit)
+                if next_targets:
+                    yield from _extend_moves(position, god, worker, target, next_targets, moved, visited | bit, finals)
+                elif (target, False) not in finals:
+                    finals.add((target, False))
+                    yield from _emit_builds(position, god, worker, target, moved, False, push)
+        finally:
+            board.move_worker(side, worker, square)
+            if push >= 0:
+                board.move_worker(other, pushed, target)
+
+
+def _emit_builds(position: SearchPosition, god: Optional[str], worker: int, square: int,
+                 path: Tuple[int, ...], reveal: bool, push: int) -> Iterator[Turn]:
+    """Yield one turn per distinct build sequence from the worker's final square"""
+    board = position.board
+    targets = board.build_targets(square)
+    for first in iter_bits(targets):
+        if god == "Demeter":
+            # Building in either order gives the same position, so only keep first < second
+            seconds = targets & ~((2 << first) - 1)
+            others = targets & ~(1 << first)
+            if others:
+                for second in iter_bits(seconds):
+                    yield Turn(worker, path, (first, second), reveal, False, push)
+                continue
+        elif god == "Hephaestus" and board.height(first) < MAXIMUM_TOWER_LEVEL - 1:
+            yield Turn(worker, path, (first, first), reveal, False, push)
+            continue
+        elif god == "Atlas" and board.height(first) < MAXIMUM_TOWER_LEVEL:
+            yield Turn(worker, path, (first | DOME,), reveal, False, push)
+        yield Turn(worker, path, (first,), reveal, False, push)
+
+
+def _extend_builds_first(position: SearchPosition, worker: int, origin: int) -> Iterator[Turn]:
+    """
+    Prometheus' turns that build before moving: any build that leaves a move
+    not going up, then such a move, then the usual build. Building on the
+    same two cells in either order gives the same position, so only one is kept.
+    """
+    board = position.board
+    side = position.side
+    hidden = board.hidden & ~board.revealed if position.reveals_left > 0 else 0
+    height = board.height(origin)
+    seen = set()
+    for first in iter_bits(board.build_targets(origin)):
+        board.build(first)
+        try:
+            for target in iter_bits(board.move_targets(origin) & ~_above(board, height)):
+                board.move_worker(side, worker, target)
+                try:
+                    reveal = bool(hidden >> target & 1)
+                    if board.is_winning_square(target):
+                        if (target, first, -1) not in seen:
+                            seen.add((target, first, -1))
+                            yield Turn(worker, (target,), (first,), False, True, -1, 1)
+                    else:
+                        for second in iter_bits(board.build_targets(target)):
+                            outcome = (target, min(first, second), max(first, second))
+                            if outcome not in seen:
+                                seen.add(outcome)
+                                yield Turn(worker, (target,), (first, second), reveal, False, -1, 1)
+                finally:
+                    board.move_worker(side, worker, origin)
+        finally:
+            board.unbuild(first)
+
+
+def turn_to_actions(state: EngineState, turn: Turn) -> List[EngineAction]:
+    """Translate a turn into the engine actions that play it"""
+    worker = state.current_player.get_workers()[turn.worker]
+    cols = state.game.get_board().cols
+    actions = [EngineAction.select_worker(worker.id)]
+    actions.extend(_build_action(build, cols) for build in turn.builds[:turn.builds_first])
+    actions.extend(EngineAction.move_to(*to_row_col(square, cols)) for square in turn.path)
+    if turn.wins:
+        return actions
+    actions.extend(_build_action(build, cols) for build in turn.builds[turn.builds_first:])
+    actions.append(EngineAction.end_turn())
+    return actions
+
+
+def _build_action(build: int, cols: int) -> EngineAction:
+    return EngineAction.build_on(*to_row_col(build & _SQUARE, cols), dome=bool(build & DOME))
@@ -1,17 +1,32 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
+
+from utils.enums import ActionType
 
 if TYPE_CHECKING:
+    from models.cell import Cell
     from models.player import Player
     from models.worker import Worker
 
 class Action(ABC):
     """Abstract base class for all player actions"""
     
+    kind: ActionType  # Set by each subclass, so callers can dispatch without isinstance
+    
+    __slots__ = ("player", "worker", "executed", "god_card_snapshot", "revealed_cell", "time_bonus",
+                 "status_snapshot")
+    
     def __init__(self, player: Player, worker: Worker):
         self.player = player
         self.worker = worker
+        
+        # Undo information, filled in when the action is executed
+        self.executed = False
+        self.god_card_snapshot: Optional[tuple] = None
+        self.revealed_cell: Optional[Cell] = None  # Set by GameManager on a hidden cell reveal
+        self.time_bonus: int = 0  # Seconds GameManager added to the player's clock
+        self.status_snapshot: Optional[tuple] = None  # GameManager state before the action
     
     @abstractmethod
     def is_valid(self) -> bool:
@@ -22,3 +37,27 @@ class Action(ABC):
     def execute(self) -> bool:
         """Execute this action"""
         pass
+    
+    @abstractmethod
+    def undo(self) -> bool:
+        """Reverse an executed action, restoring the board, clock and god-card flags"""
+        pass
+    
+    def _save_god_card(self) -> None:
+        """Remember god-card flags before the god power reacts to this action"""
+        god_card = self.player.get_god_card()
+        self.god_card_snapshot = god_card.snapshot() if god_card else None
+    
+    def _restore_god_card(self) -> None:
+        """Put back god-card flags; GameManager.undo_turn then updates the position key"""
+        god_card = self.player.get_god_card()
+        if god_card and self.god_card_snapshot is not None:
+            god_card.restore(self.god_card_snapshot)
+    
+    def _undo_reveal(self) -> None:
+        """Take back a hidden-cell reveal and its clock bonus"""
+        if self.revealed_cell:
+            self.revealed_cell.undo_reveal()
+            self.player.remaining_time_secs -= self.time_bonus
+            self.revealed_cell = None
+            self.time_bonus = 0
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from logic.actions.action import Action
+from utils.enums import ActionType
 
 if TYPE_CHECKING:
     from models.player import Player
@@ -11,9 +12,14 @@ if TYPE_CHECKING:
 class BuildAction(Action):
     """Handles the building of a tower or dome by a worker"""
     
-    def __init__(self, player: Player, worker: Worker, target_cell: Cell):
+    kind = ActionType.BUILD
+    
+    __slots__ = ("target_cell", "dome")
+    
+    def __init__(self, player: Player, worker: Worker, target_cell: Cell, dome: bool = False):
         super().__init__(player, worker)
         self.target_cell = target_cell
+        self.dome = dome  # Build a dome whatever the tower's height (Atlas)
     
     def is_valid(self) -> bool:
         """Check if the build is valid according to game rules"""
@@ -31,6 +37,11 @@ class BuildAction(Action):
         if self.target_cell.worker is not None:
             return False
         
+        # Domes below level 3 need a god card that allows them
+        if self.dome:
+            god_card = self.player.get_god_card()
+            return bool(god_card and god_card.dome_filter(self.worker, self.target_cell))
+        
         return True
     
     def execute(self) -> bool:
@@ -38,7 +49,19 @@ class BuildAction(Action):
         if not self.is_valid():
             return False
         
-        return self.worker.apply_build(self.target_cell)
+        self._save_god_card()
+        self.executed = self.worker.apply_build(self.target_cell, self.dome)
+        return self.executed
+    
+    def undo(self) -> bool:
+        """Remove the block or dome that was built and restore god-power flags"""
+        if not self.executed:
+            return False
+        
+        self.worker.remove_build(self.target_cell)
+        self._restore_god_card()
+        self.executed = False
+        return True
     
     def __str__(self):
         return f"BuildAction(Player={self.player.name}, Worker={self.worker.id}, At={self.target_cell.coordinate})"
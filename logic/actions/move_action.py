@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from logic.actions.action import Action
+from utils.enums import ActionType
 
 if TYPE_CHECKING:
     from models.player import Player
@@ -11,34 +12,73 @@ if TYPE_CHECKING:
 class MoveAction(Action):
     """Handles the movement of a worker to a valid adjacent cell"""
     
+    kind = ActionType.MOVE
+    
+    __slots__ = ("target_cell", "from_cell", "displaced_worker", "displaced_to")
+    
     def __init__(self, player: Player, worker: Worker, target_cell: Cell):
         super().__init__(player, worker)
         self.target_cell = target_cell
+        self.from_cell: Optional[Cell] = None
+        
+        # An opponent's worker moved out of the way by the god card (Apollo, Minotaur)
+        self.displaced_worker: Optional[Worker] = None
+        self.displaced_to: Optional[Cell] = None
     
     def is_valid(self) -> bool:
         """Check if the move is valid according to game rules"""
         current_cell = self.worker.get_position()
         
-        # Must be adjacent
-        if not current_cell.is_adjacent_to(self.target_cell):
-            return False
-        
-        # Must be a legal move according to board/tower rules
-        if not current_cell.can_move_to(self.target_cell):
-            return False
-        
         # Prevent no-op move (same cell)
         if self.target_cell == current_cell:
             return False
         
-        return True
+        # Must be adjacent and a legal move according to board/tower rules
+        if current_cell.is_adjacent_to(self.target_cell) and current_cell.can_move_to(self.target_cell):
+            return True
+        
+        # Otherwise only the player's god card can allow it
+        god_card = self.player.get_god_card()
+        board = current_cell.board
+        return bool(god_card and board and self.target_cell in god_card.extra_move_cells(self.worker, board))
     
     def execute(self) -> bool:
-        """Execute the move if valid"""
+        """Execute the move if valid, moving any opponent's worker out of the way first"""
         if not self.is_valid():
             return False
         
-        return self.worker.apply_move(self.target_cell)
+        self.from_cell = self.worker.get_position()
+        occupant = self.target_cell.worker
+        if occupant is not None:
+            displaced_to = self.player.get_god_card().displace(self.worker, self.from_cell, self.target_cell)
+            if displaced_to is None:
+                return False
+            self.displaced_worker, self.displaced_to = occupant, displaced_to
+            self.target_cell.remove_worker()
+        
+        self._save_god_card()
+        self.executed = self.worker.apply_move(self.target_cell)
+        if self.displaced_worker is not None:
+            self.displaced_worker.set_position(self.displaced_to)
+            self.displaced_to.assign_worker(self.displaced_worker)
+        return self.executed
+    
+    def undo(self) -> bool:
+        """Move the worker back and undo any hidden-cell reveal, displacement and god-power flags"""
+        if not self.executed:
+            return False
+        
+        self._undo_reveal()
+        if self.displaced_worker is not None:
+            self.displaced_to.remove_worker()
+        self.worker.apply_move(self.from_cell)
+        if self.displaced_worker is not None:
+            self.displaced_worker.set_position(self.target_cell)
+            self.target_cell.assign_worker(self.displaced_worker)
+            self.displaced_worker = self.displaced_to = None
+        self._restore_god_card()
+        self.executed = False
+        return True
     
     def __str__(self):
         return f"MoveAction(Player={self.player.name}, Worker={self.worker.id}, To={self.target_cell.coordinate})"
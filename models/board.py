@@ -1,15 +1,26 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 import random
 
-from models.coordinate import Coordinate
+from models.coordinate import Coordinate, coordinate_grid
 from models.cell import Cell
 from models.tower import Tower
 from models.worker import Worker
+from models.zobrist import ZobristTable, get_zobrist_table
+from utils.grid import neighbour_indices, perimeter_mask, to_index
 
 if TYPE_CHECKING:
     from models.player import Player
 
+# Hidden messages that could appear
+HIDDEN_MESSAGES = [
+    "You found an ancient blessing! +10 seconds granted.",
+    "The gods smile upon you! Time flows slower now.",
+    "A divine gift has been bestowed upon you!",
+    "The spirits of Santorini aid your cause!",
+    "Ancient magic flows through this sacred ground!"
+]
+
 class Board:
     """Represents the game board"""
     
@@ -18,15 +29,34 @@ class Board:
         self.cols: int = cols
         self.grid: Dict[Coordinate, Cell] = self._create_grid(rows, cols)
         self.hidden_cells_created: bool = False
+        
+        # Adjacency index, built once so neighbour lookups allocate nothing
+        self.cells: List[Cell] = list(self.grid.values())
+        self.neighbour_cells: List[Tuple[Cell, ...]] = [
+            tuple(self.cells[index] for index in neighbours)
+            for neighbours in neighbour_indices(rows, cols)
+        ]
+        self.perimeter_mask: int = perimeter_mask(rows, cols)
+        for index, cell in enumerate(self.cells):
+            cell.index = index
+            cell.board = self
+        
+        # Zobrist position key, kept up to date by cells, workers and the GameManager
+        self.zobrist: ZobristTable = get_zobrist_table(rows, cols)
+        self.position_key: int = 0
+        self.player_slots: Dict[Player, int] = {}
+        self.side_to_move: int = 0
+        self.pending_key: int = 0
+        
+        # Bumped whenever a worker, tower or reveal changes, which invalidates the legal-move caches
+        self.generation: int = 0
+        self._cache_generation: int = 0
+        self._move_cache: Dict[Worker, Tuple[List[Cell], FrozenSet[Cell]]] = {}
+        self._build_cache: Dict[Worker, Tuple[List[Cell], FrozenSet[Cell]]] = {}
     
     def _create_grid(self, rows: int, cols: int) -> Dict[Coordinate, Cell]:
         """Creates a grid of cells based on the specified number of rows and columns"""
-        grid: Dict[Coordinate, Cell] = {}
-        for row in range(rows):
-            for col in range(cols):
-                coordinate = Coordinate(row, col)
-                grid[coordinate] = Cell(coordinate)
-        return grid
+        return {coordinate: Cell(coordinate) for coordinate in coordinate_grid(rows, cols)}
     
     def get_cell(self, coordinate: Coordinate) -> Optional[Cell]:
         """Return the cell at this coordinate (or None if it's out of bounds)"""
@@ -37,8 +67,19 @@ class Board:
         return (0 <= coordinate.row < self.rows and 
                 0 <= coordinate.col < self.cols)
     
+    def index_of(self, coordinate: Coordinate) -> int:
+        """Flat index of the cell at this coordinate"""
+        return to_index(coordinate.row, coordinate.col, self.cols)
+    
+    def is_on_perimeter(self, coordinate: Coordinate) -> bool:
+        """Check if coordinate lies on any edge of the board"""
+        return self.is_valid_coordinate(coordinate) and bool(self.perimeter_mask >> self.index_of(coordinate) & 1)
+    
     def get_adjacent_cells(self, coordinate: Coordinate) -> List[Cell]:
         """Return all cells that are adjacent to this coordinate"""
+        if self.is_valid_coordinate(coordinate):
+            return list(self.neighbour_cells[self.index_of(coordinate)])
+        
         adjacent_cells = []
         for row_offset in [-1, 0, 1]:
             for col_offset in [-1, 0, 1]:
@@ -57,48 +98,77 @@ class Board:
         
         return adjacent_cells
     
+    def _neighbours_of(self, cell: Cell) -> Sequence[Cell]:
+        """Cached neighbours of a cell on this board, falling back to a coordinate lookup"""
+        if cell.index is not None and self.cells[cell.index] is cell:
+            return self.neighbour_cells[cell.index]
+        return self.get_adjacent_cells(cell.coordinate)
+    
     def get_available_move_cells(self, worker: Worker) -> List[Cell]:
         """Return a list of cells that this worker can move to"""
+        return list(self._cached(self._move_cache, self.iter_moves, worker)[0])
+    
+    def get_available_build_cells(self, worker: Worker) -> List[Cell]:
+        """Return cells that are legal to build on from worker's position"""
+        return list(self._cached(self._build_cache, self.iter_builds, worker)[0])
+    
+    def is_legal_move(self, worker: Worker, cell: Cell) -> bool:
+        """Whether the worker can move to the cell, as a set lookup until the board next changes"""
+        return cell in self._cached(self._move_cache, self.iter_moves, worker)[1]
+    
+    def is_legal_build(self, worker: Worker, cell: Cell) -> bool:
+        """Whether the worker can build on the cell, as a set lookup until the board next changes"""
+        return cell in self._cached(self._build_cache, self.iter_builds, worker)[1]
+    
+    def _cached(self, cache: Dict[Worker, Tuple[List[Cell], FrozenSet[Cell]]],
+                generate: Callable[[Worker], Iterator[Cell]], worker: Worker) -> Tuple[List[Cell], FrozenSet[Cell]]:
+        """The worker's cells from the cache, regenerated once per board generation"""
+        if self._cache_generation != self.generation:
+            self._move_cache.clear()
+            self._build_cache.clear()
+            self._cache_generation = self.generation
+        entry = cache.get(worker)
+        if entry is None:
+            cells = list(generate(worker))
+            entry = cache[worker] = (cells, frozenset(cells))
+        return entry
+    
+    def iter_moves(self, worker: Worker) -> Iterator[Cell]:
+        """Yield the cells this worker can move to, one at a time"""
         current_cell = worker.get_position()
         if not current_cell:
-            return []
-        
-        adjacent_cells = self.get_adjacent_cells(current_cell.coordinate)
-        available_cells = []
+            return
         
-        for cell in adjacent_cells:
+        for cell in self._neighbours_of(current_cell):
             if current_cell.can_move_to(cell):
-                available_cells.append(cell)
-        
-        return available_cells
+                yield cell
     
-    def get_available_build_cells(self, worker: Worker) -> List[Cell]:
-        """Return cells that are legal to build on from worker's position"""
+    def iter_builds(self, worker: Worker) -> Iterator[Cell]:
+        """Yield the cells this worker can build on, one at a time"""
         current_cell = worker.get_position()
         if not current_cell:
-            return []
-        
-        adjacent_cells = self.get_adjacent_cells(current_cell.coordinate)
-        available_cells = []
+            return
         
-        for cell in adjacent_cells:
+        for cell in self._neighbours_of(current_cell):
             if cell.is_available_for_build():
-                available_cells.append(cell)
-        
-        return available_cells
+                yield cell
     
-    def place_workers_randomly(self, players: List[Player]) -> None:
-        """Randomly place workers on unoccupied ground-level spaces"""
+    def any_legal_move(self, worker: Worker) -> bool:
+        """Whether this worker can move at all; stops at the first cell it can move to"""
+        return next(self.iter_moves(worker), None) is not None
+    
+    def place_workers_randomly(self, players: List[Player], rng: Optional[random.Random] = None) -> None:
+        """Randomly place workers on unoccupied ground-level spaces (seeded when rng is given)"""
         ground_level_cells = [
             cell for cell in self.grid.values() 
-            if (not cell.tower or cell.tower.get_tower_level() == 0) and not cell.worker
+            if cell.level == 0 and not cell.dome and not cell.worker
         ]
         
         if len(ground_level_cells) < sum(len(player.workers) for player in players):
             raise ValueError("Not enough ground-level spaces for all workers")
         
         available_cells = ground_level_cells.copy()
-        random.shuffle(available_cells)
+        (rng or random).shuffle(available_cells)
         
         cell_index = 0
         for player in players:
@@ -119,9 +189,9 @@ class Board:
         cell = self.get_cell(coordinate)
         return cell.tower if cell else None
     
-    def create_hidden_cells(self, num_hidden_cells: int = 2) -> None:
+    def create_hidden_cells(self, num_hidden_cells: int = 2, rng: Optional[random.Random] = None) -> None:
         """
-        Creates hidden cells randomly on the board.
+        Creates hidden cells randomly on the board (seeded when rng is given).
         Should be called after workers are placed to avoid conflicts.
         """
         if self.hidden_cells_created:
@@ -130,31 +200,70 @@ class Board:
         # Get all empty cells (no workers, ground level)
         available_cells = [
             cell for cell in self.grid.values()
-            if not cell.worker and (not cell.tower or cell.tower.get_tower_level() == 0)
+            if not cell.worker and cell.level == 0 and not cell.dome
         ]
         
         if len(available_cells) < num_hidden_cells:
             num_hidden_cells = len(available_cells)
         
         # Randomly select cells to be hidden
-        import random
-        selected_cells = random.sample(available_cells, num_hidden_cells)
-        
-        # Hidden messages that could appear
-        hidden_messages = [
-            "You found an ancient blessing! +10 seconds granted.",
-            "The gods smile upon you! Time flows slower now.",
-            "A divine gift has been bestowed upon you!",
-            "The spirits of Santorini aid your cause!",
-            "Ancient magic flows through this sacred ground!"
-        ]
-        
-        for i, cell in enumerate(selected_cells):
+        selected_cells = (rng or random).sample(available_cells, num_hidden_cells)
+        self.mark_hidden_cells(selected_cells)
+    
+    def mark_hidden_cells(self, cells: List[Cell]) -> None:
+        """Make the given cells hidden, e.g. to recreate a recorded game's layout"""
+        for i, cell in enumerate(cells):
             cell.is_hidden = True
-            cell.hidden_message = hidden_messages[i % len(hidden_messages)]
+            cell.hidden_message = HIDDEN_MESSAGES[i % len(HIDDEN_MESSAGES)]
         
         self.hidden_cells_created = True
     
+    def register_players(self, players: List[Player]) -> None:
+        """Fix the order in which players are hashed (their index in the game)"""
+        self.player_slots = {player: slot for slot, player in enumerate(players)}
+        self.position_key = self.compute_position_key()
+    
+    def player_slot(self, player: Player) -> int:
+        """Hashing slot of a player; unknown players get the next free slot"""
+        return self.player_slots.setdefault(player, len(self.player_slots))
+    
+    def toggle_worker_key(self, cell: Cell, worker: Worker) -> None:
+        """XOR a worker standing on a cell in or out of the position key"""
+        self.position_key ^= self.zobrist.workers[self.player_slot(worker.player)][cell.index]
+        self.generation += 1
+    
+    def toggle_tower_key(self, cell: Cell) -> None:
+        """XOR a cell's current tower in or out of the position key"""
+        self.position_key ^= self.zobrist.tower_key(cell.index, cell.level, cell.dome)
+        self.generation += 1
+    
+    def toggle_revealed_key(self, cell: Cell) -> None:
+        """XOR a revealed hidden cell in or out of the position key"""
+        self.position_key ^= self.zobrist.revealed[cell.index]
+        self.generation += 1
+    
+    def set_side_to_move(self, player_index: int) -> None:
+        """Record which player is on turn in the position key"""
+        side_keys = self.zobrist.side_to_move
+        self.position_key ^= side_keys[self.side_to_move] ^ side_keys[player_index]
+        self.side_to_move = player_index
+    
+    def set_pending_key(self, pending_key: int) -> None:
+        """Replace the key of the god-card state pending within the current turn"""
+        self.position_key ^= self.pending_key ^ pending_key
+        self.pending_key = pending_key
+    
+    def compute_position_key(self) -> int:
+        """Hash the whole position from scratch (the incremental key must always match this)"""
+        key = self.zobrist.side_to_move[self.side_to_move] ^ self.pending_key
+        for cell in self.cells:
+            key ^= self.zobrist.tower_key(cell.index, cell.level, cell.dome)
+            if cell.worker:
+                key ^= self.zobrist.workers[self.player_slot(cell.worker.player)][cell.index]
+            if cell.is_hidden and cell.has_been_revealed:
+                key ^= self.zobrist.revealed[cell.index]
+        return key
+    
     def get_hidden_cells(self) -> List[Cell]:
         """Returns all hidden cells on the board."""
         return [cell for cell in self.grid.values() if cell.is_hidden]
@@ -1,23 +1,33 @@
 from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
 
+from models.tower import CellTower, Tower
+
 if TYPE_CHECKING: 
+    from models.board import Board
     from models.coordinate import Coordinate
     from models.worker import Worker
-    from models.tower import Tower
 
 class Cell:
     """
     A Cell represents a single square on the game board.
+    The tower on it is kept as a level (0-3) and a dome flag; a cell at
+    level 0 without a dome has no tower.
     """
     
+    __slots__ = ("coordinate", "worker", "level", "dome", "is_hidden", "hidden_message",
+                 "has_been_revealed", "index", "board")
+    
     def __init__(self, coordinate: Coordinate, worker: Optional[Worker] = None, tower: Optional[Tower] = None, is_hidden: bool = False, hidden_message: str = ""):
         self.coordinate: Coordinate = coordinate
         self.worker: Optional[Worker] = worker
-        self.tower: Optional[Tower] = tower
+        self.level: int = tower.get_tower_level() if tower else 0
+        self.dome: bool = tower.has_dome() if tower else False
         self.is_hidden: bool = is_hidden
         self.hidden_message: str = hidden_message
         self.has_been_revealed: bool = False
+        self.index: Optional[int] = None  # Flat index, assigned by the owning Board
+        self.board: Optional[Board] = None  # Owning board, whose position key tracks this cell
     
     def is_adjacent_to(self, other: Cell) -> bool:
         """Check if another cell is next to this one (diagonals included)"""
@@ -30,9 +40,18 @@ class Cell:
         """
         if self.is_hidden and not self.has_been_revealed:
             self.has_been_revealed = True
+            if self.board:
+                self.board.toggle_revealed_key(self)
             return self.hidden_message
         return None
     
+    def undo_reveal(self) -> None:
+        """Hide a revealed hidden cell again, undoing reveal_hidden_cell"""
+        if self.is_hidden and self.has_been_revealed:
+            self.has_been_revealed = False
+            if self.board:
+                self.board.toggle_revealed_key(self)
+    
     def can_move_to(self, other: Cell) -> bool:
         """
         Returns True if a worker can move from this cell to the other cell.
@@ -46,15 +65,11 @@ class Cell:
             return False
         
         # Target cell can't have a dome
-        if other.tower and other.tower.has_dome():
+        if other.dome:
             return False
         
-        # Height difference check
-        current_level = self.tower.get_tower_level() if self.tower else 0
-        target_level = other.tower.get_tower_level() if other.tower else 0
-        
         # Can move down any levels, but can only climb up one level
-        if target_level - current_level > 1:
+        if other.level - self.level > 1:
             return False
         
         return True
@@ -72,7 +87,7 @@ class Cell:
             return False
         
         # If there's a tower, check if it has a dome
-        if self.tower and self.tower.has_dome():
+        if self.dome:
             return False
         
         return True
@@ -81,25 +96,54 @@ class Cell:
         """Place a worker on this cell"""
         if self.worker is None and worker is not None:
             self.worker = worker
+            if self.board:
+                self.board.toggle_worker_key(self, worker)
             return True
         return False
     
     def remove_worker(self) -> bool:
         """Remove a worker from this cell"""
         if self.worker is not None:
+            if self.board:
+                self.board.toggle_worker_key(self, self.worker)
             self.worker = None
             return True
         return False
     
+    @property
+    def tower(self) -> Optional[Tower]:
+        """The tower on this cell, as a live view of its level and dome, or None if there is none"""
+        if self.level or self.dome:
+            return CellTower(self)
+        return None
+    
+    @tower.setter
+    def tower(self, tower: Optional[Tower]) -> None:
+        self.set_tower(tower)
+    
     def get_tower(self) -> Optional[Tower]:
         """Get the tower object (if any)"""
         return self.tower
     
-    def set_tower(self, tower: Tower) -> None:
+    def set_tower(self, tower: Optional[Tower]) -> None:
         """Set a new tower on this cell"""
-        self.tower = tower
+        if tower is None:
+            self.set_height(0, False)
+        else:
+            self.set_height(tower.get_tower_level(), tower.has_dome())
+    
+    def set_height(self, level: int, dome: bool) -> None:
+        """Set the tower's level and dome, keeping the board's position key and move caches in step"""
+        if level == self.level and dome == self.dome:
+            return
+        if self.board:
+            self.board.toggle_tower_key(self)
+        self.level = level
+        self.dome = dome
+        if self.board:
+            self.board.toggle_tower_key(self)
     
     def __str__(self):
         worker_str = f"Worker: {self.worker.id}" if self.worker else "No Worker"
-        tower_str = f"Tower Level: {self.tower.get_tower_level()}" if self.tower else "No Tower"
+        tower_str = f"Tower Level: {self.level}" if self.level or self.dome else "No Tower"
         return f"Cell at {self.coordinate} - {worker_str}, {tower_str}"
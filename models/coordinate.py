@@ -1,9 +1,20 @@
 from __future__ import annotations
+from functools import lru_cache
+from typing import Tuple
 
 class Coordinate:
+    """
+    A row and column on the board. Coordinates are values: they are never
+    changed after creation, so boards of one size share a single set of them
+    (coordinate_grid) and the hash is worked out once.
+    """
+    
+    __slots__ = ("row", "col", "_hash")
+    
     def __init__(self, row: int, col: int) -> None:
         self.row = row
         self.col = col
+        self._hash = hash((row, col))
     
     def is_adjacent(self, other: Coordinate) -> bool:
         """
@@ -22,13 +33,19 @@ class Coordinate:
         """
         Checks if two coordinates are equal based on their row and column values.
         """
-        return isinstance(other, Coordinate) and self.row == other.row and self.col == other.col
+        return self is other or (isinstance(other, Coordinate) and self.row == other.row and self.col == other.col)
     
     def __hash__(self):
         """
         Makes Coordinate usable as a dictionary key.
         """
-        return hash((self.row, self.col))
+        return self._hash
     
     def __str__(self) -> str:
         return f"Coordinate(row={self.row}, col={self.col})"
+
+
+@lru_cache(maxsize=None)
+def coordinate_grid(rows: int, cols: int) -> Tuple[Coordinate, ...]:
+    """The coordinates of a board size in row-major order, shared by every board of that size"""
+    return tuple(Coordinate(row, col) for row in range(rows) for col in range(cols))
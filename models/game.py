@@ -16,6 +16,7 @@ class Game:
 
         self.board: Board = Board(rows=board_size, cols=board_size)
         self.players: List[Player] = players
+        self.board.register_players(players)
         self.winning_player: Optional[Player] = None
         self.status: GameStatus = GameStatus.ONGOING
 
@@ -1,146 +1,486 @@
 # models/god_card.py
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import Optional, TYPE_CHECKING
+from abc import ABC
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Type, TYPE_CHECKING
 
+from utils.constants import MAXIMUM_TOWER_LEVEL
+from utils.enums import EventType
+from utils.grid import push_squares
 
 if TYPE_CHECKING:
-    from models.game import Game
-    from models.player import Player
-    from logic.actions.action import Action
+    from models.board import Board
+    from logic.actions.build_action import BuildAction
+    from logic.actions.move_action import MoveAction
     from models.worker import Worker
-    from models.cell import Cell 
-    from models.coordinate import Coordinate
+    from models.cell import Cell
+    from models.zobrist import ZobristTable
+
+# Every god card by name, in registration order. The order is also the id a
+# card has in game records, so new cards must be registered after the old ones.
+GOD_CARDS: Dict[str, Type[GodCard]] = {}
+
+
+def register_god(card_class: Type[GodCard]) -> Type[GodCard]:
+    """Class decorator adding a god card to GOD_CARDS"""
+    if card_class.name in GOD_CARDS:
+        raise ValueError(f"God card {card_class.name} is already registered")
+    GOD_CARDS[card_class.name] = card_class
+    return card_class
+
+
+def create_god_card(name: str) -> GodCard:
+    """A fresh card of the registered god with this name"""
+    try:
+        return GOD_CARDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown god card {name!r}") from None
+
+
+class GodHooks(NamedTuple):
+    """
+    A card's rule hooks as direct callables, None where the card keeps the
+    normal rules. GameManager resolves these once per game, so applying an
+    action costs one attribute load per hook instead of a name comparison.
+    """
+    move_filter: Optional[Callable[[Worker, Cell, Cell], bool]]
+    build_filter: Optional[Callable[[Worker, Cell], bool]]
+    after_move: Optional[Callable[[MoveAction, Board], Optional[EventType]]]
+    after_build: Optional[Callable[[BuildAction, Board], Optional[EventType]]]
+    extra_move_cells: Optional[Callable[[Worker, Board], List[Cell]]]
+    displace: Optional[Callable[[Worker, Cell, Cell], Optional[Cell]]]
+    opponent_move_filter: Optional[Callable[[Worker, Cell, Cell], bool]]
+    wins_by_move: Optional[Callable[[MoveAction], bool]]
+    pre_build_filter: Optional[Callable[[Worker, Cell], bool]]
+    dome_filter: Optional[Callable[[Worker, Cell], bool]]
+
+
+NO_HOOKS = GodHooks(*(None for _ in GodHooks._fields))  # For players without a god card
+
+
+def level_of(cell: Cell) -> int:
+    """Tower level of a cell, 0 without a tower"""
+    return cell.level
+
+
+def is_blocked(cell: Cell) -> bool:
+    """A worker or a dome stops anyone moving onto the cell"""
+    return cell.worker is not None or cell.dome
+
 
 class GodCard(ABC):
-    """Abstract base class for all god powers"""
-    
-    def __init__(self, name: str):
-        self.name = name
-    
-    @abstractmethod
-    def apply_god_power(self, player: Player, game: Game, action: Action) -> Optional[str]:
-        """
-        Applies the god power and returns an optional control signal
-        like 'SECOND_MOVE' or 'SECOND_BUILD'.
-        Now takes the action as a parameter to know what was just performed.
-        """
-        pass
-    
+    """
+    Base class for all god powers. A card overrides only the hooks its power
+    needs; the others are never called.
+
+    - move_filter / build_filter forbid targets the normal rules allow
+    - after_move / after_build return the event of a continuation (another
+      move or build by the same worker), or None to end that phase
+    - extra_move_cells adds move targets the normal rules forbid, and
+      displace says where an opponent standing on such a target goes
+    - opponent_move_filter forbids the opponents' moves
+    - wins_by_move adds a way of winning by a move
+    - pre_build_filter allows a build before moving, on the cells it accepts
+    - dome_filter allows a dome below level 3 on the cells it accepts
+    """
+
+    name = ""
+    description = ""
+    # Shown when a filter rejects a target, after the card's name
+    move_rule = "cannot move there."
+    build_rule = "cannot build there."
+    opponent_move_rule = "does not allow that move."
+    # Shown when a continuation is offered
+    continuation_message = ""
+    # The attributes holding the card's state between actions, which undo puts back
+    flags: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self.name = type(self).name
+
+    def hooks(self) -> GodHooks:
+        """This card's overridden hooks, bound to it"""
+        card_class = type(self)
+        return GodHooks(*(
+            getattr(self, hook) if getattr(card_class, hook) is not getattr(GodCard, hook) else None
+            for hook in GodHooks._fields
+        ))
+
+    def move_filter(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> bool:
+        """Whether the card allows a move the normal rules allow"""
+        return True
+
+    def build_filter(self, worker: Worker, cell: Cell) -> bool:
+        """Whether the card allows a build the normal rules allow"""
+        return True
+
+    def after_move(self, action: MoveAction, board: Board) -> Optional[EventType]:
+        """React to a completed move; return an event to offer another move"""
+        return None
+
+    def after_build(self, action: BuildAction, board: Board) -> Optional[EventType]:
+        """React to a completed build; return an event to offer another build"""
+        return None
+
+    def extra_move_cells(self, worker: Worker, board: Board) -> List[Cell]:
+        """Cells the card lets the worker move to although the normal rules do not"""
+        return []
+
+    def displace(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> Optional[Cell]:
+        """Where the opponent's worker on to_cell goes when the worker moves there"""
+        return None
+
+    def opponent_move_filter(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> bool:
+        """Whether the card allows an opponent's move the normal rules allow"""
+        return True
+
+    def wins_by_move(self, action: MoveAction) -> bool:
+        """Whether a completed move wins the game although the worker did not climb to level 3"""
+        return False
+
+    def pre_build_filter(self, worker: Worker, cell: Cell) -> bool:
+        """Whether the worker may build on the cell before moving"""
+        return False
+
+    def dome_filter(self, worker: Worker, cell: Cell) -> bool:
+        """Whether the worker may build a dome on the cell below level 3"""
+        return False
+
     def reset(self) -> None:
         """
         Resets any internal god-specific flags at end of turn.
         Can be overridden by subclasses.
         """
         pass
-    
+
+    def snapshot(self) -> tuple:
+        """
+        Captures the values of the card's flags so an undone action can
+        restore them. Cards without flags share the empty tuple.
+        """
+        return tuple(getattr(self, name) for name in self.flags)
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Restores flags captured with snapshot.
+        """
+        for name, value in zip(self.flags, snapshot):
+            setattr(self, name, value)
+
+    def pending_key(self, zobrist: ZobristTable) -> int:
+        """
+        Zobrist key of any state this card carries between actions of one turn.
+        Cards without such state contribute nothing.
+        """
+        return 0
+
     def __str__(self):
         return self.name
 
+@register_god
 class Artemis(GodCard):
     """Artemis — allows a second move to a different cell"""
-    
+
+    name = "Artemis"
+    description = "Can move one additional time, but not back to the original space."
+    move_rule = "cannot move back to the previous cell."
+    continuation_message = "You may move again (but not back to the previous cell)."
+    flags = ("has_used_second_move", "first_move_from_cell")
+
     def __init__(self):
-        super().__init__("Artemis")
+        super().__init__()
         self.has_used_second_move = False
         self.first_move_from_cell = None
-    
-    def apply_god_power(self, player: Player, game: Game, action: Action) -> Optional[str]:
-        from logic.actions.move_action import MoveAction
-        
-        # Only trigger after move actions
-        if not isinstance(action, MoveAction):
-            return None
-        
+
+    def after_move(self, action: MoveAction, board: Board) -> Optional[EventType]:
         # If we haven't used the second move yet, offer it
         if not self.has_used_second_move:
             self.has_used_second_move = True
-            self.first_move_from_cell = action.worker.get_position()  # Store where we moved FROM
-            return "SECOND_MOVE"
-        
+            self.first_move_from_cell = action.from_cell  # Store where we moved FROM
+            return EventType.SECOND_MOVE
         return None
-    
-    def can_move_to_cell(self, target_cell: Cell) -> bool:
-        """Check if Artemis can move to the target cell (not back to initial position)"""
-        if self.first_move_from_cell is None:
-            return True
-        return target_cell.coordinate != self.first_move_from_cell.coordinate
-    
+
+    def move_filter(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> bool:
+        """Artemis cannot move back to her initial position"""
+        return to_cell is not self.first_move_from_cell
+
+    def pending_key(self, zobrist: ZobristTable) -> int:
+        if self.first_move_from_cell is None or self.first_move_from_cell.index is None:
+            return 0
+        return zobrist.artemis_moved_from[self.first_move_from_cell.index]
+
     def reset(self):
         self.has_used_second_move = False
         self.first_move_from_cell = None
 
+@register_god
 class Demeter(GodCard):
     """Demeter — allows a second build on a different cell"""
-    
+
+    name = "Demeter"
+    description = "Can build an additional time, but not on the same space."
+    build_rule = "cannot build twice on the same cell."
+    continuation_message = "You may build again (but not on the same cell)."
+    flags = ("has_used_second_build", "first_build_cell")
+
     def __init__(self):
-        super().__init__("Demeter")
+        super().__init__()
         self.has_used_second_build = False
         self.first_build_cell = None
-    
-    def apply_god_power(self, player: Player, game: Game, action: Action) -> Optional[str]:
-        from logic.actions.build_action import BuildAction
-        
-        # Only trigger after build actions
-        if not isinstance(action, BuildAction):
-            return None
-        
+
+    def after_build(self, action: BuildAction, board: Board) -> Optional[EventType]:
         # If we haven't used the second build yet, offer it
         if not self.has_used_second_build:
             self.has_used_second_build = True
             self.first_build_cell = action.target_cell
-            return "SECOND_BUILD"
-        
+            return EventType.SECOND_BUILD
         return None
-    
-    def can_build_on_cell(self, target_cell: Cell) -> bool:
-        """Check if Demeter can build on the target cell (not same as first build)"""
-        if self.first_build_cell is None:
-            return True
-        return target_cell.coordinate != self.first_build_cell.coordinate
-    
+
+    def build_filter(self, worker: Worker, cell: Cell) -> bool:
+        """Demeter's second build cannot be on the first build's cell"""
+        return cell is not self.first_build_cell
+
+    def pending_key(self, zobrist: ZobristTable) -> int:
+        if self.first_build_cell is None or self.first_build_cell.index is None:
+            return 0
+        return zobrist.demeter_first_build[self.first_build_cell.index]
+
     def reset(self):
         self.has_used_second_build = False
         self.first_build_cell = None
 
+@register_god
 class Triton(GodCard):
     """
     Triton — “Each time your Worker moves into a perimeter space,
     it may immediately move again.”
     """
 
+    name = "Triton"
+    description = "Can move again if on the perimeter after moving."
+    continuation_message = "Your worker moved to a perimeter space - you may move again!"
+
+    def after_move(self, action: MoveAction, board: Board) -> Optional[EventType]:
+        # The board answers this from its precomputed perimeter mask
+        if board.is_on_perimeter(action.target_cell.coordinate):
+            return EventType.TRITON_EXTRA_MOVE
+        return None
+
+@register_god
+class Apollo(GodCard):
+    """Apollo — may move into an opponent's cell, swapping places"""
+
+    name = "Apollo"
+    description = "Can move into an opponent Worker's space, forcing it into the space just vacated."
+
+    def extra_move_cells(self, worker: Worker, board: Board) -> List[Cell]:
+        origin = worker.get_position()
+        reach = level_of(origin) + 1
+        # The swapped-out worker fills the cell just vacated, so a swap needs another cell to build on
+        return [cell for cell in board.neighbour_cells[origin.index]
+                if cell.worker is not None and cell.worker.player is not worker.player and level_of(cell) <= reach
+                and any(not is_blocked(neighbour) for neighbour in board.neighbour_cells[cell.index]
+                        if neighbour is not origin)]
+
+    def displace(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> Optional[Cell]:
+        return from_cell
+
+@register_god
+class Minotaur(GodCard):
+    """Minotaur — may push an opponent's worker one cell straight back"""
+
+    name = "Minotaur"
+    description = ("Can move into an opponent Worker's space if the next space in the same direction "
+                   "is free; the opponent Worker is forced into it.")
+
+    def extra_move_cells(self, worker: Worker, board: Board) -> List[Cell]:
+        origin = worker.get_position()
+        reach = level_of(origin) + 1
+        cells = []
+        for cell in board.neighbour_cells[origin.index]:
+            if cell.worker is None or cell.worker.player is worker.player or level_of(cell) > reach:
+                continue
+            beyond = self.displace(worker, origin, cell)
+            if beyond is not None and not is_blocked(beyond):
+                cells.append(cell)
+        return cells
+
+    def displace(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> Optional[Cell]:
+        # Push destinations are precomputed by flat index, so a push allocates nothing
+        board = to_cell.board
+        beyond = push_squares(board.rows, board.cols)[from_cell.index].get(to_cell.index)
+        return board.cells[beyond] if beyond is not None else None
+
+@register_god
+class Atlas(GodCard):
+    """Atlas — may build a dome at any level"""
+
+    name = "Atlas"
+    description = "Can build a dome at any level."
+
+    def dome_filter(self, worker: Worker, cell: Cell) -> bool:
+        return True
+
+@register_god
+class Hephaestus(GodCard):
+    """Hephaestus — may add a second block (not a dome) on the first build"""
+
+    name = "Hephaestus"
+    description = "Can build one additional block (not a dome) on top of the first block."
+    build_rule = "can only build again on the same cell, and not a dome."
+    continuation_message = "You may build another block on the same cell."
+    flags = ("first_build_cell",)
+
     def __init__(self):
-        super().__init__("Triton")
-       
-    
-    def apply_god_power(self, player: Player, game: Game, action: Action) -> Optional[str]:
-        from logic.actions.move_action import MoveAction
-        
-        # Only trigger after move actions
-        if not isinstance(action, MoveAction):
-            return None
-        
-        # Get the cell where the worker just moved to
-        target_cell = action.target_cell
-        
-        # Check if the worker moved to a perimeter space
-        if self._is_on_perimeter(target_cell.coordinate, game.get_board()):
-            return "TRITON_EXTRA_MOVE"
-        
+        super().__init__()
+        self.first_build_cell = None
+
+    def after_build(self, action: BuildAction, board: Board) -> Optional[EventType]:
+        if self.first_build_cell is None:
+            self.first_build_cell = action.target_cell
+            return EventType.EXTRA_BUILD
         return None
-    
-    def _is_on_perimeter(self, coordinate, board) -> bool:
-        """
-        Helper method to check if a coordinate is on the perimeter.
-        A coordinate is on the perimeter if it's on any edge of the board.
-        """
-        row, col = coordinate.row, coordinate.col
-        board_rows, board_cols = board.rows, board.cols
-        
-        # Check if coordinate is on any edge of the board
-        return (row == 0 or row == board_rows - 1 or 
-                col == 0 or col == board_cols - 1)
-    
 
+    def build_filter(self, worker: Worker, cell: Cell) -> bool:
+        """The second block goes on the first, and never becomes a dome"""
+        return self.first_build_cell is None or (
+            cell is self.first_build_cell and level_of(cell) < MAXIMUM_TOWER_LEVEL)
+
+    def pending_key(self, zobrist: ZobristTable) -> int:
+        if self.first_build_cell is None or self.first_build_cell.index is None:
+            return 0
+        return zobrist.hephaestus_first_build[self.first_build_cell.index]
+
+    def reset(self):
+        self.first_build_cell = None
+
+@register_god
+class Pan(GodCard):
+    """Pan — also wins by moving down two or more levels"""
 
+    name = "Pan"
+    description = "Also wins if a Worker moves down two or more levels."
+
+    def wins_by_move(self, action: MoveAction) -> bool:
+        return level_of(action.from_cell) - level_of(action.target_cell) >= 2
+
+@register_god
+class Prometheus(GodCard):
+    """Prometheus — may build before moving, but then cannot move up"""
+
+    name = "Prometheus"
+    description = "If your Worker does not move up, it may build both before and after moving."
+    move_rule = "cannot move up after building first."
+    flags = ("has_moved", "built_first")
+
+    def __init__(self):
+        super().__init__()
+        self.has_moved = False
+        self.built_first = False
+
+    def after_move(self, action: MoveAction, board: Board) -> Optional[EventType]:
+        self.has_moved = True
+        return None
+
+    def after_build(self, action: BuildAction, board: Board) -> Optional[EventType]:
+        if not self.has_moved:
+            self.built_first = True
+        return None
+
+    def move_filter(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> bool:
+        return not self.built_first or level_of(to_cell) <= level_of(from_cell)
+
+    def pre_build_filter(self, worker: Worker, cell: Cell) -> bool:
+        """The build must leave the worker a move that does not go up"""
+        origin = worker.get_position()
+        level = level_of(origin)
+        for target in origin.board.neighbour_cells[origin.index]:
+            if is_blocked(target) or level_of(target) > level:
+                continue
+            # Building on the only such target raises it, which may take it out of reach
+            if target is not cell or level_of(cell) < level:
+                return True
+        return False
+
+    def pending_key(self, zobrist: ZobristTable) -> int:
+        return zobrist.prometheus_built_first if self.built_first else 0
+
+    def reset(self):
+        self.has_moved = False
+        self.built_first = False
+
+@register_god
+class Athena(GodCard):
+    """Athena — after she moves up, opponents cannot move up on their next turn"""
+
+    name = "Athena"
+    description = "If one of your Workers moved up on your last turn, opponent Workers cannot move up this turn."
+    opponent_move_rule = "moved up last turn, so you cannot move up."
+    flags = ("climbed",)
+
+    def __init__(self):
+        super().__init__()
+        self.climbed = False  # Kept through the opponent's turn, so reset leaves it alone
+
+    def after_move(self, action: MoveAction, board: Board) -> Optional[EventType]:
+        self.climbed = level_of(action.target_cell) > level_of(action.from_cell)
+        return None
+
+    def opponent_move_filter(self, worker: Worker, from_cell: Cell, to_cell: Cell) -> bool:
+        return not self.climbed or level_of(to_cell) <= level_of(from_cell)
+
+    def pending_key(self, zobrist: ZobristTable) -> int:
+        return zobrist.athena_climbed if self.climbed else 0
+
+@register_god
+class Hermes(GodCard):
+    """Hermes — may travel any distance across cells at the worker's own level"""
+
+    name = "Hermes"
+    description = ("If your Worker does not move up or down, it may move any number of spaces "
+                   "along cells of its own level.")
+
+    def __init__(self):
+        super().__init__()
+        # Each worker's reach, worked out once per board generation
+        self._reach: Dict[Worker, Tuple[Cell, ...]] = {}
+        self._reach_board: Optional[Board] = None
+        self._reach_generation = -1
+
+    def extra_move_cells(self, worker: Worker, board: Board) -> List[Cell]:
+        """
+        Free cells of the worker's level connected to it through other such
+        cells, beyond the adjacent ones. An unrevealed hidden cell can be
+        reached but not crossed, as revealing it would end the move.
+        """
+        if board is not self._reach_board or board.generation != self._reach_generation:
+            self._reach.clear()
+            self._reach_board = board
+            self._reach_generation = board.generation
+        reach = self._reach.get(worker)
+        if reach is None:
+            reach = self._reach[worker] = tuple(self._flood(worker, board))
+        return list(reach)
 
+    def _flood(self, worker: Worker, board: Board) -> List[Cell]:
+        origin = worker.get_position()
+        level = level_of(origin)
+        neighbour_cells = board.neighbour_cells
+        seen = 1 << origin.index
+        for cell in neighbour_cells[origin.index]:
+            seen |= 1 << cell.index
+        frontier = [cell for cell in neighbour_cells[origin.index]
+                    if not is_blocked(cell) and level_of(cell) == level]
+        cells = []
+        while frontier:
+            cell = frontier.pop()
+            if cell.is_hidden and not cell.has_been_revealed:
+                continue
+            for neighbour in neighbour_cells[cell.index]:
+                bit = 1 << neighbour.index
+                if seen & bit:
+                    continue
+                seen |= bit
+                if not is_blocked(neighbour) and level_of(neighbour) == level:
+                    cells.append(neighbour)
+                    frontier.append(neighbour)
+        return cells
@@ -14,7 +14,7 @@ class Player:
         self.workers: List[Worker] = []
         self.god_card = god_card
 
-        self.remaining_time_secs: int = 15 * 60 # 15 minutes in seconds
+        self.remaining_time_secs: float = 15 * 60 # 15 minutes in seconds
 
         
     
@@ -44,7 +44,7 @@ class Player:
     def has_valid_moves(self, board) -> bool:
         """Check if player has any valid moves with any of their workers"""
         for worker in self.workers:
-            if board.get_available_move_cells(worker):
+            if board.any_legal_move(worker):
                 return True
         return False
     
@@ -1,18 +1,27 @@
 # models/tower.py
 from __future__ import annotations
-from utils.constants import MAXIMUM_TOWER_LEVEL
+from typing import TYPE_CHECKING
+
+from utils.constants import MAXIMUM_TOWER_LEVEL, MINIMUM_TOWER_LEVEL
+
+if TYPE_CHECKING:
+    from models.cell import Cell
 
 class Tower:
     """
     Represents a buildable tower in Santorini. A tower has up to 3 levels,
-    and optionally a dome that caps further building.
+    and optionally a dome that caps further building (normally on level 3,
+    but Atlas can dome a tower of any height).
+    
+    A Cell stores its own level and dome; the Tower it hands out is a
+    CellTower, a live view whose changes go straight to the cell.
     """
     
+    __slots__ = ("_level", "_dome")
+    
     def __init__(self, level: int = 0, dome: bool = False):
         if level < 0 or level > MAXIMUM_TOWER_LEVEL:
             raise ValueError(f"Tower level must be between 0 and {MAXIMUM_TOWER_LEVEL}")
-        if dome and level < MAXIMUM_TOWER_LEVEL:
-            raise ValueError("Dome cannot be placed unless tower is at max level.")
         self._level = level
         self._dome = dome
     
@@ -31,15 +40,34 @@ class Tower:
             return True
         return False
     
-    def add_dome(self) -> bool:
+    def add_dome(self, any_level: bool = False) -> bool:
         """
-        Adds a dome if there isn't one already and tower is at max level.
+        Adds a dome if there isn't one already and tower is at max level
+        (or at any level, for Atlas).
         """
-        if not self._dome and self._level == MAXIMUM_TOWER_LEVEL:
+        if not self._dome and (any_level or self._level == MAXIMUM_TOWER_LEVEL):
             self._dome = True
             return True
         return False
     
+    def remove_tower_level(self) -> bool:
+        """
+        Removes the top level (undoing build_tower_level), if there is no dome on it.
+        """
+        if self._level > MINIMUM_TOWER_LEVEL and not self._dome:
+            self._level -= 1
+            return True
+        return False
+    
+    def remove_dome(self) -> bool:
+        """
+        Removes the dome (undoing add_dome), if there is one.
+        """
+        if self._dome:
+            self._dome = False
+            return True
+        return False
+    
     def has_dome(self) -> bool:
         return self._dome
     
@@ -48,3 +76,33 @@ class Tower:
     
     def __str__(self) -> str:
         return f"Tower(level={self._level}, dome={self._dome})"
+
+
+class CellTower(Tower):
+    """
+    The tower on a cell, read from and written to the cell's level and dome.
+    The properties shadow Tower's slots, so every Tower method works on the
+    cell, and each change goes through Cell.set_height to keep the board's
+    position key and move caches in step.
+    """
+    
+    __slots__ = ("cell",)
+    
+    def __init__(self, cell: Cell):
+        self.cell = cell
+    
+    @property
+    def _level(self) -> int:
+        return self.cell.level
+    
+    @_level.setter
+    def _level(self, level: int) -> None:
+        self.cell.set_height(level, self.cell.dome)
+    
+    @property
+    def _dome(self) -> bool:
+        return self.cell.dome
+    
+    @_dome.setter
+    def _dome(self, dome: bool) -> None:
+        self.cell.set_height(self.cell.level, dome)
@@ -11,14 +11,20 @@ from models.tower import Tower
 class Worker:
     """The Worker class represents a player's game piece that can move and build"""
     
+    __slots__ = ("id", "position", "player")
+    
     def __init__(self, id: int, position: Cell, player: Player):
         self.id: int = id
         self.position: Cell = position
         self.player: Player = player
-        self.name = f"{player.name}'s Worker {self.id}"
         # Tell the cell that this worker is standing on it
         position.assign_worker(self)
     
+    @property
+    def name(self) -> str:
+        """Display name, worked out from the player's name so it is not stored per worker"""
+        return f"{self.player.name}'s Worker {self.id}"
+    
     def get_position(self) -> Cell:
         """Returns the current cell the worker is on"""
         return self.position
@@ -34,6 +40,8 @@ class Worker:
     def apply_move(self, to_cell: Cell) -> bool:
         """
         Moves the worker to a new cell if the move is valid.
+        The cells update the board's position key, and with it the generation that
+        invalidates its legal-move cache, as the worker leaves and arrives.
         """
         # Remove the worker from its current cell
         if self.position:
@@ -47,23 +55,40 @@ class Worker:
         
         return True
     
-    def apply_build(self, target_cell: Cell) -> bool:
+    def apply_build(self, target_cell: Cell, dome: bool = False) -> bool:
         """
         Builds on the target cell (adds level or dome).
+        With dome set, caps the tower with a dome whatever its height.
         """
         # Get or create tower
-        tower = target_cell.get_tower()
-        if not tower:
-            tower = Tower()
-            target_cell.set_tower(tower)
+        tower = target_cell.get_tower() or Tower()
         
         # Build level or dome based on current tower level
-        if tower.get_tower_level() < 3:
-            return tower.build_tower_level()
+        built = False
+        if dome:
+            built = tower.add_dome(any_level=True)
+        elif tower.get_tower_level() < 3:
+            built = tower.build_tower_level()
         elif tower.get_tower_level() == 3 and not tower.has_dome():
-            return tower.add_dome()
+            built = tower.add_dome()
+        
+        # An existing tower is the cell's own and has changed it already; a new one is placed
+        if built:
+            target_cell.set_tower(tower)
+        return built
+    
+    def remove_build(self, target_cell: Cell) -> bool:
+        """
+        Removes the top block or dome from the target cell, undoing apply_build.
+        A cell left at level 0 without a dome has no tower, so the cell is
+        always as it was before building.
+        """
+        # The tower is the cell's own, so removing from it updates the cell
+        tower = target_cell.get_tower()
+        if not tower:
+            return False
         
-        return False
+        return tower.remove_dome() or tower.remove_tower_level()
     
     def __str__(self):
         return f"Worker(id={self.id}, position={self.position.coordinate}, player={self.player.name})"
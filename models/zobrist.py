@@ -0,0 +1,52 @@
+from __future__ import annotations
+from functools import lru_cache
+import random
+from typing import List
+
+from utils.constants import MAXIMUM_TOWER_LEVEL
+
+ZOBRIST_SEED = 0x5A170121
+MAX_PLAYERS = 2
+
+
+class ZobristTable:
+    """
+    Fixed random 64-bit keys for every feature of a position on one board size.
+    Keys are derived from a constant seed so they are identical across processes.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        rng = random.Random(ZOBRIST_SEED ^ (rows << 8) ^ cols)
+        num_cells = rows * cols
+
+        def keys() -> List[int]:
+            return [rng.getrandbits(64) for _ in range(num_cells)]
+
+        # levels[level][index]; level 0 is the empty cell and hashes to nothing
+        self.levels: List[List[int]] = [[0] * num_cells] + [keys() for _ in range(MAXIMUM_TOWER_LEVEL)]
+        self.domes: List[int] = keys()
+        self.workers: List[List[int]] = [keys() for _ in range(MAX_PLAYERS)]
+        self.revealed: List[int] = keys()
+        self.side_to_move: List[int] = [0] + [rng.getrandbits(64) for _ in range(MAX_PLAYERS - 1)]
+
+        # God-card state that is pending within a turn
+        self.artemis_moved_from: List[int] = keys()
+        self.demeter_first_build: List[int] = keys()
+        self.hephaestus_first_build: List[int] = keys()
+        self.prometheus_built_first: int = rng.getrandbits(64)
+
+        # God-card state that lasts into the opponent's turn
+        self.athena_climbed: int = rng.getrandbits(64)
+
+    def tower_key(self, index: int, level: int, has_dome: bool) -> int:
+        """Combined key of a tower of this height (and dome) on a cell"""
+        key = self.levels[level][index]
+        if has_dome:
+            key ^= self.domes[index]
+        return key
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_table(rows: int, cols: int) -> ZobristTable:
+    """Shared key table for a board size"""
+    return ZobristTable(rows, cols)
@@ -0,0 +1,7 @@
+"""
+Networked play: an asyncio match server, the JSON-lines protocol it speaks
+and the client the Tk screens use to talk to it.
+
+    python -m network.server --port 8765
+    python -m network.client --port 8765 --name Ana
+"""
@@ -0,0 +1,178 @@
+"""
+Client side of the match protocol for the Tk interface.
+
+Tk is single-threaded, so the socket is read on a daemon thread that only
+decodes lines and puts the messages on a queue; the screen drains the queue
+from an `after` callback and never waits on the network:
+
+    python -m network.client --host 127.0.0.1 --port 8765 --name Ana
+"""
+from __future__ import annotations
+import argparse
+import queue
+import socket
+import sys
+import threading
+from typing import Iterator, List
+
+from engine.state import EngineAction
+from models.game import Game
+from models.god_card import GOD_CARDS, create_god_card
+from models.player import Player
+from models.tower import Tower
+from models.worker import Worker
+from network import protocol
+from utils.constants import DEFAULT_BOARD_SIZE
+
+# Put on the queue by the reader thread when the connection ends
+DISCONNECTED = "disconnected"
+
+SEAT_COLORS = ("green", "red")  # Same token colours as the setup screen
+
+
+class GameClient:
+    """A connection to the match server with a background reader thread"""
+
+    def __init__(self, host: str, port: int, timeout: float = 10.0):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.settimeout(None)
+        self.incoming: queue.Queue = queue.Queue()
+        self.send_lock = threading.Lock()
+        self.closed = False
+        self.reader = threading.Thread(target=self._read_loop, name="santorini-client", daemon=True)
+        self.reader.start()
+
+    def _read_loop(self) -> None:
+        """Decode lines until the connection ends; runs on the reader thread"""
+        try:
+            with self.sock.makefile("rb") as stream:
+                for line in stream:
+                    try:
+                        self.incoming.put(protocol.decode(line))
+                    except protocol.ProtocolError:
+                        continue
+        except OSError:
+            pass
+        self.incoming.put({"type": DISCONNECTED})
+
+    def poll(self) -> Iterator[dict]:
+        """Messages received so far; never blocks"""
+        while True:
+            try:
+                yield self.incoming.get_nowait()
+            except queue.Empty:
+                return
+
+    def send(self, message: dict) -> None:
+        """Send one message; protocol messages are far smaller than the socket buffer"""
+        if self.closed:
+            return
+        try:
+            with self.send_lock:
+                self.sock.sendall(protocol.encode(message))
+        except OSError:
+            self.close()
+
+    def join(self, name: str, board_size: int = DEFAULT_BOARD_SIZE) -> None:
+        self.send({"type": protocol.JOIN, "name": name, "board_size": board_size})
+
+    def send_action(self, action: EngineAction) -> None:
+        self.send(protocol.action_to_message(action))
+
+    def resign(self) -> None:
+        self.send({"type": protocol.RESIGN})
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def game_from_start(message: dict) -> Game:
+    """Local copy of the game a match_start message describes, for display"""
+    players = [Player(name) for name in message["players"]]
+    for player, color in zip(players, SEAT_COLORS):
+        player.token_color = color
+    game = Game(players=players, board_size=message["rows"])
+    game.initialize_game([create_god_card(name) if name in GOD_CARDS else None
+                          for name in message["god_cards"]])
+    board = game.get_board()
+    for row, col, level, dome, worker_id, seat in message["cells"]:
+        cell = board.cells[row * board.cols + col]
+        if level or dome:
+            cell.set_tower(Tower(level, dome))
+        if worker_id is not None:
+            players[seat].add_worker(Worker(id=worker_id, position=cell, player=players[seat]))
+    return game
+
+
+def apply_cells(game: Game, cells: List[list]) -> list:
+    """
+    Bring the local board in line with changed cells from the server and
+    return the Cell objects touched. Workers are found by id, so a worker
+    arriving in a cell before its old cell has been cleared is handled.
+    """
+    board = game.get_board()
+    workers = {worker.id: worker for player in game.get_players() for worker in player.get_workers()}
+    touched = []
+    for row, col, level, dome, worker_id, _ in cells:
+        cell = board.cells[row * board.cols + col]
+        if (cell.level, cell.dome) != (level, dome):
+            cell.set_tower(Tower(level, dome) if level or dome else None)
+
+        if cell.worker is not None and cell.worker.id != worker_id:
+            cell.remove_worker()
+        if worker_id is not None and cell.worker is None:
+            worker = workers[worker_id]
+            if worker.position is not None and worker.position.worker is worker:
+                worker.position.remove_worker()
+            worker.set_position(cell)
+            cell.assign_worker(worker)
+        touched.append(cell)
+    return touched
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--name", default="Player")
+    parser.add_argument("--board-size", type=int, default=DEFAULT_BOARD_SIZE)
+    args = parser.parse_args(argv)
+
+    import tkinter as tk
+    from screens.remote_game_board import RemoteGameBoardScreen
+
+    client = GameClient(args.host, args.port)
+    client.join(args.name, args.board_size)
+
+    root = tk.Tk()
+    root.title("Santorini Game - Online")
+    status = tk.Label(root, text="Waiting for an opponent...", font=('Arial', 14), padx=40, pady=40)
+    status.grid(row=0, column=0)
+
+    def wait_for_match():
+        for message in client.poll():
+            if message["type"] == protocol.MATCH_START:
+                status.destroy()
+                screen = RemoteGameBoardScreen(root, client, message)
+                screen.grid(row=0, column=0, sticky="nsew")
+                return
+            if message["type"] == DISCONNECTED:
+                status.config(text="Could not reach the server.")
+                return
+        root.after(100, wait_for_match)
+
+    wait_for_match()
+    root.mainloop()
+    client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
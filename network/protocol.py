@@ -0,0 +1,143 @@
+"""
+Line-delimited JSON protocol shared by the game server and networked clients.
+
+Every message is one JSON object on its own line with a "type" field.
+
+Client to server:
+    {"type": "join", "name": "Ana", "board_size": 5}
+    {"type": "action", "action": "select_worker", "worker_id": 1}
+    {"type": "action", "action": "move", "row": 2, "col": 3}
+    {"type": "action", "action": "build", "row": 2, "col": 4}
+    {"type": "action", "action": "build", "row": 2, "col": 4, "dome": true}   (Atlas)
+    {"type": "action", "action": "end_turn"}
+    {"type": "resign"}
+
+Server to client:
+    {"type": "waiting"}
+    {"type": "match_start", "match": 7, "seat": 0, "players": [...], "god_cards": [...],
+     "rows": 5, "cols": 5, "cells": [...], ...turn fields}
+    {"type": "update", "cells": [...only changed cells...], "events": [...], ...turn fields}
+    {"type": "error", "title": "Invalid Move", "message": "..."}
+    {"type": "game_over", "winner": 0, "reason": "win"}
+
+Turn fields: "current" (seat on turn), "phase", "selected_worker", "workers"
+(selectable worker ids), "targets" ([row, col] pairs for the current move or
+build), "build_targets" (where a build may go right now, which for
+Prometheus includes before moving), "dome_targets" (where a dome below level 3
+may go, for Atlas), "clock" (seconds left per seat when the message was sent).
+A cell is [row, col, level, dome, worker id or null, owner seat or null].
+"""
+from __future__ import annotations
+import json
+from typing import List, Optional, TYPE_CHECKING
+
+from engine.rules import legal_actions, legal_build_cells, legal_dome_cells, legal_move_cells
+from engine.state import EngineAction
+from utils.enums import ActionType, TurnPhase
+
+if TYPE_CHECKING:
+    from engine.state import EngineState
+    from models.cell import Cell
+
+MAX_LINE_BYTES = 4096
+
+JOIN = "join"
+ACTION = "action"
+RESIGN = "resign"
+WAITING = "waiting"
+MATCH_START = "match_start"
+UPDATE = "update"
+ERROR = "error"
+GAME_OVER = "game_over"
+
+
+class ProtocolError(ValueError):
+    """Raised for lines that are not valid protocol messages"""
+
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    try:
+        message = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ProtocolError(f"Malformed message: {error}") from None
+    if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+        raise ProtocolError("Messages must be JSON objects with a type")
+    return message
+
+
+def action_to_message(action: EngineAction) -> dict:
+    message = {"type": ACTION, "action": action.action_type.value}
+    if action.action_type == ActionType.SELECT_WORKER:
+        message["worker_id"] = action.worker_id
+    elif action.action_type in (ActionType.MOVE, ActionType.BUILD):
+        message["row"] = action.row
+        message["col"] = action.col
+        if action.dome:
+            message["dome"] = True
+    return message
+
+
+def action_from_message(message: dict) -> EngineAction:
+    try:
+        action_type = ActionType(message.get("action"))
+        if action_type == ActionType.SELECT_WORKER:
+            return EngineAction.select_worker(int(message["worker_id"]))
+        if action_type == ActionType.MOVE:
+            return EngineAction.move_to(int(message["row"]), int(message["col"]))
+        if action_type == ActionType.BUILD:
+            return EngineAction.build_on(int(message["row"]), int(message["col"]), bool(message.get("dome", False)))
+        return EngineAction.end_turn()
+    except (KeyError, TypeError, ValueError):
+        raise ProtocolError("Malformed action") from None
+
+
+def cell_state(cell: Cell, seats: dict) -> list:
+    """Wire form of a cell; seats maps Player to seat number"""
+    worker = cell.worker
+    return [
+        cell.coordinate.row,
+        cell.coordinate.col,
+        cell.level,
+        cell.dome,
+        worker.id if worker else None,
+        seats[worker.player] if worker else None,
+    ]
+
+
+def board_cells(state: EngineState) -> List[list]:
+    seats = {player: seat for seat, player in enumerate(state.game.get_players())}
+    return [cell_state(cell, seats) for cell in state.game.get_board().cells]
+
+
+def changed_cells(previous: List[list], current: List[list]) -> List[list]:
+    return [cell for old, cell in zip(previous, current) if old != cell]
+
+
+def turn_fields(state: EngineState, clock: Optional[List[float]] = None) -> dict:
+    """What a client needs to present the turn in progress"""
+    phase = state.turn_phase
+    build_targets = [[cell.coordinate.row, cell.coordinate.col] for cell in legal_build_cells(state)]
+    if phase == TurnPhase.MOVE_SELECTION:
+        targets = [[cell.coordinate.row, cell.coordinate.col] for cell in legal_move_cells(state)]
+    elif phase == TurnPhase.BUILD_SELECTION:
+        targets = build_targets
+    else:
+        targets = []
+    workers = ([action.worker_id for action in legal_actions(state)]
+               if phase == TurnPhase.WORKER_SELECTION else [])
+    fields = {
+        "current": state.game_manager.current_player_index,
+        "phase": phase.value,
+        "selected_worker": state.selected_worker.id if state.selected_worker else None,
+        "workers": workers,
+        "targets": targets,
+        "build_targets": build_targets,
+        "dome_targets": [[cell.coordinate.row, cell.coordinate.col] for cell in legal_dome_cells(state)],
+    }
+    if clock is not None:
+        fields["clock"] = [round(secs, 2) for secs in clock]
+    return fields
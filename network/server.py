@@ -0,0 +1,308 @@
+"""
+Asyncio match server.
+
+Players connect over TCP, send a join message and are paired with the next
+player waiting for the same board size. The server owns the rules (the
+headless engine over GameManager/Board) and the clocks; clients only submit
+actions and draw the changes they are sent.
+
+    python -m network.server --host 127.0.0.1 --port 8765
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import itertools
+import random
+import sys
+from typing import Dict, List, Optional
+
+from controllers.game_clock import GameClock
+from engine.rules import apply, create_state, forfeit, is_terminal
+from engine.setup import create_game
+from engine.state import IllegalActionError
+from network import protocol
+from utils.constants import DEFAULT_BOARD_SIZE
+from utils.enums import ActionType, ClockMode
+
+BOARD_SIZES = (4, 5, 6)
+
+
+class Connection:
+    """One client socket and the match seat it holds, if any"""
+
+    __slots__ = ("reader", "writer", "name", "board_size", "match", "seat")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.name = ""
+        self.board_size = DEFAULT_BOARD_SIZE
+        self.match: Optional[Match] = None
+        self.seat = -1
+
+    def send(self, message: dict) -> None:
+        """Queue a message; the transport buffers it so the server never waits on one slow client"""
+        if not self.writer.is_closing():
+            self.writer.write(protocol.encode(message))
+
+
+class Match:
+    """
+    A game in progress. Besides the engine state this is just the two
+    connections, the clock, the cells last sent and one timer handle.
+    """
+
+    __slots__ = ("id", "state", "connections", "clock", "sent_cells", "timeout", "finished")
+
+    def __init__(self, match_id: int, state, connections: List[Connection], clock: GameClock):
+        self.id = match_id
+        self.state = state
+        self.connections = connections
+        self.clock = clock
+        self.sent_cells = protocol.board_cells(state)
+        self.timeout: Optional[asyncio.TimerHandle] = None
+        self.finished = False
+
+    def clock_values(self) -> List[float]:
+        return [max(0.0, self.clock.remaining(player)) for player in self.state.game.get_players()]
+
+    def broadcast(self, message: dict) -> None:
+        for connection in self.connections:
+            connection.send(message)
+
+
+class GameServer:
+    """Hosts any number of concurrent matches on one event loop"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, time_secs: float = 15 * 60,
+                 clock_mode: ClockMode = ClockMode.SUDDEN_DEATH, increment_secs: float = 0,
+                 rng: Optional[random.Random] = None):
+        self.host = host
+        self.port = port
+        self.time_secs = time_secs
+        self.clock_mode = clock_mode
+        self.increment_secs = increment_secs
+        self.rng = rng or random.Random()
+
+        self.matches: Dict[int, Match] = {}
+        self.waiting: Dict[int, Optional[Connection]] = {size: None for size in BOARD_SIZES}
+        self.match_ids = itertools.count(1)
+        self.server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                                 limit=protocol.MAX_LINE_BYTES)
+        # Port 0 asks the OS for a free port; report the real one
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = Connection(reader, writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    connection.send({"type": protocol.ERROR, "title": "Protocol Error", "message": "Line too long"})
+                    break
+                if not line:
+                    break
+                try:
+                    self.dispatch(connection, protocol.decode(line))
+                except protocol.ProtocolError as error:
+                    connection.send({"type": protocol.ERROR, "title": "Protocol Error", "message": str(error)})
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.disconnect(connection)
+            writer.close()
+
+    def dispatch(self, connection: Connection, message: dict) -> None:
+        kind = message["type"]
+        if kind == protocol.JOIN:
+            self.join(connection, message)
+        elif kind == protocol.ACTION:
+            self.submit(connection, protocol.action_from_message(message))
+        elif kind == protocol.RESIGN:
+            match = connection.match
+            if match and not match.finished:
+                forfeit(match.state, match.state.game.get_players()[connection.seat])
+                self.finish(match, "resign")
+        else:
+            raise protocol.ProtocolError(f"Unknown message type {kind!r}")
+
+    def join(self, connection: Connection, message: dict) -> None:
+        if connection.match is not None or connection in self.waiting.values():
+            raise protocol.ProtocolError("Already joined")
+        board_size = message.get("board_size", DEFAULT_BOARD_SIZE)
+        # 5.0 and True compare equal to board sizes but cannot build a board
+        if type(board_size) is not int or board_size not in BOARD_SIZES:
+            raise protocol.ProtocolError(f"Board size must be one of {BOARD_SIZES}")
+        connection.name = str(message.get("name") or "Player")[:32]
+        connection.board_size = board_size
+
+        opponent = self.waiting[board_size]
+        if opponent is None:
+            self.waiting[board_size] = connection
+            connection.send({"type": protocol.WAITING})
+            return
+        self.waiting[board_size] = None
+        self.start_match([opponent, connection], board_size)
+
+    def start_match(self, connections: List[Connection], board_size: int) -> None:
+        game = create_game([connection.name for connection in connections], board_size, rng=self.rng)
+        state = create_state(game, rng=self.rng)
+        for player in game.get_players():
+            player.remaining_time_secs = self.time_secs
+        clock = GameClock(game.get_players(), self.clock_mode, self.increment_secs)
+        match = Match(next(self.match_ids), state, connections, clock)
+        self.matches[match.id] = match
+
+        players = game.get_players()
+        for seat, connection in enumerate(connections):
+            connection.match = match
+            connection.seat = seat
+        clock.start_turn(state.current_player)
+        fields = protocol.turn_fields(state, match.clock_values())
+        for seat, connection in enumerate(connections):
+            connection.send({
+                "type": protocol.MATCH_START,
+                "match": match.id,
+                "seat": seat,
+                "players": [player.name for player in players],
+                "god_cards": [player.get_god_card().name for player in players],
+                "rows": game.get_board().rows,
+                "cols": game.get_board().cols,
+                "cells": match.sent_cells,
+                **fields,
+            })
+        if is_terminal(state):
+            self.finish(match, "win")
+        else:
+            self.schedule_timeout(match)
+
+    def submit(self, connection: Connection, action) -> None:
+        match = connection.match
+        if match is None or match.finished:
+            raise protocol.ProtocolError("Not in a running match")
+        state = match.state
+        if state.game_manager.current_player_index != connection.seat:
+            connection.send({"type": protocol.ERROR, "title": "Not Your Turn", "message": "Wait for your opponent."})
+            return
+        if match.clock.is_expired(state.current_player):
+            self.on_timeout(match)
+            return
+
+        try:
+            events = apply(state, action)
+        except IllegalActionError as error:
+            connection.send({"type": protocol.ERROR, "title": error.title, "message": str(error)})
+            return
+        state.history.clear()  # The server never takes actions back
+
+        if action.action_type == ActionType.END_TURN:
+            match.clock.end_turn()
+            if not is_terminal(state):
+                match.clock.start_turn(state.current_player)
+
+        self.send_update(match, events)
+        if is_terminal(state):
+            self.finish(match, "win")
+        else:
+            # A hidden-cell bonus or a new turn moves the deadline
+            self.schedule_timeout(match)
+
+    def send_update(self, match: Match, events=()) -> None:
+        cells = protocol.board_cells(match.state)
+        changed = protocol.changed_cells(match.sent_cells, cells)
+        match.sent_cells = cells
+        match.broadcast({
+            "type": protocol.UPDATE,
+            "cells": changed,
+            "events": [[event.event_type.value, event.message] for event in events],
+            **protocol.turn_fields(match.state, match.clock_values()),
+        })
+
+    def schedule_timeout(self, match: Match) -> None:
+        """Wake up once, when the player on turn would run out of time"""
+        if match.timeout is not None:
+            match.timeout.cancel()
+        remaining = match.clock.remaining(match.state.current_player)
+        match.timeout = asyncio.get_running_loop().call_later(max(0.0, remaining), self.on_timeout, match)
+
+    def on_timeout(self, match: Match) -> None:
+        match.timeout = None
+        if match.finished:
+            return
+        player = match.state.current_player
+        if not match.clock.is_expired(player):
+            self.schedule_timeout(match)
+            return
+        forfeit(match.state, player)
+        self.finish(match, "timeout")
+
+    def finish(self, match: Match, reason: str) -> None:
+        if match.finished:
+            return
+        match.finished = True
+        match.clock.stop()
+        if match.timeout is not None:
+            match.timeout.cancel()
+            match.timeout = None
+        winner = match.state.winner
+        match.broadcast({
+            "type": protocol.GAME_OVER,
+            "winner": match.state.game.get_players().index(winner) if winner else None,
+            "reason": reason,
+            "clock": [round(secs, 2) for secs in match.clock_values()],
+        })
+        for connection in match.connections:
+            connection.match = None
+        del self.matches[match.id]
+
+    def disconnect(self, connection: Connection) -> None:
+        """A player who leaves a running match loses it"""
+        if self.waiting.get(connection.board_size) is connection:
+            self.waiting[connection.board_size] = None
+        match = connection.match
+        if match is not None and not match.finished:
+            forfeit(match.state, match.state.game.get_players()[connection.seat])
+            self.finish(match, "disconnect")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--minutes", type=float, default=15, help="starting time per player")
+    parser.add_argument("--clock", choices=[mode.value for mode in ClockMode], default=ClockMode.SUDDEN_DEATH.value)
+    parser.add_argument("--increment", type=float, default=0, help="seconds for Fischer/Bronstein clocks")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.host, args.port, args.minutes * 60, ClockMode(args.clock), args.increment)
+
+    async def run():
+        await server.start()
+        print(f"Santorini server listening on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,30 @@ from models.coordinate import Coordinate
 from models.game import Game
 from models.worker import Worker
 from models.cell import Cell
-from typing import Callable, Dict, List, Optional
+from utils.constants import MAXIMUM_TOWER_LEVEL
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+EMPTY_BG = 'lightblue'
+HIGHLIGHT_BG = 'lightgreen'
+SELECTED_BG = 'darkblue'
+
+# Tower geometry inside an 80x80 cell canvas
+BASE_X, BASE_Y = 15, 65
+BLOCK_HEIGHT = 12
+BLOCK_WIDTH = 50
+BLOCK_COLORS = ['#e6e6fa', '#d8bfd8', '#dda0dd']
+
+# What an untouched cell shows: (level, dome, worker id, worker colour)
+EMPTY_CELL = (0, False, None, None)
+
+
+class CellItems(NamedTuple):
+    """Canvas item ids drawn in one cell"""
+    blocks: List[int]
+    dome: int
+    body: int
+    label: int
+
 
 class GameBoard(tk.Frame):
     """
@@ -20,8 +43,15 @@ class GameBoard(tk.Frame):
         # UI state
         self.canvases: Dict[tuple, tk.Canvas] = {}
         self.highlighted_cells: List[Cell] = []
+        self.highlight_color: str = HIGHLIGHT_BG
         self.selected_cell: Optional[Cell] = None
         
+        # Render cache: canvas items are created once per cell and reconfigured,
+        # and a cell is only touched when what it shows has changed
+        self.cell_items: Dict[tuple, CellItems] = {}
+        self.rendered: Dict[tuple, tuple] = {}  # (level, dome, worker id, worker colour) last drawn
+        self.backgrounds: Dict[tuple, str] = {}
+        
         # Callbacks for parent communication
         self.cell_click_callback: Optional[Callable[[int, int], None]] = None
         self.worker_click_callback: Optional[Callable[[Worker], None]] = None
@@ -37,13 +67,16 @@ class GameBoard(tk.Frame):
                     self, 
                     width=80, 
                     height=80, 
-                    bg='lightblue',
+                    bg=EMPTY_BG,
                     highlightthickness=2, 
                     highlightbackground='darkblue'
                 )
                 canvas.grid(row=row, column=col, padx=1, pady=1)
                 canvas.bind("<Button-1>", lambda e, r=row, c=col: self._on_canvas_click(r, c))
                 self.canvases[(row, col)] = canvas
+                self.cell_items[(row, col)] = self._create_cell_items(canvas)
+                self.rendered[(row, col)] = EMPTY_CELL
+                self.backgrounds[(row, col)] = EMPTY_BG
                 
     def _on_canvas_click(self, row: int, col: int):
         """Handle clicks on canvas cells."""
@@ -68,124 +101,137 @@ class GameBoard(tk.Frame):
         """Set callback for worker clicks."""
         self.worker_click_callback = callback
         
-    def highlight_cells(self, cells: List[Cell], color: str = 'lightgreen'):
+    def highlight_cells(self, cells: List[Cell], color: str = HIGHLIGHT_BG):
         """Highlight specific cells with given color."""
         # Clear previous highlights
         self.clear_highlights()
         
         # Apply new highlights
         self.highlighted_cells = cells.copy()
+        self.highlight_color = color
         for cell in cells:
-            row, col = cell.coordinate.row, cell.coordinate.col
-            if (row, col) in self.canvases:
-                self.canvases[(row, col)].config(bg=color)
+            self._set_background(cell, color)
                 
     def clear_highlights(self):
         """Clear all cell highlights."""
         for cell in self.highlighted_cells:
-            row, col = cell.coordinate.row, cell.coordinate.col
-            if (row, col) in self.canvases:
-                self.canvases[(row, col)].config(bg='lightblue')
+            self._set_background(cell, EMPTY_BG)
         self.highlighted_cells.clear()
         
-    def select_cell(self, cell: Cell, color: str = 'darkblue'):
+    def select_cell(self, cell: Cell, color: str = SELECTED_BG):
         """Visually select a specific cell."""
         if self.selected_cell:
             self.deselect_cell()
             
         self.selected_cell = cell
-        row, col = cell.coordinate.row, cell.coordinate.col
-        if (row, col) in self.canvases:
-            self.canvases[(row, col)].config(bg=color)
+        self._set_background(cell, color)
             
     def deselect_cell(self):
         """Deselect the currently selected cell."""
         if self.selected_cell:
-            row, col = self.selected_cell.coordinate.row, self.selected_cell.coordinate.col
-            if (row, col) in self.canvases:
-                # Restore original color (check if it should be highlighted)
-                if self.selected_cell in self.highlighted_cells:
-                    self.canvases[(row, col)].config(bg='lightgreen')
-                else:
-                    self.canvases[(row, col)].config(bg='lightblue')
+            # Restore original color (check if it should be highlighted)
+            if self.selected_cell in self.highlighted_cells:
+                self._set_background(self.selected_cell, self.highlight_color)
+            else:
+                self._set_background(self.selected_cell, EMPTY_BG)
             self.selected_cell = None
             
     def refresh_display(self):
-        """Refresh the entire board display."""
-        # Clear all canvases
-        for canvas in self.canvases.values():
-            canvas.delete("all")
-            canvas.config(bg='lightblue')
+        """
+        Bring the board display up to date. Only cells whose tower, dome, worker
+        or highlight changed since the last refresh are redrawn.
+        """
+        self.refresh_cells(self.board.cells)
+        
+    def refresh_cells(self, cells: List[Cell]):
+        """Bring just these cells up to date, e.g. the ones a network update changed."""
+        highlighted = set(self.highlighted_cells)
+        for cell in cells:
+            key = (cell.coordinate.row, cell.coordinate.col)
+            rendered = self.rendered.get(key)
+            if rendered is None:
+                continue
             
-        # Redraw all cells
-        for (row, col), canvas in self.canvases.items():
-            coordinate = Coordinate(row, col)
-            cell = self.board.get_cell(coordinate)
+            if cell is self.selected_cell:
+                self._set_background(cell, SELECTED_BG)
+            elif cell in highlighted:
+                self._set_background(cell, self.highlight_color)
+            else:
+                self._set_background(cell, EMPTY_BG)
             
-            if cell:
-                # Draw tower if present
-                if cell.tower:
-                    self._draw_tower(canvas, cell.tower.get_tower_level(), cell.tower.has_dome())
-                    
-                # Draw worker if present
-                if cell.worker:
-                    self._draw_worker(canvas, cell.worker)
-                    
-        # Restore highlights and selection
-        if self.highlighted_cells:
-            for cell in self.highlighted_cells:
-                row, col = cell.coordinate.row, cell.coordinate.col
-                if (row, col) in self.canvases:
-                    self.canvases[(row, col)].config(bg='lightgreen')
-                    
-        if self.selected_cell:
-            row, col = self.selected_cell.coordinate.row, self.selected_cell.coordinate.col
-            if (row, col) in self.canvases:
-                self.canvases[(row, col)].config(bg='darkblue')
+            worker = cell.worker
+            state = (
+                cell.level,
+                cell.dome,
+                worker.id if worker else None,
+                getattr(worker.player, "token_color", "gray") if worker else None,
+            )
+            if state != rendered:
+                self._draw_cell(key, state)
+                self.rendered[key] = state
                 
-    def _draw_tower(self, canvas: tk.Canvas, level: int, has_dome: bool):
-        """Draw a tower on the given canvas."""
-        if level == 0 and not has_dome:
-            return
+    def _set_background(self, cell: Cell, color: str):
+        """Change a cell's background colour if it is not already that colour."""
+        key = (cell.coordinate.row, cell.coordinate.col)
+        if key in self.backgrounds and self.backgrounds[key] != color:
+            self._apply_background(key, color)
+            self.backgrounds[key] = color
             
-        base_x, base_y = 15, 65
-        block_height = 12
-        block_width = 50
-        
-        # Colors for different levels
-        colors = ['#e6e6fa', '#d8bfd8', '#dda0dd']
+    def _apply_background(self, key: tuple, color: str):
+        """Paint a cell's background."""
+        self.canvases[key].config(bg=color)
         
-        # Draw blocks
-        for i in range(level):
-            y_offset = i * block_height
-            canvas.create_rectangle(
-                base_x, base_y - y_offset - block_height,
-                base_x + block_width, base_y - y_offset,
-                fill=colors[min(i, len(colors)-1)], 
+    def _draw_cell(self, key: tuple, state: tuple):
+        """Redraw the tower and worker of a cell from its (level, dome, worker id, colour) state."""
+        canvas, items = self.canvases[key], self.cell_items[key]
+        level, has_dome, worker_id, color = state
+        self._draw_tower(canvas, items, level, has_dome)
+        self._draw_worker(canvas, items, worker_id, color)
+            
+    def _create_cell_items(self, canvas: tk.Canvas) -> CellItems:
+        """Create the hidden tower, dome and worker items a cell reuses for its lifetime."""
+        blocks = []
+        for i in range(MAXIMUM_TOWER_LEVEL):
+            y_offset = i * BLOCK_HEIGHT
+            blocks.append(canvas.create_rectangle(
+                BASE_X, BASE_Y - y_offset - BLOCK_HEIGHT,
+                BASE_X + BLOCK_WIDTH, BASE_Y - y_offset,
+                fill=BLOCK_COLORS[min(i, len(BLOCK_COLORS)-1)], 
                 outline='#4b0082',
-                width=1
-            )
+                width=1,
+                state='hidden'
+            ))
+        dome = canvas.create_oval(
+            0, 0, 0, 0,
+            fill="#ffd700", 
+            outline="#8b4513",
+            width=2,
+            state='hidden'
+        )
+        body = canvas.create_oval(25, 20, 55, 50, fill='gray', outline='black', width=2, state='hidden')
+        label = canvas.create_text(40, 35, text='', fill='white', 
+                                   font=('Arial', 12, 'bold'), state='hidden')
+        return CellItems(blocks, dome, body, label)
+                
+    def _draw_tower(self, canvas: tk.Canvas, items: CellItems, level: int, has_dome: bool):
+        """Show the tower blocks and dome for a cell."""
+        for i, block in enumerate(items.blocks):
+            canvas.itemconfig(block, state='normal' if i < level else 'hidden')
             
         # Draw dome if present
         if has_dome:
-            dome_y = base_y - level * block_height - 8
-            canvas.create_oval(
-                base_x + 10, dome_y - 10,
-                base_x + block_width - 10, dome_y + 5,
-                fill="#ffd700", 
-                outline="#8b4513",
-                width=2
-            )
+            dome_y = BASE_Y - level * BLOCK_HEIGHT - 8
+            canvas.coords(items.dome, BASE_X + 10, dome_y - 10, BASE_X + BLOCK_WIDTH - 10, dome_y + 5)
+            canvas.itemconfig(items.dome, state='normal')
+        else:
+            canvas.itemconfig(items.dome, state='hidden')
             
-    def _draw_worker(self, canvas: tk.Canvas, worker: Worker):
-        """Draw a worker on the given canvas."""
-        # Determine player color
-        
-        color = getattr(worker.player, "token_color", "gray")
-        
-        # Draw worker body
-        canvas.create_oval(25, 20, 55, 50, fill=color, outline='black', width=2)
+    def _draw_worker(self, canvas: tk.Canvas, items: CellItems, worker_id: Optional[int], color: Optional[str]):
+        """Show or hide the worker token for a cell."""
+        if worker_id is None:
+            canvas.itemconfig(items.body, state='hidden')
+            canvas.itemconfig(items.label, state='hidden')
+            return
         
-        # Draw worker ID
-        canvas.create_text(40, 35, text=str(worker.id), fill='white', 
-                          font=('Arial', 12, 'bold'))
+        canvas.itemconfig(items.body, fill=color, state='normal')
+        canvas.itemconfig(items.label, text=str(worker_id), state='normal')
@@ -0,0 +1,148 @@
+import tkinter as tk
+import weakref
+from typing import Dict, Optional, Tuple
+from models.game import Game
+from screens.board_component import (
+    BASE_X, BASE_Y, BLOCK_COLORS, BLOCK_HEIGHT, BLOCK_WIDTH, EMPTY_BG, EMPTY_CELL, GameBoard
+)
+
+CELL_SIZE = 80  # Matches the per-cell canvases of GameBoard
+CELL_GAP = 4  # Space between cells, filled by the board colour
+
+# Pre-rendered cell contents, shared by every board under the same Tk root:
+# root -> {(level, dome, worker colour) -> image}. Weak keys let a closed
+# root take its images with it.
+_sprites: "weakref.WeakKeyDictionary[tk.Tk, Dict[tuple, tk.PhotoImage]]" = weakref.WeakKeyDictionary()
+
+
+class CanvasBoard(GameBoard):
+    """
+    Santorini board drawn on a single canvas.
+    Each cell is a background rectangle, one cached sprite image for its tower,
+    dome and worker, and a worker label. Clicks are mapped to cells by position,
+    so the widget count no longer grows with the board size.
+    """
+
+    def __init__(self, master, game: Game, *args, **kwargs):
+        self.canvas: Optional[tk.Canvas] = None
+        self.background_items: Dict[tuple, int] = {}
+        self.sprite_items: Dict[tuple, int] = {}
+        self.label_items: Dict[tuple, int] = {}
+        super().__init__(master, game, *args, **kwargs)
+
+    def _create_board_grid(self):
+        """Create the canvas and the three items of every cell."""
+        rows, cols = self.board.rows, self.board.cols
+        pitch = CELL_SIZE + CELL_GAP
+        self.canvas = tk.Canvas(
+            self,
+            width=cols * pitch,
+            height=rows * pitch,
+            bg='darkblue',
+            highlightthickness=0
+        )
+        self.canvas.pack()
+        self.canvas.bind("<Button-1>", self._on_board_click)
+
+        for row in range(rows):
+            for col in range(cols):
+                x, y = col * pitch + CELL_GAP // 2, row * pitch + CELL_GAP // 2
+                self.background_items[(row, col)] = self.canvas.create_rectangle(
+                    x, y, x + CELL_SIZE, y + CELL_SIZE, fill=EMPTY_BG, width=0
+                )
+                self.sprite_items[(row, col)] = self.canvas.create_image(x, y, anchor='nw', state='hidden')
+                self.label_items[(row, col)] = self.canvas.create_text(
+                    x + 40, y + 35, text='', fill='white', font=('Arial', 12, 'bold'), state='hidden'
+                )
+                self.rendered[(row, col)] = EMPTY_CELL
+                self.backgrounds[(row, col)] = EMPTY_BG
+
+    def _on_board_click(self, event):
+        """Work out which cell was clicked from the click position."""
+        pitch = CELL_SIZE + CELL_GAP
+        row, col = event.y // pitch, event.x // pitch
+        if 0 <= row < self.board.rows and 0 <= col < self.board.cols:
+            self._on_canvas_click(row, col)
+
+    def _apply_background(self, key: tuple, color: str):
+        """Paint a cell's background rectangle."""
+        self.canvas.itemconfig(self.background_items[key], fill=color)
+
+    def _draw_cell(self, key: tuple, state: tuple):
+        """Swap in the cached sprite for the cell's tower and worker."""
+        level, has_dome, worker_id, color = state
+        if level == 0 and not has_dome and worker_id is None:
+            self.canvas.itemconfig(self.sprite_items[key], state='hidden')
+        else:
+            self.canvas.itemconfig(self.sprite_items[key], image=self._sprite(level, has_dome, color), state='normal')
+
+        if worker_id is None:
+            self.canvas.itemconfig(self.label_items[key], state='hidden')
+        else:
+            self.canvas.itemconfig(self.label_items[key], text=str(worker_id), state='normal')
+
+    def _sprite(self, level: int, has_dome: bool, color: Optional[str]) -> tk.PhotoImage:
+        """Return the sprite for a cell's contents, rendering it the first time it is needed."""
+        root = self._root()
+        sprites = _sprites.get(root)
+        if sprites is None:
+            sprites = _sprites[root] = {}
+        key = (level, has_dome, color)
+        sprite = sprites.get(key)
+        if sprite is None:
+            sprite = _render_sprite(root, level, has_dome, color)
+            sprites[key] = sprite
+        return sprite
+
+
+def _render_sprite(master, level: int, has_dome: bool, color: Optional[str]) -> tk.PhotoImage:
+    """Paint a tower, dome and worker the way GameBoard draws them onto a transparent image."""
+    image = tk.PhotoImage(master=master, width=CELL_SIZE, height=CELL_SIZE)
+
+    # Tower blocks, bottom up
+    for i in range(level):
+        y_offset = i * BLOCK_HEIGHT
+        _put_rectangle(
+            image, BLOCK_COLORS[min(i, len(BLOCK_COLORS)-1)], '#4b0082', 1,
+            (BASE_X, BASE_Y - y_offset - BLOCK_HEIGHT, BASE_X + BLOCK_WIDTH, BASE_Y - y_offset)
+        )
+
+    # Dome
+    if has_dome:
+        dome_y = BASE_Y - level * BLOCK_HEIGHT - 8
+        _put_oval(image, '#ffd700', '#8b4513', 2,
+                  (BASE_X + 10, dome_y - 10, BASE_X + BLOCK_WIDTH - 10, dome_y + 5))
+
+    # Worker token; its number is a separate text item
+    if color is not None:
+        _put_oval(image, color, 'black', 2, (25, 20, 55, 50))
+
+    return image
+
+
+def _put_rectangle(image: tk.PhotoImage, fill: str, outline: str, width: int, box: Tuple[int, int, int, int]):
+    x0, y0, x1, y1 = box
+    image.put(outline, to=(x0, y0, x1, y1))
+    image.put(fill, to=(x0 + width, y0 + width, x1 - width, y1 - width))
+
+
+def _put_oval(image: tk.PhotoImage, fill: str, outline: str, width: int, box: Tuple[int, int, int, int]):
+    x0, y0, x1, y1 = box
+    _put_ellipse(image, outline, x0, y0, x1, y1)
+    _put_ellipse(image, fill, x0 + width, y0 + width, x1 - width, y1 - width)
+
+
+def _put_ellipse(image: tk.PhotoImage, color: str, x0: int, y0: int, x1: int, y1: int):
+    """Fill an ellipse inside the box one pixel row at a time."""
+    centre_x, centre_y = (x0 + x1) / 2, (y0 + y1) / 2
+    radius_x, radius_y = (x1 - x0) / 2, (y1 - y0) / 2
+    if radius_x <= 0 or radius_y <= 0:
+        return
+    for y in range(y0, y1):
+        dy = (y + 0.5 - centre_y) / radius_y
+        if abs(dy) >= 1:
+            continue
+        half_width = radius_x * (1 - dy * dy) ** 0.5
+        left, right = round(centre_x - half_width), round(centre_x + half_width)
+        if right > left:
+            image.put(color, to=(left, y, right, y + 1))
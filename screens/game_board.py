@@ -1,61 +1,92 @@
-import random
+import math
+import queue
+import threading
 import tkinter as tk
 from tkinter import messagebox
 from typing import List, Optional
-from random import shuffle
-from models.board import Board
-from random import Random
+from controllers.game_clock import GameClock
 from models.cell import Cell
 from models.coordinate import Coordinate
 from models.game import Game
+from models.god_card import GOD_CARDS
 from models.player import Player
 from models.worker import Worker
-from controllers.game_manager import GameManager
-from logic.actions.move_action import MoveAction
-from logic.actions.build_action import BuildAction
-from screens.board_component import GameBoard
-from enum import Enum
-
-class TurnPhase(Enum):
-    """Enumeration for different phases of a turn."""
-    WORKER_SELECTION = "worker_selection"
-    MOVE_SELECTION = "move_selection"
-    MOVE_EXECUTION = "move_execution"
-    BUILD_SELECTION = "build_selection"
-    BUILD_EXECUTION = "build_execution"
-    TURN_END = "turn_end"
+from engine import (
+    EngineAction,
+    IllegalActionError,
+    apply,
+    create_state,
+    declare_draw,
+    forfeit,
+    is_terminal,
+    legal_build_cells,
+    legal_dome_cells,
+    legal_move_cells,
+    validate,
+)
+from engine.turns import SearchPosition, turn_to_actions
+from screens.canvas_board import CanvasBoard
+from utils.enums import ActionType, ClockMode, EventType, TurnPhase
 
 class GameBoardScreen(tk.Frame):
     """
-    Main game screen that orchestrates the game flow.
-    Follows SRP by handling game state management and UI coordination.
+    Main game screen that presents the game flow.
+    The turn rules live in the headless engine; this screen only turns
+    clicks into engine actions and engine events into UI feedback.
     """
     
+    # Board renderer; screens.board_component.GameBoard draws one canvas per cell instead
+    board_class = CanvasBoard
+    
+    # Time control; the hidden-cell bonus applies on top of any increment
+    clock_mode = ClockMode.SUDDEN_DEATH
+    clock_increment_secs = 0
+    
+    # How often the screen checks whether the computer's search has finished
+    SEARCH_POLL_MS = 50
+    
     def __init__(self, master, game: Game, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         
         # Core game components
         self.game = game
-        self.game_manager = GameManager(game)
+        self.state = self._create_state(game)
+        self.game_manager = self.state.game_manager
+        self.clock = GameClock(game.get_players(), self.clock_mode, self.clock_increment_secs)
+        self.timer_job_id = None
+        self.timer_texts = {}  # Label -> text last shown, so unchanged labels are not reconfigured
         
-        # Turn state management
-        self.current_player: Player = self.game_manager.get_current_player()
-        self.turn_phase: TurnPhase = TurnPhase.WORKER_SELECTION
-        self.selected_worker: Optional[Worker] = None
-        self.selected_target_cell: Optional[Cell] = None
+        # The computer searches on a worker thread and hands its result back through this queue
+        self.search_results: queue.Queue = queue.Queue()
+        self.search_job_id = None
         
-        # Action tracking for god powers
-        self.has_moved = False
-        self.has_built = False
-        self.move_count = 0
-        self.build_count = 0
-        self.previous_move_cell: Optional[Cell] = None
-        self.first_build_cell: Optional[Cell] = None
-
+        # Target picked but not yet confirmed with the Execute buttons
+        self.selected_target_cell: Optional[Cell] = None
         
         self._create_ui()
-        self.game.get_board().create_hidden_cells(2)
         self._start_turn()
+    
+    def _create_state(self, game: Game):
+        """The engine state this screen presents."""
+        return create_state(game)
+    
+    @property
+    def current_player(self) -> Player:
+        return self.state.current_player
+    
+    @property
+    def selected_worker(self) -> Optional[Worker]:
+        return self.state.selected_worker
+    
+    @property
+    def turn_phase(self) -> TurnPhase:
+        """Engine phase, refined with the UI-only confirmation phases"""
+        if self.selected_target_cell is not None:
+            if self.state.turn_phase == TurnPhase.MOVE_SELECTION:
+                return TurnPhase.MOVE_EXECUTION
+            if self.state.turn_phase == TurnPhase.BUILD_SELECTION:
+                return TurnPhase.BUILD_EXECUTION
+        return self.state.turn_phase
         
     def _create_ui(self):
         """Create the user interface components."""
@@ -67,7 +98,7 @@ class GameBoardScreen(tk.Frame):
         self._create_info_panel()
         
         # Game board
-        self.board_display = GameBoard(self, self.game)
+        self.board_display = self.board_class(self, self.game)
         self.board_display.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
         self.board_display.set_worker_click_callback(self._on_worker_clicked)
         self.board_display.set_cell_click_callback(self._on_cell_clicked)
@@ -148,6 +179,15 @@ class GameBoardScreen(tk.Frame):
         )
         self.build_button.pack(side='left', padx=5, pady=5)
         
+        # Only ever enabled for Atlas, who may dome a cell below level 3
+        self.dome_button = tk.Button(
+            self.control_frame, 
+            text="Build Dome", 
+            command=self._execute_dome,
+            state='disabled'
+        )
+        self.dome_button.pack(side='left', padx=5, pady=5)
+        
         self.end_turn_button = tk.Button(
             self.control_frame, 
             text="End Turn", 
@@ -192,8 +232,18 @@ class GameBoardScreen(tk.Frame):
         
     def _update_display(self):
         """Update all display elements."""
+        self._update_turn_info()
+        
+        # Update board
+        self.board_display.refresh_display()
+        
+        # Update button states
+        self._update_button_states()
+        
+    def _update_turn_info(self):
+        """Update the current player and phase labels."""
         # Update player info
-        god_name = self.current_player.get_god_card().__class__.__name__ if self.current_player.get_god_card() else "None"
+        god_name = self.current_player.get_god_card().name if self.current_player.get_god_card() else "None"
         self.player_label.config(
             text=f"Current Player: {self.current_player.name} (God: {god_name})"
         )
@@ -202,41 +252,45 @@ class GameBoardScreen(tk.Frame):
         phase_text = self._get_phase_description()
         self.phase_label.config(text=phase_text)
         
-        # Update board
-        self.board_display.refresh_display()
-        
-        # Update button states
-        self._update_button_states()
-        
     def _get_phase_description(self) -> str:
         """Get human-readable description of current turn phase."""
+        build_first = " (or where to build first)" if self.state.turn_phase == TurnPhase.MOVE_SELECTION and self._build_targets() else ""
         phase_descriptions = {
             TurnPhase.WORKER_SELECTION: "Select a worker to use this turn",
-            TurnPhase.MOVE_SELECTION: f"Select where to move {self.selected_worker.name if self.selected_worker else 'worker'}",
+            TurnPhase.MOVE_SELECTION: f"Select where to move {self.selected_worker.name if self.selected_worker else 'worker'}{build_first}",
             TurnPhase.MOVE_EXECUTION: "Click 'Execute Move' to confirm movement",
             TurnPhase.BUILD_SELECTION: "Select where to build",
             TurnPhase.BUILD_EXECUTION: "Click 'Execute Build' to confirm building",
-            TurnPhase.TURN_END: "Turn complete - click 'End Turn'"
+            TurnPhase.TURN_END: "Turn complete - click 'End Turn'",
+            TurnPhase.GAME_OVER: "Game over"
         }
         return phase_descriptions.get(self.turn_phase, "")
         
     def _update_button_states(self):
         """Update the enabled/disabled state of control buttons."""
+        target = self.selected_target_cell
+        
         # Move button
-        if self.turn_phase == TurnPhase.MOVE_EXECUTION:
+        if self.turn_phase == TurnPhase.MOVE_EXECUTION and target in self._move_targets():
             self.move_button.config(state='normal')
         else:
             self.move_button.config(state='disabled')
             
-        # Build button
-        if self.turn_phase == TurnPhase.BUILD_EXECUTION:
+        # Build button; a target picked before moving is a build first (Prometheus)
+        if self.turn_phase in (TurnPhase.MOVE_EXECUTION, TurnPhase.BUILD_EXECUTION) and target in self._build_targets():
             self.build_button.config(state='normal')
         else:
             self.build_button.config(state='disabled')
             
+        # Dome button (Atlas)
+        if target is not None and target in self._dome_targets():
+            self.dome_button.config(state='normal')
+        else:
+            self.dome_button.config(state='disabled')
+            
         # End turn button
         if (self.turn_phase == TurnPhase.TURN_END and 
-            self.has_moved and self.has_built):
+            self.state.has_moved and self.state.has_built):
             self.end_turn_button.config(state='normal')
         else:
             self.end_turn_button.config(state='disabled')
@@ -247,48 +301,50 @@ class GameBoardScreen(tk.Frame):
         return f"{minutes:02d}:{seconds:02d}"
 
     def _update_timer_labels(self):
-        """Refresh both players’ timer labels based on their remaining_time_secs."""
+        """Refresh both players’ timer labels from the clock, touching only labels whose text changed."""
         players = self.game.get_players()
-        # Player 0
-        secs0 = players[0].remaining_time_secs
-        self.timer_label_p0.config(text=f"{players[0].name} Time: {self._format_secs_to_mmss(secs0)}")
-        # Player 1
-        secs1 = players[1].remaining_time_secs
-        self.timer_label_p1.config(text=f"{players[1].name} Time: {self._format_secs_to_mmss(secs1)}")
+        for label, player in ((self.timer_label_p0, players[0]), (self.timer_label_p1, players[1])):
+            text = f"{player.name} Time: {self._format_secs_to_mmss(self.clock.display_secs(player))}"
+            if self.timer_texts.get(label) != text:
+                label.config(text=text)
+                self.timer_texts[label] = text
 
     def _start_timer(self):
-        """Start ticking down the current player's clock once per second."""
+        """Start the current player's clock and the label updates."""
         # First, cancel any existing job (just in case)
-        if hasattr(self, 'timer_job_id') and self.timer_job_id is not None:
+        if self.timer_job_id is not None:
             self.after_cancel(self.timer_job_id)
+            self.timer_job_id = None
 
-        # Schedule the first tick immediately:
+        self.clock.start_turn(self.current_player)
         self._tick_timer()
 
     def _tick_timer(self):
-        """Decrement the current player's remaining_time_secs by 1 second, update the label,
-           then reschedule itself in 1 000 ms if time remains."""
-        # Identify which player is active
-        current_player = self.current_player
-        # Decrement one second
-        current_player.remaining_time_secs -= 1
-        
-        # Update both labels so the non-active player's label remains correct
+        """Update the labels, then wake up again exactly when the displayed time next changes."""
+        self.timer_job_id = None
+        current_player = self.clock.running_player
+        if current_player is None:
+            return
+        
         self._update_timer_labels()
         
-        if current_player.remaining_time_secs <= 0:
+        if self.clock.is_expired(current_player):
             # The current player’s clock just hit zero
             self._handle_time_expired(current_player)
             return
-        else:
-            # Reschedule the next tick in 1 000 ms
-            self.timer_job_id = self.after(1000, self._tick_timer)
+        
+        # Elapsed time comes from the monotonic clock, so a late callback costs
+        # the player nothing extra and no tick is needed while the display holds still
+        delay = self.clock.secs_until_display_change()
+        self.timer_job_id = self.after(max(1, math.ceil(delay * 1000)), self._tick_timer)
 
     def _stop_timer(self):
-        """Stop the countdown for whichever player is ticking now."""
-        if hasattr(self, 'timer_job_id') and self.timer_job_id is not None:
+        """Stop the running clock and its label updates."""
+        if self.timer_job_id is not None:
             self.after_cancel(self.timer_job_id)
             self.timer_job_id = None
+        self.clock.stop()
+        self._update_timer_labels()
 
     def _handle_time_expired(self, player: Player):
         """Called the instant a player's clock hits zero → that player loses immediately."""
@@ -299,239 +355,222 @@ class GameBoardScreen(tk.Frame):
         other = [p for p in self.game.get_players() if p is not player][0]
         messagebox.showinfo("Time's Up!", f"{player.name}'s time has expired.\n{other.name} wins!")
         
-        # Tell the GameManager to end the game:
-        self.game_manager.end_game(winner=other)
+        # Tell the engine to end the game:
+        forfeit(self.state, player)
 
         # Disable all further UI interactions
         self.move_button.config(state='disabled')
         self.build_button.config(state='disabled')
+        self.dome_button.config(state='disabled')
         self.end_turn_button.config(state='disabled')
             
 
     def _start_turn(self):
-        """Initialize a new turn."""
-        self.game_manager.start_turn()
-        self.current_player = self.game_manager.get_current_player()
-        
-        # Reset turn state
-        self.turn_phase = TurnPhase.WORKER_SELECTION
-        self.selected_worker = None
+        """Present the turn the engine has just started."""
         self.selected_target_cell = None
-        self.has_moved = False
-        self.has_built = False
-        self.move_count = 0
-        self.build_count = 0
-        self.previous_move_cell = None
-        self.first_build_cell = None
-        
-        # Check for loss condition
-        if self._check_loss_condition():
-            winner = self.game.get_players()[1] if self.current_player == self.game.get_players()[0] else self.game.get_players()[0]
-            self._handle_game_end(winner)
+        
+        # The engine ends the game when the player on turn cannot move
+        if is_terminal(self.state):
+            self._handle_game_end(self.state.winner)
             return
         
         self._start_timer()
             
         self._update_display()
         
-    def _check_loss_condition(self) -> bool:
-        """Check if current player has lost (no valid moves)."""
-        for worker in self.current_player.get_workers():
-            available_moves = self.game.get_board().get_available_move_cells(worker)
-            if available_moves:
-                return False
-        return True
-        
-    def _on_worker_clicked(self, worker: Worker):
-        """Handle worker selection."""
-        if worker.player != self.current_player:
-            messagebox.showwarning("Invalid Selection", "You can only select your own workers.")
+        if self._computer_player():
+            self.after(500, self._play_computer_turn)
+        
+    def _computer_player(self):
+        """The computer player controlling the current player, if any."""
+        return getattr(self.current_player, "computer_player", None)
+        
+    def _play_computer_turn(self):
+        """
+        Start the computer player's search on a worker thread. The search only
+        sees a SearchPosition copied here, so the Tk thread keeps the engine
+        state to itself and goes on drawing the clock while the computer thinks.
+        """
+        computer = self._computer_player()
+        if computer is None or is_terminal(self.state):
             return
-            
-        if self.turn_phase != TurnPhase.WORKER_SELECTION:
-            messagebox.showwarning("Invalid Action", "You can only select workers at the start of your turn.")
+        
+        position = SearchPosition.from_state(self.state)
+        time_limit = computer.time_budget(self.current_player.remaining_time_secs)
+        threading.Thread(
+            target=lambda: self.search_results.put(computer.search(position, time_limit)),
+            name="santorini-search",
+            daemon=True,
+        ).start()
+        self.search_job_id = self.after(self.SEARCH_POLL_MS, self._poll_computer_turn)
+    
+    def _poll_computer_turn(self):
+        """Play the computer's turn once its search has finished, otherwise check again shortly."""
+        self.search_job_id = None
+        try:
+            result = self.search_results.get_nowait()
+        except queue.Empty:
+            self.search_job_id = self.after(self.SEARCH_POLL_MS, self._poll_computer_turn)
             return
-            
-        self.selected_worker = worker
-        self.turn_phase = TurnPhase.MOVE_SELECTION
         
-        # Show available moves
-        available_moves = self.game.get_board().get_available_move_cells(worker)
-        if not available_moves:
-            messagebox.showerror("No Moves", "This worker has no valid moves.")
-            self.selected_worker = None
-            self.turn_phase = TurnPhase.WORKER_SELECTION
+        # The game may have ended on time or by a draw while the computer was thinking
+        if is_terminal(self.state):
             return
-            
-        self.board_display.highlight_cells(available_moves)
-        self._update_display()
         
-    def _on_cell_clicked(self, row: int, col: int):
-        """Handle cell selection for moves or builds."""
-        coordinate = Coordinate(row, col)
-        cell = self.game.get_board().get_cell(coordinate)
+        actions = turn_to_actions(self.state, result.turn) if result.turn is not None else []
+        for action in actions:
+            if action.action_type == ActionType.END_TURN:
+                break
+            for event in apply(self.state, action):
+                if event.event_type == EventType.HIDDEN_CELL_REVEALED:
+                    self._handle_hidden_cell_reveal(event.message)
         
-        if not cell:
+        if is_terminal(self.state):
+            self._handle_game_end(self.state.winner)
             return
-            
-        if self.turn_phase == TurnPhase.MOVE_SELECTION:
-            self._select_move_target(cell)
-        elif self.turn_phase == TurnPhase.BUILD_SELECTION:
-            self._select_build_target(cell)
-            
-    def _select_move_target(self, cell: Cell):
-        """Handle move target selection."""
-        if not self.selected_worker:
+        self._end_turn()
+        
+    def destroy(self):
+        if self.search_job_id is not None:
+            self.after_cancel(self.search_job_id)
+            self.search_job_id = None
+        super().destroy()
+        
+    def _on_worker_clicked(self, worker: Worker):
+        """Handle worker selection."""
+        if self._computer_player():
             return
-            
-        # Validate move
-        available_moves = self.game.get_board().get_available_move_cells(self.selected_worker)
-        if cell not in available_moves:
-            messagebox.showwarning("Invalid Move", "That cell is not a valid move target.")
+        
+        # Apollo and Minotaur may move onto an opponent's worker
+        if worker.get_position() in self._move_targets():
+            coordinate = worker.get_position().coordinate
+            self._on_cell_clicked(coordinate.row, coordinate.col)
             return
-            
-        # Special validation for Artemis second move
-        god_card = self.current_player.get_god_card()
-        if (self.move_count > 0 and god_card and god_card.__class__.__name__ == "Artemis" 
-            and self.previous_move_cell and cell.coordinate == self.previous_move_cell.coordinate):
-            messagebox.showwarning("Invalid Move", "Artemis cannot move back to the previous cell.")
+        
+        try:
+            apply(self.state, EngineAction.select_worker(worker.id))
+        except IllegalActionError as error:
+            messagebox.showwarning(error.title, str(error))
             return
             
-        self.selected_target_cell = cell
-        self.board_display.select_cell(cell)
-        self.turn_phase = TurnPhase.MOVE_EXECUTION
+        # Show available moves
+        self.board_display.highlight_cells(self._move_targets())
         self._update_display()
         
-    def _select_build_target(self, cell: Cell):
-        """Handle build target selection."""
-        if not self.selected_worker:
-            return
-            
-        # Validate build
-        available_builds = self.game.get_board().get_available_build_cells(self.selected_worker)
-        if cell not in available_builds:
-            messagebox.showwarning("Invalid Build", "That cell is not a valid build target.")
+    def _on_cell_clicked(self, row: int, col: int):
+        """Handle cell selection for moves or builds."""
+        if self._computer_player():
             return
+        
+        if self.state.turn_phase == TurnPhase.MOVE_SELECTION:
+            cell = self.game.get_board().get_cell(Coordinate(row, col))
+            if cell not in self._move_targets() and cell in self._build_targets():
+                self._select_target(EngineAction.build_on(row, col))
+            else:
+                self._select_target(EngineAction.move_to(row, col))
+        elif self.state.turn_phase == TurnPhase.BUILD_SELECTION:
+            self._select_target(EngineAction.build_on(row, col))
             
-        # Special validation for Demeter
-        god_card = self.current_player.get_god_card()
-        if (self.build_count > 0 and god_card and god_card.__class__.__name__ == "Demeter"
-            and self.first_build_cell and cell.coordinate == self.first_build_cell.coordinate):
-            messagebox.showwarning("Invalid Build", "Demeter cannot build twice on the same cell.")
+    def _select_target(self, action: EngineAction):
+        """Handle move or build target selection, pending confirmation."""
+        try:
+            validate(self.state, action)
+        except IllegalActionError as error:
+            messagebox.showwarning(error.title, str(error))
             return
             
+        cell = self.game.get_board().get_cell(Coordinate(action.row, action.col))
         self.selected_target_cell = cell
         self.board_display.select_cell(cell)
-        self.turn_phase = TurnPhase.BUILD_EXECUTION
         self._update_display()
         
     def _execute_move(self):
         """Execute the selected move."""
         if not self.selected_worker or not self.selected_target_cell:
             return
-            
-        # Save previous position for Artemis
-        self.previous_move_cell = self.selected_worker.get_position()
         
-        # Create and execute move action
-        action = MoveAction(self.current_player, self.selected_worker, self.selected_target_cell)
-        result = self.game_manager.execute_turn(action)
-        
-        if result is True or isinstance(result, str):
-            self.has_moved = True
-            self.move_count += 1
-
-            # Check for win condition
-            if self.game_manager.check_win_condition(action):
-                self._handle_game_end(self.current_player)
-                return
-            
-            # Handle hidden cell reveal
-            if isinstance(result, str) and result.startswith("HIDDEN_CELL_REVEALED:"):
-                hidden_message = result.split(":", 1)[1]
-                self._handle_hidden_cell_reveal(hidden_message)
-                # Continue with normal flow after showing the message
-                result = True
-                
-            # Handle god power results
-            god_card = self.current_player.get_god_card()
-            if result == "SECOND_MOVE" and god_card and god_card.__class__.__name__ == "Artemis":
-                # Allow second move
-                self.turn_phase = TurnPhase.MOVE_SELECTION
-                available_moves = self.game.get_board().get_available_move_cells(self.selected_worker)
-                self.board_display.clear_highlights()
-                self.board_display.deselect_cell()
-                self.board_display.highlight_cells(available_moves)
-                self.selected_target_cell = None
-                messagebox.showinfo("Artemis Power", "You may move again (but not back to the previous cell).")
-            elif result == "TRITON_EXTRA_MOVE" and god_card and god_card.__class__.__name__ == "Triton":
-                # Triton: may chain indefinitely while landing on perimeter
-                self.turn_phase = TurnPhase.MOVE_SELECTION
-                available_moves = self.game.get_board().get_available_move_cells(self.selected_worker)
-                self.board_display.clear_highlights()
-                self.board_display.deselect_cell()
-                self.board_display.highlight_cells(available_moves)
-                self.selected_target_cell = None
-                messagebox.showinfo("Triton Power", "Your worker moved to a perimeter space - you may move again!")
-
-            else:
-                # No further moves → proceed to build phase
-                self._transition_to_build()
-        else:
-            messagebox.showerror("Invalid Move", "The move could not be executed.")
-            
-        self._update_display()
+        coordinate = self.selected_target_cell.coordinate
+        self._execute(EngineAction.move_to(coordinate.row, coordinate.col), "Invalid Move")
         
     def _execute_build(self):
         """Execute the selected build."""
         if not self.selected_worker or not self.selected_target_cell:
             return
         
-        # Create and execute build action
-        action = BuildAction(self.current_player, self.selected_worker, self.selected_target_cell)
-        result = self.game_manager.execute_turn(action)
+        coordinate = self.selected_target_cell.coordinate
+        self._execute(EngineAction.build_on(coordinate.row, coordinate.col), "Invalid Build")
         
-        if result is True or isinstance(result, str):
-            self.has_built = True
-            self.build_count += 1
-            
-            # Save first build cell for Demeter
-            if self.build_count == 1:
-                self.first_build_cell = self.selected_target_cell
-            
-            # Handle god power results
-            god_card = self.current_player.get_god_card()
-            if result == "SECOND_BUILD" and god_card and god_card.__class__.__name__ == "Demeter":
-                # Allow second build
-                self.turn_phase = TurnPhase.BUILD_SELECTION
-                available_builds = self.game.get_board().get_available_build_cells(self.selected_worker)
-                self.board_display.clear_highlights()
-                self.board_display.deselect_cell()
-                self.board_display.highlight_cells(available_builds)
-                self.selected_target_cell = None
-                messagebox.showinfo("Demeter Power", "You may build again (but not on the same cell).")
-            else:
-
-                self.turn_phase = TurnPhase.TURN_END
-        else:
-            messagebox.showerror("Invalid Build", "The build could not be executed.")
+    def _execute_dome(self):
+        """Execute the selected build as a dome."""
+        if not self.selected_worker or not self.selected_target_cell:
+            return
+        
+        coordinate = self.selected_target_cell.coordinate
+        self._execute(EngineAction.build_on(coordinate.row, coordinate.col, dome=True), "Invalid Build")
+        
+    def _execute(self, action: EngineAction, error_title: str):
+        """Apply a confirmed move/build and present the resulting events."""
+        try:
+            events = apply(self.state, action)
+        except IllegalActionError as error:
+            messagebox.showerror(error_title, str(error))
+            self._update_display()
+            return
+        
+        self.selected_target_cell = None
+        
+        if is_terminal(self.state):
+            self._handle_game_end(self.state.winner)
+            return
+        
+        for event in events:
+            if event.event_type == EventType.HIDDEN_CELL_REVEALED:
+                self._handle_hidden_cell_reveal(event.message)
+        
+        self._highlight_targets()
+        
+        for event in events:
+            if event.event_type != EventType.HIDDEN_CELL_REVEALED:
+                self._announce_god_power()
         
         self._update_display()
         
-    def _transition_to_build(self):
-        """Transition from move phase to build phase."""
-        self.turn_phase = TurnPhase.BUILD_SELECTION
-        available_builds = self.game.get_board().get_available_build_cells(self.selected_worker)
+    def _announce_god_power(self):
+        """Tell the current player their god card offers another move or build."""
+        god_card = self.current_player.get_god_card()
+        if god_card and god_card.continuation_message:
+            messagebox.showinfo(f"{god_card.name} Power", god_card.continuation_message)
         
+    def _highlight_targets(self):
+        """Highlight the legal targets of the current move or build phase."""
         self.board_display.clear_highlights()
         self.board_display.deselect_cell()
-        self.board_display.highlight_cells(available_builds)
-        self.selected_target_cell = None
+        if self.state.turn_phase == TurnPhase.MOVE_SELECTION:
+            self.board_display.highlight_cells(self._move_targets())
+        elif self.state.turn_phase == TurnPhase.BUILD_SELECTION:
+            self.board_display.highlight_cells(self._build_targets())
+    
+    def _move_targets(self) -> List[Cell]:
+        """Cells the selected worker may move to now."""
+        return legal_move_cells(self.state)
+    
+    def _build_targets(self) -> List[Cell]:
+        """Cells the selected worker may build on now, before moving for Prometheus."""
+        return legal_build_cells(self.state)
+    
+    def _dome_targets(self) -> List[Cell]:
+        """Cells below level 3 the selected worker may dome now (Atlas)."""
+        return legal_dome_cells(self.state)
         
     def _end_turn(self):
         """End the current turn and start the next."""
+        try:
+            apply(self.state, EngineAction.end_turn())
+        except IllegalActionError as error:
+            messagebox.showwarning(error.title, str(error))
+            return
+        self.clock.end_turn()  # Banks the time used and applies any increment
         self._stop_timer()
-        self.game_manager.end_turn()
         self.board_display.clear_highlights()
         self.board_display.deselect_cell()
         self._start_turn()
@@ -555,17 +594,14 @@ class GameBoardScreen(tk.Frame):
         text = tk.Text(god_window, wrap=tk.WORD, height=15, width=50)
         text.pack(expand=True, fill=tk.BOTH)
 
-        god_info = {
-            "Artemis": "Can move one additional time, but not back to the original space.",
-            "Demeter": "Can build an additional time, but not on the same space.",
-            "Triton": "Can move again if on the perimeter after moving.",
-        }
-
-        for god, desc in god_info.items():
-            text.insert(tk.END, f"{god}:\n{desc}\n\n")
+        for god, card_class in GOD_CARDS.items():
+            text.insert(tk.END, f"{god}:\n{card_class.description}\n\n")
 
     def _propose_draw(self):
         """Offer the opponent a draw."""
+        if self._computer_player():
+            return
+        
         proposer = self.current_player
         opponent = [p for p in self.game.get_players() if p != proposer][0]
 
@@ -576,12 +612,13 @@ class GameBoardScreen(tk.Frame):
 
         if response:
             self._stop_timer()
-            self.game_manager.end_game()  # No winner
+            declare_draw(self.state)  # No winner
             messagebox.showinfo("Game Drawn", "The game ends in a draw. You both win!")
             
             # Disable all buttons
             self.move_button.config(state='disabled')
             self.build_button.config(state='disabled')
+            self.dome_button.config(state='disabled')
             self.end_turn_button.config(state='disabled')
             self.draw_button.config(state='disabled')
         else:
@@ -594,6 +631,7 @@ class GameBoardScreen(tk.Frame):
         # Disable main game UI completely
         self.move_button.config(state='disabled')
         self.build_button.config(state='disabled')
+        self.dome_button.config(state='disabled')
         self.end_turn_button.config(state='disabled')
         self.draw_button.config(state='disabled')
 
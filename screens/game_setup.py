@@ -1,13 +1,10 @@
 import tkinter as tk
-import random
 from tkinter import messagebox
 
+from engine import create_game
+from engine.ai import AlphaBetaPlayer
 from models.game import Game
-from models.player import Player
-from models.worker import Worker
-from models.god_card import Artemis, Demeter, Triton
-from models.coordinate import Coordinate
-from typing import Callable, List
+from typing import Callable
 
 class GameSetupScreen(tk.Frame):
     """
@@ -56,6 +53,13 @@ class GameSetupScreen(tk.Frame):
         self.player2_entry.insert(0, "Player 2")
         self.player2_entry.grid(row=1, column=1, padx=5, pady=5)
         
+        self.computer_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            name_frame,
+            text="Player 2 is a computer",
+            variable=self.computer_var
+        ).grid(row=2, column=0, columnspan=2, pady=5)
+        
         # Board size
         tk.Label(setup_frame, text="Board Size:", font=("Arial", 14)).pack(pady=(20, 10))
         
@@ -102,55 +106,20 @@ class GameSetupScreen(tk.Frame):
                 messagebox.showerror("Invalid Names", "Players must have different names.")
                 return
                 
-            # Create players
-            player1 = Player(player1_name)
-            player2 = Player(player2_name)
+            # Create game with random god cards and worker placement
+            board_size = self.board_size_var.get()
+            game = create_game([player1_name, player2_name], board_size)
+            player1, player2 = game.get_players()
 
             # Assign token colors explicitly
             player1.token_color = "green"
             player2.token_color = "red"
             
-            # Create game
-            board_size = self.board_size_var.get()
-            game = Game(players=[player1, player2], board_size=board_size)
-            
-            # Setup god cards if enabled
-            god_cards = [Artemis(), Demeter(), Triton()]
-            random.shuffle(god_cards)
-            game.initialize_game(god_cards[:2])
-            
-                
-            # Place workers randomly
-            self._place_workers_randomly(game)
+            if self.computer_var.get():
+                player2.computer_player = AlphaBetaPlayer()
             
             # Start the game
             self.start_game_callback(game)
             
         except Exception as e:
             messagebox.showerror("Setup Error", f"Failed to start game: {str(e)}")
-            
-    def _place_workers_randomly(self, game: Game):
-        """Randomly place workers on the board."""
-        board = game.get_board()
-        available_coords = []
-        
-        # Get all ground-level coordinates
-        for coord, cell in board.grid.items():
-            if not cell.tower or cell.tower.get_tower_level() == 0:
-                available_coords.append(coord)
-                
-        # Shuffle coordinates
-        random.shuffle(available_coords)
-        
-        # Place workers
-        worker_id = 1
-        for player in game.get_players():
-            for _ in range(1,3):  # Each player gets 2 workers
-                if not available_coords:
-                    raise ValueError("Not enough space to place all workers")
-                    
-                coord = available_coords.pop()
-                cell = board.get_cell(coord)
-                worker = Worker(id=worker_id, position=cell, player=player)
-                player.add_worker(worker)
-                worker_id += 1
@@ -0,0 +1,231 @@
+from tkinter import messagebox
+from typing import List, Optional
+from models.cell import Cell
+from models.coordinate import Coordinate
+from models.game import Game
+from models.player import Player
+from models.worker import Worker
+from engine import EngineAction, create_state
+from network import protocol
+from network.client import DISCONNECTED, GameClient, apply_cells, game_from_start
+from screens.game_board import GameBoardScreen
+from utils.enums import EventType, TurnPhase
+
+
+class RemoteGameBoardScreen(GameBoardScreen):
+    """
+    Game screen for a match hosted by network.server.
+    Clicks are sent to the server as actions, and the server's updates are
+    applied to the local board: only the cells it reports as changed are
+    updated and redrawn. Messages are picked up from the client's queue by a
+    short `after` loop, so the window never waits on the network.
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, master, client: GameClient, start_message: dict, *args, **kwargs):
+        self.client = client
+        self.seat: int = start_message["seat"]
+        self.turn: dict = start_message  # Turn fields of the latest server message
+        self.targets: List[Cell] = []
+        self.build_targets: List[Cell] = []
+        self.dome_targets: List[Cell] = []
+        self.awaiting_reply = False
+        self.finished = False
+        self.poll_job_id = None
+
+        super().__init__(master, game_from_start(start_message), *args, **kwargs)
+
+        # There is no draw offer in the protocol; resigning takes its place
+        self.draw_button.config(text="Resign", command=self._resign)
+        self._poll_network()
+
+    def _create_state(self, game: Game):
+        """A local state the server's turn fields are copied into; hidden cells stay on the server."""
+        return create_state(game, num_hidden_cells=0)
+
+    @property
+    def is_my_turn(self) -> bool:
+        return not self.finished and self.turn["current"] == self.seat
+
+    def _poll_network(self):
+        """Handle everything the reader thread has received, then check again shortly."""
+        self.poll_job_id = None
+        for message in self.client.poll():
+            self._handle_message(message)
+            if self.finished:
+                return
+        self.poll_job_id = self.after(self.POLL_MS, self._poll_network)
+
+    def _handle_message(self, message: dict):
+        """Apply one server message to the screen."""
+        kind = message["type"]
+        if kind == protocol.UPDATE:
+            changed = apply_cells(self.game, message["cells"])
+            self._apply_turn(message)
+            self.board_display.refresh_cells(changed)
+            self._show_events(message["events"])
+        elif kind == protocol.ERROR:
+            self.awaiting_reply = False
+            messagebox.showwarning(message.get("title", "Error"), message.get("message", ""))
+            self._update_button_states()
+        elif kind == protocol.GAME_OVER:
+            self._finish_match(message)
+        elif kind == DISCONNECTED and not self.finished:
+            self.finished = True
+            self._stop_timer()
+            messagebox.showerror("Connection Lost", "The connection to the server was lost.")
+            self._update_button_states()
+            self.draw_button.config(state='disabled')
+
+    def _start_turn(self):
+        """Present the turn from the match_start message."""
+        self._apply_turn(self.turn)
+
+    def _apply_turn(self, fields: dict):
+        """Copy the server's turn fields into the local state, clocks and highlights."""
+        self.turn = fields
+        self.awaiting_reply = False
+        self.selected_target_cell = None
+
+        players = self.game.get_players()
+        board = self.game.get_board()
+        self.state.game_manager.current_player_index = fields["current"]
+        self.state.current_player = players[fields["current"]]
+        self.state.turn_phase = TurnPhase(fields["phase"])
+        self.state.selected_worker = self._find_worker(fields["selected_worker"])
+        self.state.has_moved = self.state.has_built = self.state.turn_phase == TurnPhase.TURN_END
+        self.targets = [board.get_cell(Coordinate(row, col)) for row, col in fields["targets"]]
+        self.build_targets = [board.get_cell(Coordinate(row, col)) for row, col in fields["build_targets"]]
+        self.dome_targets = [board.get_cell(Coordinate(row, col)) for row, col in fields["dome_targets"]]
+
+        # The server's clock is authoritative; the local one only counts down between messages
+        self._stop_timer()
+        for player, secs in zip(players, fields.get("clock", ())):
+            player.remaining_time_secs = secs
+        self._start_timer()
+
+        self.board_display.clear_highlights()
+        self.board_display.deselect_cell()
+        if self.is_my_turn and self.targets:
+            self.board_display.highlight_cells(self.targets)
+        self._update_display()
+
+    def _find_worker(self, worker_id: Optional[int]) -> Optional[Worker]:
+        if worker_id is None:
+            return None
+        for player in self.game.get_players():
+            worker = player.get_worker_by_id(worker_id)
+            if worker:
+                return worker
+        return None
+
+    def _show_events(self, events: List[list]):
+        """Tell the player about hidden cells and god powers the server reported."""
+        for event_type, message in events:
+            if event_type == EventType.HIDDEN_CELL_REVEALED.value:
+                self._handle_hidden_cell_reveal(message)
+        if not self.is_my_turn:
+            return
+        for event_type, _ in events:
+            if event_type != EventType.HIDDEN_CELL_REVEALED.value:
+                self._announce_god_power()
+
+    def _update_display(self):
+        """Update labels and buttons; board cells are redrawn as updates change them."""
+        self._update_turn_info()
+        self._update_button_states()
+
+    def _update_button_states(self):
+        """Only the player on turn, with no action in flight, can press anything."""
+        if self.is_my_turn and not self.awaiting_reply:
+            super()._update_button_states()
+        else:
+            self.move_button.config(state='disabled')
+            self.build_button.config(state='disabled')
+            self.dome_button.config(state='disabled')
+            self.end_turn_button.config(state='disabled')
+
+    def _move_targets(self) -> List[Cell]:
+        return self.targets if self.state.turn_phase == TurnPhase.MOVE_SELECTION else []
+
+    def _build_targets(self) -> List[Cell]:
+        return self.build_targets
+
+    def _dome_targets(self) -> List[Cell]:
+        return self.dome_targets
+
+    def _on_worker_clicked(self, worker: Worker):
+        """Ask the server to select a worker, or pick it as the target of an Apollo or Minotaur move."""
+        if not self.is_my_turn or self.awaiting_reply:
+            return
+        if worker.get_position() in self._move_targets():
+            coordinate = worker.get_position().coordinate
+            self._on_cell_clicked(coordinate.row, coordinate.col)
+            return
+        self._send(EngineAction.select_worker(worker.id))
+
+    def _select_target(self, action: EngineAction):
+        """Pick a move or build target from the server's legal targets, pending confirmation."""
+        if not self.is_my_turn or self.awaiting_reply:
+            return
+        cell = self.game.get_board().get_cell(Coordinate(action.row, action.col))
+        if cell not in self.targets and cell not in self.build_targets:
+            title = "Invalid Move" if self.state.turn_phase == TurnPhase.MOVE_SELECTION else "Invalid Build"
+            messagebox.showwarning(title, "That cell is not a legal target.")
+            return
+        self.selected_target_cell = cell
+        self.board_display.select_cell(cell)
+        self._update_display()
+
+    def _execute(self, action: EngineAction, error_title: str):
+        """Send a confirmed move or build; the server's update presents the result."""
+        self._send(action)
+
+    def _end_turn(self):
+        """Send the end of the turn."""
+        if self.is_my_turn and not self.awaiting_reply:
+            self._send(EngineAction.end_turn())
+
+    def _send(self, action: EngineAction):
+        self.awaiting_reply = True
+        self.client.send_action(action)
+        self._update_button_states()
+
+    def _handle_time_expired(self, player: Player):
+        """The local clock ran out; the server decides, so just wait for its verdict."""
+        self._stop_timer()
+
+    def _resign(self):
+        if self.finished:
+            return
+        if messagebox.askyesno("Resign", "Do you want to resign this game?"):
+            self.client.resign()
+
+    def _finish_match(self, message: dict):
+        """Show the server's result and stop talking to it."""
+        self.finished = True
+        players = self.game.get_players()
+        self._stop_timer()
+        for player, secs in zip(players, message.get("clock", ())):
+            player.remaining_time_secs = secs
+        self._update_timer_labels()
+        self.state.turn_phase = TurnPhase.GAME_OVER
+        self.board_display.clear_highlights()
+        self.board_display.deselect_cell()
+
+        winner = players[message["winner"]] if message.get("winner") is not None else None
+        loser = players[1 - message["winner"]] if winner else None
+        if loser and message.get("reason") == "timeout":
+            messagebox.showinfo("Time's Up!", f"{loser.name}'s time has expired.\n{winner.name} wins!")
+        elif loser and message.get("reason") in ("resign", "disconnect"):
+            messagebox.showinfo("Game Over", f"{loser.name} has left the game.")
+        self.client.close()
+        self._handle_game_end(winner)
+
+    def destroy(self):
+        if self.poll_job_id is not None:
+            self.after_cancel(self.poll_job_id)
+            self.poll_job_id = None
+        self.client.close()
+        super().destroy()
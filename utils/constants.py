@@ -1,3 +1,4 @@
 MAXIMUM_TOWER_LEVEL = 3
 MINIMUM_TOWER_LEVEL = 0
-DEFAULT_BOARD_SIZE = 5
\ No newline at end of file
+DEFAULT_BOARD_SIZE = 5
+HIDDEN_CELL_TIME_BONUS = 10  # Seconds added when a hidden cell is revealed
@@ -4,3 +4,35 @@ class GameStatus(Enum):
     ONGOING = "ongoing"
     PLAYER_WON = "player_won"
     PLAYER_LOST = "player_lost"
+
+class TurnPhase(Enum):
+    """Enumeration for different phases of a turn."""
+    WORKER_SELECTION = "worker_selection"
+    MOVE_SELECTION = "move_selection"
+    MOVE_EXECUTION = "move_execution"
+    BUILD_SELECTION = "build_selection"
+    BUILD_EXECUTION = "build_execution"
+    TURN_END = "turn_end"
+    GAME_OVER = "game_over"
+
+class ActionType(Enum):
+    """Inputs accepted by the headless engine."""
+    SELECT_WORKER = "select_worker"
+    MOVE = "move"
+    BUILD = "build"
+    END_TURN = "end_turn"
+
+class EventType(Enum):
+    """Notable outcomes reported by the headless engine after an action."""
+    HIDDEN_CELL_REVEALED = "hidden_cell_revealed"
+    SECOND_MOVE = "second_move"
+    TRITON_EXTRA_MOVE = "triton_extra_move"
+    SECOND_BUILD = "second_build"
+    EXTRA_BUILD = "extra_build"
+    GAME_WON = "game_won"
+
+class ClockMode(Enum):
+    """Time controls supported by the game clock."""
+    SUDDEN_DEATH = "sudden_death"
+    FISCHER = "fischer"  # Fixed increment added after every turn
+    BRONSTEIN = "bronstein"  # Time used in a turn is given back, up to the increment
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, Iterator, Tuple
+
+# Same order as the nested row/col loops in Board.get_adjacent_cells
+NEIGHBOUR_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1),
+)
+
+
+def to_index(row: int, col: int, cols: int) -> int:
+    """Flat index of a cell, counting row by row from the top-left corner"""
+    return row * cols + col
+
+
+def to_row_col(index: int, cols: int) -> Tuple[int, int]:
+    """Inverse of to_index"""
+    return divmod(index, cols)
+
+
+@lru_cache(maxsize=None)
+def neighbour_indices(rows: int, cols: int) -> Tuple[Tuple[int, ...], ...]:
+    """For every flat cell index, the flat indices of the adjacent cells"""
+    table = []
+    for row in range(rows):
+        for col in range(cols):
+            neighbours = []
+            for row_offset, col_offset in NEIGHBOUR_OFFSETS:
+                adj_row, adj_col = row + row_offset, col + col_offset
+                if 0 <= adj_row < rows and 0 <= adj_col < cols:
+                    neighbours.append(to_index(adj_row, adj_col, cols))
+            table.append(tuple(neighbours))
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def neighbour_masks(rows: int, cols: int) -> Tuple[int, ...]:
+    """For every flat cell index, a bitmask of the adjacent cells"""
+    masks = []
+    for neighbours in neighbour_indices(rows, cols):
+        mask = 0
+        for index in neighbours:
+            mask |= 1 << index
+        masks.append(mask)
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def push_squares(rows: int, cols: int) -> Tuple[Dict[int, int], ...]:
+    """
+    For every flat cell index, a map from each adjacent index to the index one
+    step further in the same direction, where that is still on the board
+    """
+    table = []
+    for row in range(rows):
+        for col in range(cols):
+            beyond = {}
+            for row_offset, col_offset in NEIGHBOUR_OFFSETS:
+                push_row, push_col = row + 2 * row_offset, col + 2 * col_offset
+                if 0 <= push_row < rows and 0 <= push_col < cols:
+                    beyond[to_index(row + row_offset, col + col_offset, cols)] = to_index(push_row, push_col, cols)
+            table.append(beyond)
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def perimeter_mask(rows: int, cols: int) -> int:
+    """Bitmask of all cells that lie on an edge of the board"""
+    mask = 0
+    for row in range(rows):
+        for col in range(cols):
+            if row == 0 or row == rows - 1 or col == 0 or col == cols - 1:
+                mask |= 1 << to_index(row, col, cols)
+    return mask
+
+
+def full_mask(rows: int, cols: int) -> int:
+    """Bitmask with one bit set for every cell of the board"""
+    return (1 << (rows * cols)) - 1
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the index of every set bit, lowest first"""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit